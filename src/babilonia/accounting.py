@@ -43,7 +43,17 @@ Print a message
 # Native imports
 # =======================================================================
 import os
+import json
+import mmap
+import codecs
+import sqlite3
+import hashlib
+import functools
+import itertools
+import weakref
 import xml.etree.ElementTree as ET
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor
 
 # ... {develop}
 
@@ -83,6 +93,94 @@ TABELA_IRRF_2025 = [
 
 # CONSTANTS -- Module-level
 # =======================================================================
+
+# byte classes for the amount parser: digits are their own value
+_AMOUNT_COMMA = 10
+_AMOUNT_DOT = 11
+_AMOUNT_MINUS = 12
+_AMOUNT_PLUS = 13
+_AMOUNT_CREDIT = 14
+_AMOUNT_DEBIT = 15
+_AMOUNT_SPACE = 16
+_AMOUNT_PAD = 17
+_AMOUNT_OTHER = 18
+_AMOUNT_CLASSES = np.full(256, _AMOUNT_OTHER, dtype=np.uint8)
+_AMOUNT_CLASSES[ord("0") : ord("9") + 1] = np.arange(10)
+_AMOUNT_CLASSES[ord(",")] = _AMOUNT_COMMA
+_AMOUNT_CLASSES[ord(".")] = _AMOUNT_DOT
+_AMOUNT_CLASSES[ord("-")] = _AMOUNT_MINUS
+_AMOUNT_CLASSES[ord("+")] = _AMOUNT_PLUS
+_AMOUNT_CLASSES[ord("C")] = _AMOUNT_CREDIT
+_AMOUNT_CLASSES[ord("D")] = _AMOUNT_DEBIT
+_AMOUNT_CLASSES[ord(" ")] = _AMOUNT_SPACE
+_AMOUNT_CLASSES[0] = _AMOUNT_PAD
+# parsed date strings kept per format before the cache is reset
+DATE_CACHE_SIZE = 100_000
+# bytes inspected when sniffing the encoding of a statement file
+SNIFF_SIZE = 64 * 1024
+
+# BB CDB statements: product headers open an account block
+CDB_PRODUCT_PATTERN = re.compile(r"\bBB CDB(?: [A-ZÀ-Ý0-9]+)+")
+# short account names of known products (others get ``CDB`` + product words)
+CDB_ACCOUNT_NAMES = {
+    "BB CDB DI": "CDBDI",
+    "BB CDB PROGRESSIVO": "CDBPG",
+}
+# section title lines, in statement order (the first section has no title)
+CDB_SECTION_TITLES = {
+    "SALDO NOS ULTIMOS 6 MESES": "SALDOS",
+    "RESUMO DOS DEPOSITOS EM SER": "DEPOSITOS",
+    "RENDIMENTO BRUTO NO PERIODO POR DEPOSITO": "RENDIMENTOS",
+}
+
+# NFSe XML namespaces (national layout)
+NFSE_NAMESPACES = {
+    "default": "http://www.sped.fazenda.gov.br/nfse",
+    "ds": "http://www.w3.org/2000/09/xmldsig#",
+}
+# NFSe elements read by the extractor, as tag paths under ``infNFSe``
+NFSE_PATHS = (
+    "xLocEmi",
+    "xLocPrestacao",
+    "nNFSe",
+    "cLocIncid",
+    "xTribNac",
+    "dhProc",
+    "valores/vLiq",
+    "emit/CNPJ",
+    "emit/xNome",
+    "emit/enderNac/xLgr",
+    "emit/enderNac/nro",
+    "emit/enderNac/xBairro",
+    "emit/enderNac/cMun",
+    "emit/enderNac/UF",
+    "emit/enderNac/CEP",
+    "emit/fone",
+    "emit/email",
+    "DPS/infDPS/dCompet",
+    "DPS/infDPS/toma/CNPJ",
+    "DPS/infDPS/toma/NIF",
+    "DPS/infDPS/toma/xNome",
+    "DPS/infDPS/toma/end/xLgr",
+    "DPS/infDPS/toma/end/nro",
+    "DPS/infDPS/toma/end/xCpl",
+    "DPS/infDPS/toma/end/xBairro",
+    "DPS/infDPS/toma/end/endNac/cMun",
+    "DPS/infDPS/toma/end/endNac/CEP",
+    "DPS/infDPS/serv/cServ/cTribNac",
+    "DPS/infDPS/serv/cServ/xDescServ",
+    "DPS/infDPS/valores/vServPrest/vServ",
+    "DPS/infDPS/valores/trib/totTrib/pTotTribSN",
+)
+# NFSe extractor logic version -- bump to invalidate cached extractions
+NFSE_EXTRACTOR_VERSION = "1"
+# Clark notation lookups for ``NFSE_PATHS``: full paths and their prefixes
+_NFSE_ELEMENTS = {}
+_NFSE_PREFIXES = set()
+for _path in NFSE_PATHS:
+    _ls_tags = [f"{{{NFSE_NAMESPACES['default']}}}{t}" for t in _path.split("/")]
+    _NFSE_ELEMENTS["/".join(_ls_tags)] = _path
+    _NFSE_PREFIXES.update("/".join(_ls_tags[: i + 1]) for i in range(len(_ls_tags)))
 # ... {develop}
 
 
@@ -95,6 +193,324 @@ TABELA_IRRF_2025 = [
 
 # FUNCTIONS -- Module-level
 # =======================================================================
+
+
+def to_cents(values):
+    """
+    Convert monetary amounts to integer cents.
+
+    Amounts are rounded to the nearest cent, so float noise such as
+    ``0.1 + 0.2`` does not leak into the integer value.
+
+    :param values: amounts in currency units
+    :type values: float, :class:`numpy.ndarray` or :class:`pandas.Series`
+    :return: amounts in cents, as ``int64``
+    :rtype: int, :class:`numpy.ndarray` or :class:`pandas.Series`
+    """
+    if isinstance(values, pd.Series):
+        cents = np.rint(values.to_numpy(dtype=np.float64) * 100)
+        return pd.Series(cents.astype(np.int64), index=values.index, name=values.name)
+    cents = np.rint(np.asarray(values, dtype=np.float64) * 100).astype(np.int64)
+    if cents.ndim == 0:
+        return int(cents)
+    return cents
+
+
+def from_cents(values):
+    """
+    Convert integer cents to monetary amounts in currency units.
+
+    :param values: amounts in cents
+    :type values: int, :class:`numpy.ndarray` or :class:`pandas.Series`
+    :return: amounts in currency units, as ``float64``
+    :rtype: float, :class:`numpy.ndarray` or :class:`pandas.Series`
+    """
+    return values / 100
+
+
+def parse_amount_br(series, cents=False, decimal=None, unsigned=False):
+    """
+    Parse amount strings in Brazilian or plain decimal format.
+
+    All values are parsed in one vectorized pass over a byte matrix of
+    the strings. Handled formats:
+
+    .. list-table::
+       :widths: auto
+       :header-rows: 1
+
+       * - Input
+         - Output
+       * - ``5.000,00``
+         - ``5000.00``
+       * - ``-403,00``
+         - ``-403.00``
+       * - ``5.000,00 C``
+         - ``5000.00``
+       * - ``403,00 D``
+         - ``-403.00``
+       * - ``1234.56``
+         - ``1234.56``
+
+    When a value has a comma, the comma is the decimal separator and dots
+    are thousands separators. Otherwise the dot is the decimal separator,
+    unless ``decimal=","`` says dots are always thousands separators.
+    A trailing ``C`` (credit) or ``D`` (debit) sets the sign, overriding
+    any minus sign; with ``unsigned=True`` minus signs are ignored and only
+    ``D`` makes a value negative. Values outside these formats (such as
+    scientific notation) are parsed one by one with ``float``, which raises
+    ``ValueError`` on invalid text.
+
+    :param series: amount strings
+    :type series: :class:`pandas.Series`
+    :param cents: [optional] return int64 cents. Default value = ``False``
+    :type cents: bool
+    :param decimal: [optional] decimal separator of every value (``","``).
+        Default value = ``None`` (comma if present, else dot)
+    :type decimal: str
+    :param unsigned: [optional] take the sign only from the ``D`` marker.
+        Default value = ``False``
+    :type unsigned: bool
+    :return: amounts, with the index and name of ``series``
+    :rtype: :class:`pandas.Series`
+    """
+    chars = _get_char_matrix(series)
+    values = np.full(len(series), np.nan)
+    is_valid = np.zeros(len(series), dtype=bool)
+
+    if chars is not None and len(series) > 0:
+        # one character class per byte, one column per character position
+        classes = _AMOUNT_CLASSES[chars]
+        n = len(series)
+        if decimal == ",":
+            has_comma = np.ones(n, dtype=bool)
+        else:
+            has_comma = (classes == _AMOUNT_COMMA).any(axis=0)
+        decimal_class = np.where(has_comma, _AMOUNT_COMMA, _AMOUNT_DOT)
+
+        mantissa = np.zeros(n, dtype=np.int64)
+        n_digits = np.zeros(n, dtype=np.int64)
+        n_frac = np.zeros(n, dtype=np.int64)
+        n_decimal = np.zeros(n, dtype=np.int64)
+        is_bad = (classes == _AMOUNT_OTHER).any(axis=0)
+        seen_decimal = np.zeros(n, dtype=bool)
+        seen_num = np.zeros(n, dtype=bool)
+        seen_text = np.zeros(n, dtype=bool)
+        seen_sign = np.zeros(n, dtype=bool)
+        seen_marker = np.zeros(n, dtype=bool)
+        seen_gap = np.zeros(n, dtype=bool)
+        is_minus = np.zeros(n, dtype=bool)
+        is_debit = np.zeros(n, dtype=bool)
+
+        for k in classes:
+            is_digit = k < 10
+            is_num = k <= _AMOUNT_DOT
+            is_sign = (k == _AMOUNT_MINUS) | (k == _AMOUNT_PLUS)
+            is_marker = (k == _AMOUNT_CREDIT) | (k == _AMOUNT_DEBIT)
+            is_decimal = k == decimal_class
+
+            # digits -- Horner accumulation
+            mantissa = np.where(is_digit, mantissa * 10 + k, mantissa)
+            n_digits += is_digit
+            n_frac += is_digit & seen_decimal
+            n_decimal += is_decimal
+            seen_decimal |= is_decimal
+
+            # layout -- [sign] number [marker], blanks only around it
+            is_bad |= is_num & seen_gap
+            is_bad |= is_sign & (seen_num | seen_sign)
+            is_bad |= is_marker & (~seen_num | seen_marker)
+            is_bad |= (k == _AMOUNT_SPACE) & seen_text & ~seen_num
+            seen_gap |= seen_num & (k >= _AMOUNT_CREDIT)
+            seen_num |= is_num
+            seen_text |= k < _AMOUNT_SPACE
+            seen_sign |= is_sign
+            seen_marker |= is_marker
+            is_minus |= k == _AMOUNT_MINUS
+            is_debit |= k == _AMOUNT_DEBIT
+
+        is_valid = ~is_bad & (n_digits > 0) & (n_digits <= 15) & (n_decimal <= 1)
+        is_negative = np.where(seen_marker, is_debit, is_minus & (not unsigned))
+        sign = np.where(is_negative, -1.0, 1.0)
+        # exact integer over exact power of ten -- correctly rounded
+        values = sign * (mantissa / 10.0**n_frac)
+
+    # values outside the fast path
+    if not is_valid.all():
+        texts = series.to_numpy(dtype=object)
+        for i in np.flatnonzero(~is_valid):
+            values[i] = _parse_amount_br_text(texts[i], decimal, unsigned)
+
+    values = pd.Series(values, index=series.index, name=series.name)
+    if cents:
+        return to_cents(values)
+    return values
+
+
+def _get_char_matrix(series, max_width=24):
+    """
+    Get the strings of a series as a zero-padded ``uint8`` matrix.
+
+    The matrix has one row per character position and one column per
+    string. Strings longer than ``max_width`` are left blank for the
+    fallback path. Returns ``None`` when the strings cannot be laid out
+    as bytes.
+    """
+    array = series.array
+    if hasattr(array, "__arrow_array__"):
+        # arrow strings -- read the offsets and data buffers directly
+        arrow = array.__arrow_array__()
+        if hasattr(arrow, "combine_chunks"):
+            arrow = arrow.combine_chunks()
+        buffers = arrow.buffers()
+        dtype = np.int64 if "large" in str(arrow.type) else np.int32
+        offsets = np.frombuffer(buffers[1], dtype=dtype)
+        offsets = offsets[arrow.offset : arrow.offset + len(arrow) + 1]
+        data = np.frombuffer(buffers[2], dtype=np.uint8)
+        starts = offsets[:-1].astype(np.int64)
+        lengths = np.diff(offsets).astype(np.int64)
+        if arrow.null_count > 0:
+            lengths[np.asarray(arrow.is_null())] = 0
+    else:
+        # python strings -- one joined buffer split at line breaks
+        text = "\n".join(map(str, series.tolist()))
+        data = np.frombuffer(text.encode("ascii", errors="replace"), dtype=np.uint8)
+        breaks = np.flatnonzero(data == ord("\n"))
+        if len(breaks) != len(series) - 1:
+            return None
+        starts = np.concatenate([[0], breaks + 1])
+        lengths = np.concatenate([breaks, [len(data)]]) - starts
+
+    lengths = np.where(lengths > max_width, 0, lengths)
+    width = max(int(lengths.max(initial=0)), 1)
+    chars = np.zeros((width, len(series)), dtype=np.uint8)
+    # pad the buffer so every position of every row is in range
+    data = np.concatenate([data, np.zeros(width, dtype=np.uint8)])
+    for j in range(width):
+        np.take(data, starts + j, out=chars[j])
+        chars[j] *= j < lengths
+    return chars
+
+
+def _parse_amount_br_text(text, decimal=None, unsigned=False):
+    """
+    Parse one amount string with the rules of ``parse_amount_br``.
+    """
+    if not isinstance(text, str) and pd.isna(text):
+        return np.nan
+    s = str(text).strip()
+    sign = None
+    if s[-1:] in ["C", "D"]:
+        sign = -1.0 if s[-1] == "D" else 1.0
+        s = s[:-1].strip()
+    if "," in s or decimal == ",":
+        s = s.replace(".", "").replace(",", ".")
+    value = float(s)
+    if sign is not None:
+        value = sign * abs(value)
+    elif unsigned:
+        value = abs(value)
+    return value
+
+
+def parse_dates(series, fmt, suffix=""):
+    """
+    Parse date strings converting each distinct string only once.
+
+    Statements repeat a few hundred dates over many rows, so the strings
+    are factorized and only the unique values go through
+    ``pandas.to_datetime``. Parsed strings are also kept by the converter
+    of ``fmt`` and reused by later calls (e.g., across files in a batch).
+
+    :param series: date strings
+    :type series: :class:`pandas.Series`
+    :param fmt: datetime format of the (suffixed) strings, e.g. ``%d/%m/%Y``
+    :type fmt: str
+    :param suffix: [optional] text appended to each string before parsing,
+        e.g. ``/2025`` for ``DD/MM`` dates. Default value = ``""``
+    :type suffix: str
+    :return: dates, with the index and name of ``series``
+    :rtype: :class:`pandas.Series`
+    """
+    codes, uniques = pd.factorize(series)
+    texts = [f"{text}{suffix}" for text in uniques]
+    dates = _get_date_parser(fmt)(texts)
+    dates = dates.take(codes, allow_fill=True, fill_value=pd.NaT)
+    return pd.Series(dates, index=series.index, name=series.name)
+
+
+def sniff_encoding(file_data, size=SNIFF_SIZE, default="cp1252"):
+    """
+    Guess the text encoding of a file from a bounded prefix.
+
+    A byte order mark wins. Otherwise the prefix is tried as ``utf-8``
+    (only when it has non-ASCII bytes), then as ``default`` and finally
+    ``latin1``, which decodes any byte.
+
+    :param file_data: file path
+    :type file_data: str or Path
+    :param size: [optional] number of bytes to inspect. Default value = ``SNIFF_SIZE``
+    :type size: int
+    :param default: [optional] encoding for ASCII or legacy 8-bit text. Default value = ``cp1252``
+    :type default: str
+    :return: encoding name for ``open`` or ``pandas.read_csv``
+    :rtype: str
+    """
+    with open(file_data, "rb") as f:
+        prefix = f.read(size)
+    if prefix.startswith(codecs.BOM_UTF8):
+        return "utf-8-sig"
+    if prefix.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+        return "utf-16"
+    if not prefix.isascii():
+        try:
+            # incremental decode -- a character cut at the end is not an error
+            codecs.getincrementaldecoder("utf-8")().decode(prefix, final=False)
+            return "utf-8"
+        except UnicodeDecodeError:
+            pass
+    try:
+        prefix.decode(default)
+        return default
+    except UnicodeDecodeError:
+        return "latin1"
+
+
+@functools.lru_cache(maxsize=None)
+def _get_date_parser(fmt):
+    """
+    Get the memoized date converter of one datetime format.
+    """
+    dc_dates = {}
+
+    def parse(texts):
+        ls_new = [text for text in texts if text not in dc_dates]
+        if ls_new:
+            if len(dc_dates) + len(ls_new) > DATE_CACHE_SIZE:
+                dc_dates.clear()
+            dates = pd.to_datetime(
+                pd.Index(ls_new, dtype=object), format=fmt, errors="raise"
+            )
+            dc_dates.update(zip(ls_new, dates))
+        return pd.DatetimeIndex([dc_dates[text] for text in texts])
+
+    return parse
+
+
+def _read_nfse_file(file_data, cents=False):
+    """
+    Extract one NFSe XML file in a worker process.
+
+    Returns the extracted data and ``None``, or ``None`` and the error
+    message, so one bad file does not stop a batch.
+    """
+    try:
+        root = ET.parse(file_data).getroot()
+        return NFSe(cents=cents).extract_data(root), None
+    except Exception as e:
+        return None, f"{type(e).__name__}: {e}"
+
+
 # ... {develop}
 
 
@@ -106,10 +522,12 @@ TABELA_IRRF_2025 = [
 # =======================================================================
 class Budget(RecordTable):
 
-    def __init__(self, name="MyBudget", alias="Bud"):
+    def __init__(self, name="MyBudget", alias="Bud", cents=False):
         super().__init__(name=name, alias=alias)
 
         # ------------- specifics attributes ------------- #
+        # hold values as int64 cents
+        self.cents = cents
         self.total_revenue = None
         self.total_expenses = None
         self.total_net = None
@@ -237,6 +655,8 @@ class Budget(RecordTable):
         super().set_data(input_df=input_df)
         # convert to numeric
         self.data["Value"] = pd.to_numeric(self.data["Value"])
+        if self.cents:
+            self.data["Value"] = to_cents(self.data["Value"])
         # compute temporary field
 
         # sign and value_signed
@@ -343,28 +763,58 @@ class CashFlow(DataSet):
 
     """
 
-    def __init__(self, name="CashFlow", alias="CF"):
+    def __init__(self, name="CashFlow", alias="CF", cents=False):
         super().__init__(name=name, alias=alias)
+        # ------------- specifics attributes ------------- #
+        # hold ``Valor`` as int64 cents
+        self.cents = cents
 
-    def load_data(self, file_data):
+    def load_data(self, file_data, cents=False):
+        """
+        Load a ledger from file.
+
+        :param file_data: file path to ledger CSV, parquet or feather file
+        :type file_data: str
+        :param cents: [optional] file ``Valor`` holds integer cents. Default value = ``False``
+        :type cents: bool
+        :return: None
+        :rtype: None
+        """
         # overwrite relative path inputs
         # ----------------------------------------------
         self.file_data = os.path.abspath(file_data)
 
         # implement loading logic
         # ----------------------------------------------
-        df = pd.read_csv(
-            self.file_data,
-            sep=self.file_csv_sep,
-            encoding=self.file_encoding,
-            dtype=str,
-        )
+        ls_cols = ["Data", "Categoria", "Valor", "Descricao"]
+        suffix = os.path.splitext(self.file_data)[1].lower()
+        if suffix == ".parquet":
+            # typed columnar file -- read only the needed columns
+            df = pd.read_parquet(self.file_data, columns=ls_cols)
+        elif suffix == ".feather":
+            df = pd.read_feather(self.file_data, columns=ls_cols)
+        else:
+            df = pd.read_csv(
+                self.file_data,
+                sep=self.file_csv_sep,
+                encoding=self.file_encoding,
+                dtype=str,
+            )
 
-        df = df[["Data", "Categoria", "Valor", "Descricao"]].copy()
+        df = df[ls_cols].copy()
 
-        # make conversions
+        # make conversions (no-op on typed columnar files)
+        if suffix in [".parquet", ".feather"]:
+            # empty texts are missing values, as read from CSV files
+            for col in ["Categoria", "Descricao"]:
+                df[col] = df[col].replace("", np.nan)
         df["Data"] = pd.to_datetime(df["Data"])
-        df["Valor"] = df["Valor"].astype(float)
+        if cents:
+            df["Valor"] = from_cents(df["Valor"].astype(np.int64))
+        else:
+            df["Valor"] = df["Valor"].astype(float)
+        if self.cents:
+            df["Valor"] = to_cents(df["Valor"])
 
         # post-loading logic
         # ----------------------------------------------
@@ -387,8 +837,9 @@ class CashFlow(DataSet):
         behavior.
 
         :param df:
-            Input cash flow data containing at least the columns
-            ``Data``, ``Categoria`` and ``Valor``.
+            Input cash flow data containing at least the columns ``Data``
+            and ``Valor``. ``Categoria`` is needed only to filter by
+            ``category``.
         :type df: pandas.DataFrame
 
         :param category:
@@ -400,11 +851,161 @@ class CashFlow(DataSet):
             Dictionary with monthly and yearly cash flow summaries.
         :rtype: dict
         """
-        df = CashFlow.enrich_time_index(df)
-        df = CashFlow.classify_flows(df)
+        df = CashFlow.get_working_frame(df)
         df, category = CashFlow.filter_category(df, category)
 
         df_monthly = CashFlow.get_monthly_summary(df, category)
+        return CashFlow._finalize_analysis(df_monthly, category)
+
+    def get_cashflow_analysis_chunked(
+        self, file_data, category=None, chunksize=500_000
+    ):
+        """
+        Perform cash flow analysis streaming a ledger CSV file in chunks.
+
+        Each chunk is folded into partial aggregates (sums and counts per
+        month, flow and category, see ``get_partial_aggregates``) and
+        discarded, so memory is bounded by ``chunksize`` and by the number
+        of groups, not by the ledger size. Cumulative columns are computed
+        once all chunks are folded.
+
+        Sums are accumulated in integer cents, so they do not depend on
+        the chunking. The result is equal to ``get_cashflow_analysis`` on
+        the loaded ledger, exactly in cents mode and after its 2-decimal
+        rounding otherwise.
+
+        :param file_data: file path to ledger CSV
+        :type file_data: str
+        :param category: [optional] category filter. Default value = ``None``
+        :type category: str
+        :param chunksize: [optional] rows per chunk. Default value = ``500_000``
+        :type chunksize: int
+        :return: dictionary with monthly and yearly cash flow summaries
+        :rtype: dict
+        """
+        reader = pd.read_csv(
+            os.path.abspath(file_data),
+            sep=self.file_csv_sep,
+            encoding=self.file_encoding,
+            usecols=["Data", "Categoria", "Valor"],
+            dtype=str,
+            chunksize=chunksize,
+        )
+
+        df_agg = None
+        for chunk in reader:
+            chunk["Data"] = pd.to_datetime(chunk["Data"])
+            chunk["Valor"] = chunk["Valor"].astype(float)
+            df_part = CashFlow.get_partial_aggregates(chunk)
+            if df_agg is None:
+                df_agg = df_part
+            else:
+                # fold into the running aggregates
+                df_agg = (
+                    pd.concat([df_agg, df_part])
+                    .groupby(level=[0, 1, 2], dropna=False)
+                    .sum()
+                )
+
+        return CashFlow.get_analysis_from_aggregates(
+            df_agg, category=category, cents=self.cents
+        )
+
+    @staticmethod
+    def get_partial_aggregates(df, cents=False):
+        """
+        Get partial cash flow aggregates of a piece of a ledger.
+
+        Partial aggregates of disjoint pieces of a ledger can be combined
+        by summing them over their index.
+
+        :param df:
+            Cash flow data containing ``Data``, ``Categoria`` and ``Valor``.
+        :type df: pandas.DataFrame
+
+        :param cents:
+            ``Valor`` already holds integer cents.
+        :type cents: bool
+
+        :returns:
+            Table indexed by month code (``Mes``), inflow flag (``Flow``)
+            and ``Categoria``, with ``Valor`` sums in integer cents
+            (``sum``) and transaction counts (``count``).
+        :rtype: pandas.DataFrame
+        """
+        df = df[df["Valor"].notna()]
+        if cents:
+            values = df["Valor"].astype(np.int64)
+        else:
+            values = to_cents(df["Valor"])
+        keys = [
+            pd.Series(CashFlow.get_month_codes(df), index=df.index, name="Mes"),
+            (values >= 0).rename("Flow"),
+            df["Categoria"],
+        ]
+        return values.groupby(keys, dropna=False).agg(["sum", "count"])
+
+    @staticmethod
+    def get_analysis_from_aggregates(df_agg, category=None, cents=False):
+        """
+        Perform cash flow analysis from partial aggregates.
+
+        :param df_agg:
+            Combined partial aggregates, as in ``get_partial_aggregates``.
+        :type df_agg: pandas.DataFrame
+
+        :param category:
+            Optional category filter. If ``None``, all categories are grouped
+            under ``"Geral"``.
+        :type category: str or None
+
+        :param cents:
+            If ``True``, amounts in the summaries are int64 cents.
+        :type cents: bool
+
+        :returns:
+            Dictionary with monthly and yearly cash flow summaries.
+        :rtype: dict
+        """
+        if category is None:
+            df_agg = df_agg.groupby(level=[0, 1]).sum()
+            category = "Geral"
+        else:
+            is_category = df_agg.index.get_level_values(2) == category
+            df_agg = df_agg[is_category].droplevel(2)
+        if len(df_agg) == 0:
+            raise ValueError(f"No cash flow data for category: {category}")
+
+        codes = df_agg.index.get_level_values(0).to_numpy(dtype=np.int64)
+        is_in = df_agg.index.get_level_values(1).to_numpy(dtype=bool)
+        first_year = int(codes.min()) // 12
+        n_years = int(codes.max()) // 12 - first_year + 1
+
+        n = n_years * 12
+        sums = np.zeros(2 * n, dtype=np.int64)
+        counts = np.zeros(2 * n, dtype=np.int64)
+        positions = (codes - first_year * 12) * 2 + is_in
+        sums[positions] = df_agg["sum"].to_numpy()
+        counts[positions] = df_agg["count"].to_numpy()
+        if not cents:
+            sums = from_cents(sums)
+
+        df_monthly = CashFlow._build_monthly_summary(
+            first_year=first_year,
+            n_years=n_years,
+            category=category,
+            entradas=sums[1::2],
+            entradas_n=counts[1::2],
+            saidas=sums[0::2],
+            saidas_n=counts[0::2],
+        )
+        return CashFlow._finalize_analysis(df_monthly, category)
+
+    @staticmethod
+    def _finalize_analysis(df_monthly, category):
+        """
+        Add ratios and the yearly summary to a monthly summary table.
+        """
         df_monthly = CashFlow.compute_oir(df_monthly)
 
         df_yearly = CashFlow.get_yearly_summary(df_monthly, category)
@@ -422,7 +1023,34 @@ class CashFlow(DataSet):
         return df
 
     @staticmethod
-    def enrich_time_index(df):
+    def get_working_frame(df):
+        """
+        Build the compact frame used internally by the analysis path.
+
+        Only ``Data``, ``Categoria`` (if present) and ``Valor`` are kept.
+        ``Categoria`` is categorical, ``Mes`` holds integer month codes and
+        ``Flow`` is boolean, so no per-row strings are built. String labels
+        are only materialized in the summary tables.
+
+        :param df:
+            Cash flow data containing ``Data`` and ``Valor``, and optionally
+            ``Categoria``.
+        :type df: pandas.DataFrame
+
+        :returns:
+            Compact copy of the input data with ``Ano``, ``Mes`` and ``Flow``.
+        :rtype: pandas.DataFrame
+        """
+        ls_cols = [col for col in ["Data", "Categoria", "Valor"] if col in df.columns]
+        df = df[ls_cols].copy()
+        if "Categoria" in df.columns:
+            df["Categoria"] = df["Categoria"].astype("category")
+        df = CashFlow.enrich_time_index(df, codes=True)
+        df = CashFlow.classify_flows(df, codes=True)
+        return df
+
+    @staticmethod
+    def enrich_time_index(df, codes=False):
         """
         Add year and year-month time indices to the cash flow data.
 
@@ -433,17 +1061,25 @@ class CashFlow(DataSet):
             Input cash flow data.
         :type df: pandas.DataFrame
 
+        :param codes:
+            If ``True``, ``Mes`` holds integer month codes (see
+            ``get_month_codes``) instead of ``YYYY-MM`` strings.
+        :type codes: bool
+
         :returns:
             Copy of the input data with additional ``Ano`` and ``Mes`` columns.
         :rtype: pandas.DataFrame
         """
         df = df.copy()
         df["Ano"] = df["Data"].dt.year
-        df["Mes"] = df["Data"].dt.strftime("%Y-%m")
+        if codes:
+            df["Mes"] = CashFlow.get_month_codes(df)
+        else:
+            df["Mes"] = df["Data"].dt.strftime("%Y-%m")
         return df
 
     @staticmethod
-    def classify_flows(df):
+    def classify_flows(df, codes=False):
         """
         Classify cash flows as inputs or outputs.
 
@@ -454,12 +1090,20 @@ class CashFlow(DataSet):
             Cash flow data containing a ``Valor`` column.
         :type df: pandas.DataFrame
 
+        :param codes:
+            If ``True``, ``Flow`` is boolean (``True`` for inputs) instead
+            of ``"In"``/``"Out"`` strings.
+        :type codes: bool
+
         :returns:
             Copy of the input data with an additional ``Flow`` column.
         :rtype: pandas.DataFrame
         """
         df = df.copy()
-        df["Flow"] = np.where(df["Valor"] >= 0, "In", "Out")
+        if codes:
+            df["Flow"] = (df["Valor"] >= 0).to_numpy()
+        else:
+            df["Flow"] = np.where(df["Valor"] >= 0, "In", "Out")
         return df
 
     @staticmethod
@@ -488,7 +1132,28 @@ class CashFlow(DataSet):
         return df.query("Categoria == @category").copy(), category
 
     @staticmethod
-    def get_monthly_summary(df, category):
+    def get_month_codes(df):
+        """
+        Get integer year-month codes from the ``Data`` column.
+
+        The code of a month is ``year * 12 + (month - 1)``, so consecutive
+        calendar months have consecutive codes across year boundaries.
+
+        :param df:
+            Cash flow data containing a datetime ``Data`` column.
+        :type df: pandas.DataFrame
+
+        :returns:
+            Array of month codes, one per row.
+        :rtype: numpy.ndarray
+        """
+        dates = df["Data"].dt
+        years = dates.year.to_numpy(dtype=np.int64)
+        months = dates.month.to_numpy(dtype=np.int64)
+        return years * 12 + (months - 1)
+
+    @staticmethod
+    def get_monthly_summary(df, category, engine="vectorized"):
         """
         Compute monthly cash flow summaries for each year.
 
@@ -497,17 +1162,119 @@ class CashFlow(DataSet):
         cumulative balances.
 
         :param df:
-            Cash flow data enriched with time indices and flow classification.
+            Cash flow data enriched with time indices and flow classification,
+            either as strings or as codes (see ``get_working_frame``).
         :type df: pandas.DataFrame
 
         :param category:
             Category name associated with the analysis.
         :type category: str
 
+        :param engine:
+            Aggregation engine. ``"vectorized"`` computes all years at once
+            from integer year-month codes in a single grouped pass.
+            ``"loop"`` runs the year-by-year query/merge reference
+            implementation. Both produce the same table.
+            Integer ``Valor`` (cents) yields exact integer sums.
+        :type engine: str
+
         :returns:
             Monthly cash flow summary table.
         :rtype: pandas.DataFrame
         """
+        is_coded = pd.api.types.is_bool_dtype(df["Flow"])
+        if engine == "loop":
+            if is_coded:
+                # the reference engine works on the string layout
+                df = CashFlow.classify_flows(CashFlow.enrich_time_index(df))
+            return CashFlow._get_monthly_summary_loop(df, category)
+        if engine != "vectorized":
+            raise ValueError(f"Unknown monthly summary engine: {engine}")
+
+        first_year = int(df["Ano"].min())
+        n_years = int(df["Ano"].max()) - first_year + 1
+
+        # one grouped pass keyed on (month, flow): even keys are outflows
+        # and odd keys are inflows, offset to the first calendar month
+        if pd.api.types.is_integer_dtype(df["Mes"]):
+            codes = df["Mes"].to_numpy(dtype=np.int64) - first_year * 12
+        else:
+            codes = CashFlow.get_month_codes(df) - first_year * 12
+        flow = df["Flow"].to_numpy()
+        if is_coded:
+            is_in = flow
+            is_out = ~flow
+        else:
+            is_in = flow == "In"
+            is_out = flow == "Out"
+        keys = codes * 2 + is_in
+        valid = is_in | is_out
+
+        valor = df["Valor"]
+        if not valid.all():
+            valor = valor[valid]
+            keys = keys[valid]
+
+        agg = valor.groupby(keys).agg(["sum", "count"])
+
+        n = n_years * 12
+        sums = np.zeros(2 * n, dtype=agg["sum"].dtype)
+        counts = np.zeros(2 * n, dtype=np.int64)
+        positions = agg.index.to_numpy()
+        sums[positions] = agg["sum"].to_numpy()
+        counts[positions] = agg["count"].to_numpy()
+
+        return CashFlow._build_monthly_summary(
+            first_year=first_year,
+            n_years=n_years,
+            category=category,
+            entradas=sums[1::2],
+            entradas_n=counts[1::2],
+            saidas=sums[0::2],
+            saidas_n=counts[0::2],
+        )
+
+    @staticmethod
+    def _build_monthly_summary(
+        first_year, n_years, category, entradas, entradas_n, saidas, saidas_n
+    ):
+        """
+        Assemble the monthly summary table from per-month aggregate arrays.
+
+        Arrays hold one value per calendar month, starting in January of
+        ``first_year``. Cumulative columns restart every year.
+        """
+        years = np.arange(first_year, first_year + n_years)
+        months = np.tile(np.arange(1, 13), n_years)
+        ano = np.repeat(years.astype(str), 12)
+        mes = [f"{a}-{m:02d}" for a, m in zip(ano, months)]
+
+        fluxo = entradas + saidas
+
+        def _cumsum_by_year(values):
+            return np.cumsum(values.reshape(n_years, 12), axis=1).ravel()
+
+        return pd.DataFrame(
+            {
+                "Ano": ano,
+                "Mes": mes,
+                "Categoria": category,
+                "Entradas": entradas,
+                "Entradas_N": entradas_n,
+                "Saidas": saidas,
+                "Saidas_N": saidas_n,
+                "Fluxo": fluxo,
+                "Entradas_Acum": _cumsum_by_year(entradas),
+                "Saidas_Acum": _cumsum_by_year(saidas),
+                "Fluxo_Acum": _cumsum_by_year(fluxo),
+            }
+        )
+
+    @staticmethod
+    def _get_monthly_summary_loop(df, category):
+        """
+        Reference year-by-year implementation of ``get_monthly_summary``.
+        """
         years = range(df["Ano"].min(), df["Ano"].max() + 1)
         monthly_frames = []
 
@@ -545,6 +1312,10 @@ class CashFlow(DataSet):
             for col in ["Entradas_N", "Saidas_N"]:
                 df_year[col] = df_year[col].astype(int)
 
+            # keep the ledger dtype through the merge gaps
+            for col in ["Entradas", "Saidas"]:
+                df_year[col] = df_year[col].astype(df["Valor"].dtype)
+
             # Net flow
             df_year["Fluxo"] = df_year["Entradas"] + df_year["Saidas"]
 
@@ -610,7 +1381,7 @@ class CashFlow(DataSet):
         ]
 
     @staticmethod
-    def get_cashflow_report(df, year=None, initial_cash=None):
+    def get_cashflow_report(df, year=None, initial_cash=None, engine="pivot"):
         """
         Build a yearly cash flow panel and summary by category.
 
@@ -627,10 +1398,18 @@ class CashFlow(DataSet):
         :type year: int, optional
 
         :param initial_cash:
-            Initial account balance at the beginning of the selected year.
-            If ``None``, defaults to ``0.0``.
+            Initial account balance at the beginning of the selected year,
+            in the same unit as ``Valor`` (cents for int64 ledgers).
+            If ``None``, defaults to ``0``.
         :type initial_cash: float, optional
 
+        :param engine:
+            Report engine. ``"pivot"`` builds the whole per-category panel
+            from one grouped aggregation over month, flow and category.
+            ``"loop"`` runs one ``get_cashflow_analysis`` call and one merge
+            per category.
+        :type engine: str
+
         :return:
             Dictionary containing: ``"Pannel"``: monthly cash flow panel with totals, per-category
             flows, and running balance. ``"Summary"``: yearly summary by category with total, mean, and
@@ -647,8 +1426,166 @@ class CashFlow(DataSet):
             year = datetime.now().year
 
         if initial_cash is None:
-            initial_cash = 0.0
+            initial_cash = 0
+
+        if engine == "loop":
+            return CashFlow._get_cashflow_report_loop(df, year, initial_cash)
+        if engine != "pivot":
+            raise ValueError(f"Unknown cash flow report engine: {engine}")
+
+        # ------------------------------------------------------------------
+        # Prepare and filter data
+        # ------------------------------------------------------------------
+        df = df[df["Data"].dt.year == int(year)]
+        df = CashFlow.classify_flows(df, codes=True)
+
+        months = df["Data"].dt.month.to_numpy(dtype=np.int64) - 1
+        is_in = df["Flow"].to_numpy()
+        valor = df["Valor"]
+
+        # ------------------------------------------------------------------
+        # Base monthly panel (all categories aggregated)
+        # ------------------------------------------------------------------
+        agg = valor.groupby(months * 2 + is_in).sum()
+        sums = np.zeros(24, dtype=valor.dtype)
+        sums[agg.index.to_numpy()] = agg.to_numpy()
+
+        entradas = sums[1::2]
+        saidas = sums[0::2]
+        df_cfa = pd.DataFrame(
+            {
+                "Ano": str(year),
+                "Mes": [f"{year}-{m:02d}" for m in range(1, 13)],
+                "Fluxo": entradas + saidas,
+                "Entradas": entradas,
+                "Saidas": saidas,
+            }
+        ).round(decimals=2)
+
+        # ------------------------------------------------------------------
+        # Per-category panel from one (Mes, Flow, Categoria) aggregation
+        # ------------------------------------------------------------------
+        has_category = "Categoria" in df.columns and df["Categoria"].notna().any()
+
+        if has_category:
+            cat_codes, cat_uniques = pd.factorize(df["Categoria"])
+            ls_categories_inp = pd.unique(cat_codes[is_in & (cat_codes >= 0)])
+            ls_categories_out = pd.unique(cat_codes[~is_in & (cat_codes >= 0)])
+
+            keys = (cat_codes * 12 + months) * 2 + is_in
+            agg = valor[cat_codes >= 0].groupby(keys[cat_codes >= 0]).sum()
+            sums = np.zeros(len(cat_uniques) * 24, dtype=valor.dtype)
+            sums[agg.index.to_numpy()] = agg.to_numpy()
+            sums = sums.reshape(len(cat_uniques), 12, 2)
+
+            ls_labels_inp, ls_labels_out = CashFlow.get_category_labels(
+                cat_uniques[ls_categories_inp], cat_uniques[ls_categories_out]
+            )
+            df_cat_inp = pd.DataFrame(
+                sums[ls_categories_inp, :, 1].T,
+                columns=ls_labels_inp,
+            ).round(decimals=2)
+            df_cat_out = pd.DataFrame(
+                sums[ls_categories_out, :, 0].T,
+                columns=ls_labels_out,
+            ).round(decimals=2)
+            df_cfa = pd.concat([df_cfa, df_cat_inp, df_cat_out], axis=1)
+        else:
+            df_cat_inp = pd.DataFrame()
+            df_cat_out = pd.DataFrame()
+
+        # ------------------------------------------------------------------
+        # Compute running balance
+        # ------------------------------------------------------------------
+        df_cfa["Saldo"] = initial_cash + df_cfa["Fluxo"].cumsum()
 
+        # ------------------------------------------------------------------
+        # Build yearly summary by category
+        # ------------------------------------------------------------------
+        total_entradas = df_cfa["Entradas"].sum()
+        total_saidas = df_cfa["Saidas"].sum()
+
+        rows_summary = [
+            {
+                "Ano": year,
+                "Categoria": "ENTRADAS",
+                "Total": total_entradas,
+                "Media": df_cfa["Entradas"].mean(),
+                "% Entradas": 100.0,
+            },
+            {
+                "Ano": year,
+                "Categoria": "SAIDAS",
+                "Total": total_saidas,
+                "Media": df_cfa["Saidas"].mean(),
+                "% Entradas": (
+                    abs(total_saidas) / total_entradas * 100
+                    if total_entradas != 0
+                    else 0.0
+                ),
+            },
+        ]
+
+        for df_cat in [df_cat_inp, df_cat_out]:
+            totals = df_cat.sum().to_numpy()
+            averages = df_cat.mean().to_numpy()
+            if total_entradas != 0:
+                pct_entradas = np.abs(totals) / total_entradas * 100
+            else:
+                pct_entradas = np.zeros(len(totals))
+
+            for i, cat in enumerate(df_cat.columns):
+                rows_summary.append(
+                    {
+                        "Ano": year,
+                        "Categoria": cat,
+                        "Total": totals[i],
+                        "Media": averages[i],
+                        "% Entradas": pct_entradas[i],
+                    }
+                )
+
+        df_summary = pd.DataFrame(rows_summary).round(2)
+
+        # ------------------------------------------------------------------
+        # Output
+        # ------------------------------------------------------------------
+        return {
+            "Pannel": df_cfa,
+            "Summary": df_summary,
+        }
+
+    @staticmethod
+    def get_category_labels(categories_inp, categories_out):
+        """
+        Get unique report column labels for inflow and outflow categories.
+
+        Categories that flow in both directions are labelled with their
+        flow (e.g., ``"Pix (Entradas)"`` and ``"Pix (Saidas)"``), so the
+        panel never holds duplicate columns. Other categories keep their
+        names.
+
+        :param categories_inp: categories with inflows
+        :type categories_inp: list
+        :param categories_out: categories with outflows
+        :type categories_out: list
+        :return: inflow and outflow labels, in the order of the categories
+        :rtype: tuple
+        """
+        both = set(categories_inp) & set(categories_out)
+        ls_labels_inp = [
+            f"{cat} (Entradas)" if cat in both else cat for cat in categories_inp
+        ]
+        ls_labels_out = [
+            f"{cat} (Saidas)" if cat in both else cat for cat in categories_out
+        ]
+        return ls_labels_inp, ls_labels_out
+
+    @staticmethod
+    def _get_cashflow_report_loop(df, year, initial_cash):
+        """
+        Reference per-category implementation of ``get_cashflow_report``.
+        """
         # ------------------------------------------------------------------
         # Prepare and filter data
         # ------------------------------------------------------------------
@@ -672,6 +1609,10 @@ class CashFlow(DataSet):
             ls_categories_inp = []
             ls_categories_out = []
 
+        ls_labels_inp, ls_labels_out = CashFlow.get_category_labels(
+            ls_categories_inp, ls_categories_out
+        )
+
         # ------------------------------------------------------------------
         # Base monthly panel (all categories aggregated)
         # ------------------------------------------------------------------
@@ -681,20 +1622,20 @@ class CashFlow(DataSet):
         # ------------------------------------------------------------------
         # Add inflow categories (monthly)
         # ------------------------------------------------------------------
-        for cat in ls_categories_inp:
+        for cat, label in zip(ls_categories_inp, ls_labels_inp):
             dc_cat = CashFlow.get_cashflow_analysis(df, category=cat)
             df_cat = dc_cat["monthly"][["Mes", "Entradas"]].copy()
-            df_cat.rename(columns={"Entradas": cat}, inplace=True)
+            df_cat.rename(columns={"Entradas": label}, inplace=True)
 
             df_cfa = pd.merge(df_cfa, df_cat, how="left", on="Mes")
 
         # ------------------------------------------------------------------
         # Add outflow categories (monthly)
         # ------------------------------------------------------------------
-        for cat in ls_categories_out:
+        for cat, label in zip(ls_categories_out, ls_labels_out):
             dc_cat = CashFlow.get_cashflow_analysis(df, category=cat)
             df_cat = dc_cat["monthly"][["Mes", "Saidas"]].copy()
-            df_cat.rename(columns={"Saidas": cat}, inplace=True)
+            df_cat.rename(columns={"Saidas": label}, inplace=True)
 
             df_cfa = pd.merge(df_cfa, df_cat, how="left", on="Mes")
 
@@ -734,9 +1675,7 @@ class CashFlow(DataSet):
             },
         ]
 
-        ls_categories = list(ls_categories_inp) + list(ls_categories_out)
-
-        ls_categories = list(ls_categories_inp) + list(ls_categories_out)
+        ls_categories = ls_labels_inp + ls_labels_out
 
         if ls_categories:
             totals = df_cfa[ls_categories].sum()
@@ -770,29 +1709,618 @@ class CashFlow(DataSet):
     @staticmethod
     def format_currency(
         x: float,
+        cents: bool = False,
+        decimal: str = ".",
+        thousands: str = ",",
     ):
-        # todo docstring
-
+        """
+        Format an amount as a right-aligned ``value sign`` string.
+
+        :param x: amount
+        :type x: float
+        :param cents: [optional] amount is in int64 cents. Default value = ``False``
+        :type cents: bool
+        :param decimal: [optional] decimal separator. Default value = ``"."``
+        :type decimal: str
+        :param thousands: [optional] thousands separator. Default value = ``","``
+        :type thousands: str
+        :return: formatted amount, such as ``"   1,234.56 -"``
+        :rtype: str
+        """
         value = float(x)
+        if cents:
+            value = from_cents(value)
         sign = "+"
         if value < 0:
             sign = "-"
 
-        return f"{abs(value):>11,.2f} {sign}"  # suffix + f" {value:+,.2f}"
+        body = f"{abs(value):,.2f}"
+        if decimal != "." or thousands != ",":
+            body = body.translate(str.maketrans({",": thousands, ".": decimal}))
+
+        return f"{body:>11} {sign}"  # suffix + f" {value:+,.2f}"
 
     @staticmethod
-    def format_currency_columns(df: pd.DataFrame, columns: list[str]) -> pd.DataFrame:
+    def format_currency_array(values, cents=False, decimal=".", thousands=","):
         """
-        Return a copy of df with selected numeric columns formatted as strings.
+        Vectorized ``format_currency`` over an array of amounts.
+
+        Amounts are rounded to integer cents and the thousands groups are
+        assembled on a character matrix, with no per-value Python call.
+        Values whose rounding is ambiguous in binary (exact half cents),
+        non-finite values and huge values fall back to ``format_currency``,
+        so the output is identical to the scalar formatter.
+
+        :param values: amounts
+        :type values: :class:`numpy.ndarray` or :class:`pandas.Series`
+        :param cents: [optional] amounts are in int64 cents. Default value = ``False``
+        :type cents: bool
+        :param decimal: [optional] decimal separator. Default value = ``"."``
+        :type decimal: str
+        :param thousands: [optional] thousands separator. Default value = ``","``
+        :type thousands: str
+        :return: formatted amounts, as an ``object`` array of ``str``
+        :rtype: :class:`numpy.ndarray`
         """
-        out = df.copy()
+        x = np.asarray(values, dtype=np.float64)
+        if cents:
+            x = from_cents(x)
+
+        out = np.empty(len(x), dtype=object)
+        if len(x) == 0 or len(decimal) != 1 or len(thousands) != 1:
+            # multi-character separators need the scalar formatter
+            for i, value in enumerate(x):
+                out[i] = CashFlow.format_currency(value, False, decimal, thousands)
+            return out
+
+        # round to cents -- keep only values with an unambiguous rounding
+        scaled = np.abs(x) * 100
+        is_fast = np.isfinite(scaled) & (scaled < 2**52)
+        scaled = np.where(is_fast, scaled, 0.0)
+        frac = scaled - np.floor(scaled)
+        is_fast &= np.abs(frac - 0.5) > 2 * np.spacing(scaled)
+        amounts = np.rint(scaled).astype(np.int64)
+
+        # right-justified matrix of character codes, one row per value
+        units = amounts // 100
+        n_digits = len(str(int(units.max())))
+        n_seps = (n_digits - 1) // 3
+        width = n_digits + n_seps + 5
+        chars = np.full((len(x), width), ord(" "), dtype=np.uint32)
+        col = n_digits + n_seps - 1
+        for j in range(n_digits):
+            if j > 0 and j % 3 == 0:
+                # separator only where a digit lies to its left
+                chars[units >= 10**j, col] = ord(thousands)
+                col -= 1
+            is_digit = units >= 10**j if j > 0 else slice(None)
+            chars[is_digit, col] = ord("0") + (units[is_digit] // 10**j) % 10
+            col -= 1
+        decimals = amounts % 100
+        chars[:, -5] = ord(decimal)
+        chars[:, -4] = ord("0") + decimals // 10
+        chars[:, -3] = ord("0") + decimals % 10
+        chars[:, -1] = np.where(x < 0, ord("-"), ord("+"))
+        formatted = chars.view(f"U{chars.shape[1]}").ravel()
+        out[:] = np.char.rjust(np.char.lstrip(formatted), 13)
+
+        for i in np.flatnonzero(~is_fast):
+            out[i] = CashFlow.format_currency(x[i], False, decimal, thousands)
+        return out
+
+    @staticmethod
+    def format_currency_columns(
+        df: pd.DataFrame,
+        columns: list[str],
+        cents: bool = False,
+        decimal: str = ".",
+        thousands: str = ",",
+    ) -> pd.DataFrame:
+        """
+        Return a copy of df with selected numeric columns formatted as strings.
+
+        Set ``cents=True`` when the columns hold int64 cents. Use
+        ``decimal=","`` and ``thousands="."`` for pt-BR separators.
+        """
+        out = df.copy()
 
         for col in columns:
-            out[col] = out[col].map(CashFlow.format_currency)
+            out[col] = CashFlow.format_currency_array(
+                out[col].to_numpy(),
+                cents=cents,
+                decimal=decimal,
+                thousands=thousands,
+            )
 
         return out
 
 
+class CashFlowIncremental(CashFlow):
+    """
+    Cash flow analysis with incremental monthly and yearly aggregates.
+
+    The object keeps the monthly and yearly aggregates of its ledger as
+    state. Appending a batch of transactions recomputes only the months
+    touched by the batch and re-propagates the ``*_Acum`` columns from the
+    earliest touched month (monthly) and year (yearly). The analysis is
+    identical to running ``CashFlow.get_cashflow_analysis`` on the full
+    ledger.
+
+    .. dropdown:: Incremental Analysis Example
+        :icon: code-square
+        :open:
+
+        .. code-block:: python
+
+            from babilonia.accounting import CashFlowIncremental
+
+            # create the object for a category (None for all categories)
+            cf = CashFlowIncremental(category=None)
+
+            # load the existing ledger
+            cf.load_data("path/to/ledger.csv") # [change this]
+
+            # absorb new transactions
+            cf.append_data(df_new)
+
+            # get analysis
+            dc = cf.get_analysis()
+            print(dc["monthly"])
+            print(dc["yearly"])
+
+    """
+
+    # aggregate columns held as state
+    COLUMNS_AGG = [
+        "Entradas",
+        "Entradas_N",
+        "Saidas",
+        "Saidas_N",
+        "Fluxo",
+        "Entradas_Acum",
+        "Saidas_Acum",
+        "Fluxo_Acum",
+    ]
+
+    def __init__(
+        self, name="CashFlowIncremental", alias="CFI", category=None, cents=False
+    ):
+        super().__init__(name=name, alias=alias, cents=cents)
+        # ------------- specifics attributes ------------- #
+        self.category = category
+        self.first_year = None
+        self.n_years = 0
+        self.state_monthly = None
+        self.state_yearly = None
+        # month code and flow of each ledger row
+        self._codes = None
+        self._is_in = None
+
+    def load_data(self, file_data, cents=False):
+        """
+        Load a ledger from file and build its aggregates.
+
+        :param file_data: file path to ledger CSV, parquet or feather file
+        :type file_data: str
+        :param cents: [optional] file ``Valor`` holds integer cents. Default value = ``False``
+        :type cents: bool
+        :return: None
+        :rtype: None
+        """
+        super().load_data(file_data=file_data, cents=cents)
+        self.set_data(self.data)
+        return None
+
+    def set_data(self, df):
+        """
+        Set the ledger and build its aggregates from scratch.
+
+        :param df: cash flow data with ``Data``, ``Categoria`` and ``Valor``
+        :type df: :class:`pandas.DataFrame`
+        :return: None
+        :rtype: None
+        """
+        df = self._as_ledger_values(df)
+        self.data = df.iloc[:0].copy()
+        self.first_year = None
+        self.n_years = 0
+        self.state_monthly = None
+        self.state_yearly = None
+        self._codes = np.zeros(0, dtype=np.int64)
+        self._is_in = np.zeros(0, dtype=bool)
+        self.append_data(df)
+        return None
+
+    def _as_ledger_values(self, df):
+        """
+        Convert ``Valor`` in reais (float) to integer cents in cents mode.
+
+        Integer ``Valor`` is taken as cents, the layout of ``data``.
+        """
+        if self.cents and not pd.api.types.is_integer_dtype(df["Valor"]):
+            df = df.assign(Valor=to_cents(df["Valor"]))
+        return df
+
+    def append_data(self, df_new):
+        """
+        Append new transactions and update the affected aggregates.
+
+        In cents mode, ``Valor`` in reais (float) is converted to integer
+        cents.
+
+        :param df_new: new cash flow rows, in the same layout as the ledger
+        :type df_new: :class:`pandas.DataFrame`
+        :return: None
+        :rtype: None
+        """
+        if self.data is None:
+            return self.set_data(df_new)
+
+        df_new = self._as_ledger_values(df_new)
+
+        if self.category is not None:
+            df_new = df_new[df_new["Categoria"] == self.category]
+        if len(df_new) == 0:
+            return None
+
+        codes_new = CashFlow.get_month_codes(df_new)
+        self.data = pd.concat([self.data, df_new], ignore_index=True)
+        self._codes = np.concatenate([self._codes, codes_new])
+        self._is_in = np.concatenate([self._is_in, df_new["Valor"].to_numpy() >= 0])
+
+        # extend the calendar to cover the new rows
+        # ----------------------------------------------
+        first_dirty_year = self._extend_years(
+            first_year=int(codes_new.min()) // 12,
+            last_year=int(codes_new.max()) // 12,
+        )
+
+        # recompute touched months from their ledger rows
+        # ----------------------------------------------
+        touched = np.unique(codes_new)
+        mask = np.isin(self._codes, touched)
+        offset = self.first_year * 12
+        keys = (self._codes[mask] - offset) * 2 + self._is_in[mask]
+        agg = self.data["Valor"][mask].groupby(keys).agg(["sum", "count"])
+
+        pos = touched - offset
+        dc = self.state_monthly
+        for col in ["Entradas", "Entradas_N", "Saidas", "Saidas_N"]:
+            dc[col][pos] = 0
+
+        keys = agg.index.to_numpy()
+        is_in = keys % 2 == 1
+        dc["Entradas"][keys[is_in] // 2] = agg["sum"].to_numpy()[is_in]
+        dc["Entradas_N"][keys[is_in] // 2] = agg["count"].to_numpy()[is_in]
+        dc["Saidas"][keys[~is_in] // 2] = agg["sum"].to_numpy()[~is_in]
+        dc["Saidas_N"][keys[~is_in] // 2] = agg["count"].to_numpy()[~is_in]
+        dc["Fluxo"][pos] = dc["Entradas"][pos] + dc["Saidas"][pos]
+
+        # re-propagate monthly cumulative columns within each touched year
+        # ----------------------------------------------
+        touched_years = np.unique(pos // 12)
+        for i_year in touched_years:
+            start = int(pos[pos // 12 == i_year].min())
+            end = (i_year + 1) * 12
+            for col in ["Entradas", "Saidas", "Fluxo"]:
+                self._propagate(
+                    values=dc[col],
+                    acum=dc[f"{col}_Acum"],
+                    start=start,
+                    end=end,
+                    reset=start == i_year * 12,
+                )
+
+        # recompute touched years and re-propagate yearly cumulative columns
+        # ----------------------------------------------
+        rows = np.concatenate([np.arange(i * 12, (i + 1) * 12) for i in touched_years])
+        df_yearly = CashFlow.get_yearly_summary(
+            self._get_monthly_frame().iloc[rows], self._get_category()
+        )
+        dy = self.state_yearly
+        for col in ["Entradas", "Entradas_N", "Saidas", "Saidas_N", "Fluxo"]:
+            dy[col][touched_years] = df_yearly[col].to_numpy()
+
+        start = int(min(touched_years.min(), first_dirty_year))
+        for col in ["Entradas", "Saidas", "Fluxo"]:
+            self._propagate(
+                values=dy[col],
+                acum=dy[f"{col}_Acum"],
+                start=start,
+                end=self.n_years,
+                reset=start == 0,
+            )
+
+        self.update()
+        return None
+
+    def get_analysis(self):
+        """
+        Get monthly and yearly cash flow summaries from the aggregates.
+
+        :returns:
+            Dictionary with monthly and yearly cash flow summaries, as in
+            ``CashFlow.get_cashflow_analysis``.
+        :rtype: dict
+        """
+        df_monthly = CashFlow.compute_oir(self._get_monthly_frame())
+        df_yearly = CashFlow.compute_oir(self._get_yearly_frame())
+        return {
+            "monthly": df_monthly.round(decimals=2),
+            "yearly": df_yearly.round(decimals=2),
+        }
+
+    def _get_category(self):
+        return "Geral" if self.category is None else self.category
+
+    def _extend_years(self, first_year, last_year):
+        """
+        Grow the aggregate arrays to cover ``first_year`` to ``last_year``.
+
+        Returns the index of the first year whose yearly cumulative columns
+        must be re-propagated because of the growth.
+        """
+        dtype = self.data["Valor"].dtype
+        if self.first_year is None:
+            self.first_year = first_year
+            self.n_years = 0
+            self.state_monthly = self._get_empty_state(0, dtype)
+            self.state_yearly = self._get_empty_state(0, dtype)
+
+        new_first = min(first_year, self.first_year)
+        new_last = max(last_year, self.first_year + self.n_years - 1)
+        n_before = self.first_year - new_first
+        n_after = new_last - (self.first_year + self.n_years - 1)
+        if n_before == 0 and n_after == 0:
+            return self.n_years
+
+        first_dirty_year = 0 if n_before > 0 else self.n_years
+        for dc, size in [(self.state_monthly, 12), (self.state_yearly, 1)]:
+            for col, values in dc.items():
+                dc[col] = np.concatenate(
+                    [
+                        np.zeros(n_before * size, dtype=values.dtype),
+                        values,
+                        np.zeros(n_after * size, dtype=values.dtype),
+                    ]
+                )
+        self.first_year = new_first
+        self.n_years = new_last - new_first + 1
+        return first_dirty_year
+
+    @staticmethod
+    def _get_empty_state(size, dtype):
+        dc = {}
+        for col in ["Entradas", "Saidas", "Fluxo"]:
+            dc[col] = np.zeros(size, dtype=dtype)
+            dc[f"{col}_Acum"] = np.zeros(size, dtype=dtype)
+        for col in ["Entradas_N", "Saidas_N"]:
+            dc[col] = np.zeros(size, dtype=np.int64)
+        return dc
+
+    @staticmethod
+    def _propagate(values, acum, start, end, reset):
+        """
+        Recompute the running sum ``acum[start:end]`` from ``values``.
+        """
+        if start >= end:
+            return None
+        if reset:
+            acum[start:end] = np.cumsum(values[start:end])
+        else:
+            seed = np.concatenate([acum[start - 1 : start], values[start:end]])
+            acum[start:end] = np.cumsum(seed)[1:]
+        return None
+
+    def _get_monthly_frame(self):
+        years = np.arange(self.first_year, self.first_year + self.n_years)
+        months = np.tile(np.arange(1, 13), self.n_years)
+        ano = np.repeat(years.astype(str), 12)
+        dc = self.state_monthly
+        df = pd.DataFrame(
+            {
+                "Ano": ano,
+                "Mes": [f"{a}-{m:02d}" for a, m in zip(ano, months)],
+                "Categoria": self._get_category(),
+            }
+        )
+        for col in CashFlowIncremental.COLUMNS_AGG:
+            df[col] = dc[col].copy()
+        return df
+
+    def _get_yearly_frame(self):
+        years = np.arange(self.first_year, self.first_year + self.n_years)
+        dc = self.state_yearly
+        df = pd.DataFrame(
+            {
+                "Ano": years.astype(str),
+                "Categoria": self._get_category(),
+            }
+        )
+        for col in CashFlowIncremental.COLUMNS_AGG:
+            df[col] = dc[col].copy()
+        return df
+
+
+class CashFlowCache:
+    """
+    Bounded LRU cache for ``CashFlow`` analyses and reports.
+
+    Results are keyed by a content fingerprint of the ledger (``Data``,
+    ``Categoria`` and ``Valor``) plus the call arguments, so repeated
+    calls over an unchanged ledger skip the computation. The fingerprint
+    is computed on every call, so in-place changes to a frame are always
+    seen; ``invalidate`` only frees the results of a ledger early.
+
+    .. dropdown:: Cache Example
+        :icon: code-square
+        :open:
+
+        .. code-block:: python
+
+            from babilonia.accounting import CashFlowCache
+
+            # create the cache
+            cache = CashFlowCache(maxsize=64)
+
+            # first call computes, next calls are served from the cache
+            dc = cache.get_cashflow_report(df, year=2024, initial_cash=1000.0)
+            dc = cache.get_cashflow_report(df, year=2024, initial_cash=1000.0)
+
+            # free the results of a ledger no longer needed
+            cache.invalidate(df)
+
+            print(cache.get_stats())
+
+    """
+
+    # ledger columns used by the cached computations
+    COLUMNS_KEY = ["Data", "Categoria", "Valor"]
+
+    def __init__(self, maxsize=128):
+        """
+        Initialize the cache.
+
+        :param maxsize: maximum number of cached results
+        :type maxsize: int
+        """
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        # last fingerprint seen for each frame object, for ``invalidate``
+        self._fingerprints = {}
+
+    def get_cashflow_analysis(self, df, category=None):
+        """
+        Cached ``CashFlow.get_cashflow_analysis``.
+
+        :param df: cash flow data with ``Data``, ``Categoria`` and ``Valor``
+        :type df: :class:`pandas.DataFrame`
+        :param category: [optional] category filter. Default value = ``None``
+        :type category: str
+        :return: copy of the cached monthly and yearly summaries
+        :rtype: dict
+        """
+        return self._get(
+            "analysis",
+            CashFlow.get_cashflow_analysis,
+            df,
+            category=category,
+        )
+
+    def get_cashflow_report(self, df, year=None, initial_cash=None):
+        """
+        Cached ``CashFlow.get_cashflow_report``.
+
+        :param df: cash flow data with ``Data``, ``Categoria`` and ``Valor``
+        :type df: :class:`pandas.DataFrame`
+        :param year: [optional] year to report. Default value = ``None`` (current year)
+        :type year: int
+        :param initial_cash: [optional] initial balance. Default value = ``None`` (zero)
+        :type initial_cash: float
+        :return: copy of the cached panel and summary
+        :rtype: dict
+        """
+        # resolve defaults so equivalent calls share one entry
+        if year is None:
+            year = datetime.datetime.now().year
+        if initial_cash is None:
+            initial_cash = 0
+        return self._get(
+            "report",
+            CashFlow.get_cashflow_report,
+            df,
+            year=year,
+            initial_cash=initial_cash,
+        )
+
+    def get_fingerprint(self, df):
+        """
+        Get the content fingerprint of a ledger.
+
+        :param df: cash flow data with ``Data``, ``Categoria`` and ``Valor``
+        :type df: :class:`pandas.DataFrame`
+        :return: hexadecimal digest
+        :rtype: str
+        """
+        ls_cols = [col for col in self.COLUMNS_KEY if col in df.columns]
+        hashes = pd.util.hash_pandas_object(df[ls_cols], index=False)
+        digest = hashlib.blake2b(hashes.to_numpy().tobytes(), digest_size=16)
+        digest.update(repr(ls_cols).encode())
+        fingerprint = digest.hexdigest()
+
+        # forget the frame when it is garbage collected
+        key = id(df)
+        if key not in self._fingerprints:
+            ref = weakref.ref(df, lambda r, k=key: self._fingerprints.pop(k, None))
+        else:
+            ref = self._fingerprints[key][0]
+        self._fingerprints[key] = (ref, fingerprint)
+        return fingerprint
+
+    def invalidate(self, df):
+        """
+        Drop the cached results of a ledger, as of its current content and
+        as last seen by the cache.
+
+        :param df: cash flow data previously passed to the cache
+        :type df: :class:`pandas.DataFrame`
+        :return: None
+        :rtype: None
+        """
+        item = self._fingerprints.get(id(df))
+        fingerprints = {self.get_fingerprint(df)}
+        if item is not None:
+            fingerprints.add(item[1])
+        self._fingerprints.pop(id(df), None)
+        for key in [k for k in self._entries if k[1] in fingerprints]:
+            del self._entries[key]
+        return None
+
+    def clear(self):
+        """
+        Drop all cached results and reset statistics.
+
+        :return: None
+        :rtype: None
+        """
+        self._entries.clear()
+        self._fingerprints.clear()
+        self.hits = 0
+        self.misses = 0
+        return None
+
+    def get_stats(self):
+        """
+        Get cache statistics.
+
+        :return: hits, misses, current size and maximum size
+        :rtype: dict
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+        }
+
+    def _get(self, name, func, df, **kwargs):
+        key = (name, self.get_fingerprint(df), tuple(sorted(kwargs.items())))
+        if key in self._entries:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            result = self._entries[key]
+        else:
+            self.misses += 1
+            result = func(df, **kwargs)
+            self._entries[key] = result
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        # copies keep cached frames safe from caller mutation
+        return {k: v.copy() for k, v in result.items()}
+
+
 class CashFlowBBCC(CashFlow):
     """
     A class for handling CSV data from Banco do Brasil Conta Corrente.
@@ -826,46 +2354,43 @@ class CashFlowBBCC(CashFlow):
 
     """
 
-    def __init__(self, name="CashFlowBBCC", alias="CFBBCC"):
-        super().__init__(name=name, alias=alias)
+    def __init__(self, name="CashFlowBBCC", alias="CFBBCC", cents=False):
+        super().__init__(name=name, alias=alias, cents=cents)
         # include the stages of data
         self.data_raw = None
         self.data_parsed = None
+        # encoding of the statement files -- sniffed on first load
+        self.file_data_encoding = None
 
-    def load_data(self, file_data):
+    def load_data(self, file_data, encoding=None):
         """
         Load raw data from bank CSV statement
 
+        The file encoding is sniffed from a prefix of the first file and
+        kept in ``file_data_encoding``, so later files of the same
+        account are read with it directly. A file with bytes the kept
+        encoding cannot decode is read as ``latin1``; the fallback only
+        applies to that file.
+
         :param file_data: Bank statement CSV file path
         :type file_data: str or Path
+        :param encoding: [optional] file encoding, overriding the sniffed one
+        :type encoding: str
         :return: None
         :rtype: None
         """
         # overwrite relative path inputs
         # ----------------------------------------------
         self.file_data = os.path.abspath(file_data)
+        self._set_file_data_encoding(encoding)
 
         # implement loading logic
         # ----------------------------------------------
         try:
-            df = pd.read_csv(
-                self.file_data,
-                sep=",",
-                quotechar='"',
-                encoding="cp1252",  # Banco do Brasil standard
-                dtype=str,
-                keep_default_na=False,
-            )
+            df = self.read_csv()
         except UnicodeDecodeError:
-            # Fallback for alternative exports
-            df = pd.read_csv(
-                self.file_data,
-                sep=",",
-                quotechar='"',
-                encoding="latin1",
-                dtype=str,
-                keep_default_na=False,
-            )
+            # Fallback for bytes past the sniffed prefix, for this file only
+            df = self.read_csv(encoding="latin1")
 
         # post-loading logic
         # ----------------------------------------------
@@ -882,6 +2407,84 @@ class CashFlowBBCC(CashFlow):
 
         return None
 
+    def iter_data(self, file_data, chunksize=100_000, encoding=None):
+        """
+        Iterate over a bank CSV statement as canonical frames, chunk by chunk.
+
+        Streaming counterpart of ``load_data`` followed by ``standardize``:
+        each chunk of raw rows goes through ``parse_data`` and only one
+        chunk is held in memory. Frames keep the row index of a full
+        parse, so their concatenation equals ``parse_data`` on the whole
+        file. ``data_raw``, ``data_parsed`` and ``data`` are not touched.
+
+        :param file_data: Bank statement CSV file path
+        :type file_data: str or Path
+        :param chunksize: [optional] raw rows per chunk. Default value = ``100_000``
+        :type chunksize: int
+        :param encoding: [optional] file encoding, overriding the sniffed one
+        :type encoding: str
+        :return: generator of canonical frames
+        :rtype: generator
+        """
+        self.file_data = os.path.abspath(file_data)
+        self._set_file_data_encoding(encoding)
+
+        encoding_file = self.file_data_encoding
+        n_rows = 0
+        while True:
+            try:
+                # re-read from the start and skip the rows already yielded
+                # by count (a quoted field may span several lines)
+                n_read = 0
+                with self.read_csv(
+                    encoding=encoding_file, chunksize=chunksize
+                ) as reader:
+                    for df in reader:
+                        df.index = pd.RangeIndex(n_read, n_read + len(df))
+                        n_read += len(df)
+                        df = df[df.index >= n_rows]
+                        if len(df) == 0:
+                            continue
+                        n_rows += len(df)
+                        yield self.parse_data(df.dropna())
+                return
+            except UnicodeDecodeError:
+                # Fallback for bytes past the sniffed prefix, for this file only
+                if encoding_file == "latin1":
+                    raise
+                encoding_file = "latin1"
+
+    def read_csv(self, encoding=None, **kwargs):
+        """
+        Read the raw statement file with the bank CSV settings.
+
+        :param encoding: [optional] file encoding. Default value = ``None`` (``file_data_encoding``)
+        :type encoding: str
+        :param kwargs: extra arguments for ``pandas.read_csv`` (e.g., ``chunksize``)
+        :type kwargs: dict
+        :return: raw data, or a chunk reader when ``chunksize`` is given
+        :rtype: ``pandas.DataFrame``
+        """
+        return pd.read_csv(
+            self.file_data,
+            sep=",",
+            quotechar='"',
+            encoding=encoding if encoding is not None else self.file_data_encoding,
+            dtype=str,
+            keep_default_na=False,
+            **kwargs,
+        )
+
+    def _set_file_data_encoding(self, encoding=None):
+        """
+        Set the file encoding: an explicit one wins, otherwise sniff once.
+        """
+        if encoding is not None:
+            self.file_data_encoding = encoding
+        elif self.file_data_encoding is None:
+            self.file_data_encoding = sniff_encoding(self.file_data)
+        return None
+
     def standardize(self, force=False):
         """
         Standardize data into canonical format.
@@ -953,16 +2556,12 @@ class CashFlowBBCC(CashFlow):
         :return: Datetime series
         :rtype: ``pandas.Series``
         """
-        dates = pd.to_datetime(
-            series,
-            format="%d/%m/%Y",
-            errors="raise",
-        )
+        dates = parse_dates(series, fmt="%d/%m/%Y")
         return dates
 
     def parse_valor(self, series):
         """
-        Convert ``Valor`` field to float.
+        Convert ``Valor`` field to float (or int64 cents).
 
         .. dropdown:: Examples
             :open:
@@ -977,6 +2576,10 @@ class CashFlowBBCC(CashFlow):
                  - ``5000.00``
                * - ``-403,00``
                  - ``-403.00``
+               * - ``5.000,00 C``
+                 - ``5000.00``
+               * - ``403,00 D``
+                 - ``-403.00``
 
 
         :param series: String series
@@ -984,22 +2587,7 @@ class CashFlowBBCC(CashFlow):
         :return: Value series
         :rtype: ``pandas.Series``
         """
-        s = series.astype(str).str.strip()
-
-        # Detect Brazilian format (comma as decimal separator)
-        is_br_format = s.str.contains(",")
-
-        # Normalize only Brazilian-formatted values
-        s.loc[is_br_format] = (
-            s.loc[is_br_format]
-            .str.replace(".", "", regex=False)  # thousands separator
-            .str.replace(",", ".", regex=False)  # decimal separator
-        )
-
-        # Convert to float
-        values = s.astype(float)
-
-        return values
+        return parse_amount_br(series, cents=self.cents)
 
     def apply_drops(self, df):
         """
@@ -1047,12 +2635,15 @@ class CashFlowBBCCPJ(CashFlowBBCC):
 
     """
 
-    def __init__(self, name="CashFlowBBCCPJ", alias="CFBBCCPJ"):
-        super().__init__(name=name, alias=alias)
+    def __init__(self, name="CashFlowBBCCPJ", alias="CFBBCCPJ", cents=False):
+        super().__init__(name=name, alias=alias, cents=cents)
 
     def parse_valor(self, series):
         """
-        Convert ``Valor`` field to float.
+        Convert ``Valor`` field to float (or int64 cents).
+
+        Minus signs are ignored: only a ``D`` (debit) marker makes a
+        value negative.
 
         .. dropdown:: Examples
             :open:
@@ -1067,6 +2658,8 @@ class CashFlowBBCCPJ(CashFlowBBCC):
                  - ``5000.00``
                * - ``-403,00 D``
                  - ``-403.00``
+               * - ``-403,00``
+                 - ``403.00``
 
 
         :param series: String series
@@ -1074,26 +2667,7 @@ class CashFlowBBCCPJ(CashFlowBBCC):
         :return: Value series
         :rtype: ``pandas.Series``
         """
-        s = series.str.strip()
-
-        # Identify credit / debit
-        is_credit = s.str.endswith("C")
-        is_debit = s.str.endswith("D")
-
-        # Remove currency markers and spaces
-        s = s.str.replace(r"[CD]", "", regex=True).str.strip()
-
-        # Remove thousands separator and fix decimal separator
-        s = s.str.replace(".", "", regex=False)
-        s = s.str.replace(",", ".", regex=False)
-
-        # Convert to float (absolute value)
-        values = s.astype(float).abs()
-
-        # Apply sign
-        values[is_debit] *= -1
-
-        return values
+        return parse_amount_br(series, cents=self.cents, unsigned=True)
 
     def apply_drops(self, df):
         super().apply_drops(df=df)
@@ -1108,8 +2682,39 @@ class CashFlowBBPP(CashFlowBBCC):
 
     """
 
-    def __init__(self, name="CashFlowBBPP", alias="CFBBPP"):
-        super().__init__(name=name, alias=alias)
+    def __init__(self, name="CashFlowBBPP", alias="CFBBPP", cents=False):
+        super().__init__(name=name, alias=alias, cents=cents)
+
+    def parse_valor(self, series):
+        """
+        Convert ``Valor`` field to float (or int64 cents).
+
+        Minus signs are ignored: only a ``D`` (debit) marker makes a
+        value negative.
+
+        .. dropdown:: Examples
+            :open:
+
+            .. list-table::
+               :widths: auto
+               :header-rows: 1
+
+               * - Input
+                 - Output
+               * - ``5.000,00 C``
+                 - ``5000.00``
+               * - ``-403,00 D``
+                 - ``-403.00``
+               * - ``-403,00``
+                 - ``403.00``
+
+
+        :param series: String series
+        :type series: ``pandas.Series``
+        :return: Value series
+        :rtype: ``pandas.Series``
+        """
+        return parse_amount_br(series, cents=self.cents, unsigned=True)
 
     def parse_data(self, df=None):
 
@@ -1141,51 +2746,6 @@ class CashFlowBBPP(CashFlowBBCC):
 
         return df
 
-    def parse_valor(self, series: pd.Series) -> pd.Series:
-        """
-        Convert ``Valor`` field to float.
-
-        .. dropdown:: Examples
-            :open:
-
-            .. list-table::
-               :widths: auto
-               :header-rows: 1
-
-               * - Input
-                 - Output
-               * - ``5.000,00 C``
-                 - ``5000.00``
-               * - ``-403,00 D``
-                 - ``-403.00``
-
-
-        :param series: String series
-        :type series: ``pandas.Series``
-        :return: Value series
-        :rtype: ``pandas.Series``
-        """
-        s = series.str.strip()
-
-        # Identify credit / debit
-        is_credit = s.str.endswith("C")
-        is_debit = s.str.endswith("D")
-
-        # Remove currency markers and spaces
-        s = s.str.replace(r"[CD]", "", regex=True).str.strip()
-
-        # Remove thousands separator and fix decimal separator
-        s = s.str.replace(".", "", regex=False)
-        s = s.str.replace(",", ".", regex=False)
-
-        # Convert to float (absolute value)
-        values = s.astype(float).abs()
-
-        # Apply sign
-        values[is_debit] *= -1
-
-        return values
-
     def apply_drops(self, df):
 
         return df
@@ -1193,68 +2753,103 @@ class CashFlowBBPP(CashFlowBBCC):
 
 class BBCDB(DataSet):
 
-    def __init__(self, name="BBCDB", alias="BBCDB"):
+    def __init__(self, name="BBCDB", alias="BBCDB", cents=False):
         super().__init__(name=name, alias=alias)
+        # ------------- specifics attributes ------------- #
+        # hold monetary columns as int64 cents
+        self.cents = cents
+
+    def load_data(self, file_data, engine="tokens"):
+        """
+        Load and parse a BB CDB text statement.
 
-    def load_data(self, file_data):
-        # todo docstring
-        from io import StringIO
+        ``data`` is set to a dict of account name (e.g. ``CDBDI``) to a dict
+        of section name (``EXTRATO``, ``SALDOS``, ``DEPOSITOS`` and
+        ``RENDIMENTOS``) to a frame. Concatenated statements (e.g. a
+        multi-year export) are stacked per account and section.
 
+        :param file_data: statement text file path
+        :type file_data: str or Path
+        :param engine: [optional] ``tokens`` for the single-pass tokenizer
+            or ``loop`` for the legacy per-account/per-section scans (one
+            statement and the two classic products only). Default value = ``tokens``
+        :type engine: str
+        :return: None
+        :rtype: None
+        """
         # ------------------------------------------------------------------
         # Internal helpers (local on purpose: used only in this workflow)
         # ------------------------------------------------------------------
 
         def _to_float_br(series: pd.Series) -> pd.Series:
             """Convert Brazilian-formatted numeric strings to float."""
-            return (
-                series.str.replace(".", "", regex=False)  # thousands separator
-                .str.replace(",", ".", regex=False)  # decimal separator
-                .astype(float)
-            )
+            return parse_amount_br(series, decimal=",")
+
+        def _to_money_br(series: pd.Series) -> pd.Series:
+            """Convert Brazilian-formatted amounts to float or int64 cents."""
+            return parse_amount_br(series, cents=self.cents, decimal=",")
 
         def _parse_date(series: pd.Series, fmt: str) -> pd.Series:
             """Parse date strings using a fixed datetime format."""
-            return pd.to_datetime(series, format=fmt)
+            return parse_dates(series, fmt=fmt)
 
         def _parse_day_month_with_year(series: pd.Series, year: int) -> pd.Series:
             """Append year to DD/MM dates and parse."""
-            return pd.to_datetime(series + f"/{year}", format="%d/%m/%Y")
+            return parse_dates(series, fmt="%d/%m/%Y", suffix=f"/{year}")
 
         # ------------------------------------------------------------------
         # 1. Raw text ingestion and cleaning
         # ------------------------------------------------------------------
 
-        ls_data = BBCDB.read_txt(file_data)
-        year_data = BBCDB.get_year(ls_data)
-
-        # Drop structural noise and normalize line content
-        ls_data = BBCDB.drop_lines(ls_data, contains="--")
-        ls_data = BBCDB.drop_lines(ls_data, contains="==")
-        ls_data = BBCDB.drop_blank_lines(ls_data)
-
-        # Canonical line replacements
-        ls_data = BBCDB.replace_lines(ls_data)
-        ls_data = BBCDB.replace_lines(ls_data, "\n", "")
+        # Drop structural noise and normalize line content, lazily
+        lines = BBCDB.iter_lines(file_data)
 
         # ------------------------------------------------------------------
         # 2. Structural splitting (accounts → sections)
         # ------------------------------------------------------------------
 
-        dc_accounts = BBCDB.split_accounts(ls_data)
-        dc_sections = BBCDB.split_sections(dc_data=dc_accounts)
+        if engine == "loop":
+            # the legacy scans need the whole file as a list
+            ls_data = list(lines)
+            year_data = BBCDB.get_year(ls_data)
+            dc_accounts = BBCDB.split_accounts(ls_data)
+            dc_sections = BBCDB.split_sections(dc_data=dc_accounts)
+            ls_blocks = [
+                {
+                    "account": account,
+                    "year": year_data,
+                    "sections": {
+                        title: [line.replace(self.file_csv_sep, " ") for line in lines]
+                        for title, lines in sections.items()
+                    },
+                }
+                for account, sections in dc_sections.items()
+            ]
+        elif engine == "tokens":
+            # the generator is consumed in batches, the year from the first
+            # ``Período:`` line
+            ls_blocks = BBCDB.tokenize(lines)
+            for block in ls_blocks:
+                block["sections"] = {
+                    title: BBCDB.reshape_section(title, lines, normalize=False)
+                    for title, lines in block["sections"].items()
+                }
+        else:
+            raise ValueError(f"Unknown engine: {engine}")
 
         # ------------------------------------------------------------------
         # 3. Section-specific parsing and normalization
         # ------------------------------------------------------------------
 
-        dc_data = {}
+        dc_frames = {}
 
-        for account, sections in dc_sections.items():
-            dc_account_data = {}
+        for block in ls_blocks:
+            account = block["account"]
+            year_data = block["year"]
+            dc_account_frames = dc_frames.setdefault(account, {})
 
-            for section, lines in sections.items():
-                text = "\n".join(lines)
-                df = pd.read_csv(StringIO(text), sep=self.file_csv_sep, dtype=str)
+            for section, lines in block["sections"].items():
+                df = BBCDB.get_frame(lines)
 
                 # -----------------------------
                 # Section-specific normalization
@@ -1262,14 +2857,14 @@ class BBCDB(DataSet):
 
                 if section == "EXTRATO":
                     df["Data"] = _parse_day_month_with_year(df["Data"], year_data)
-                    df["Valor"] = _to_float_br(df["Valor"])
+                    df["Valor"] = _to_money_br(df["Valor"])
                     df = df.rename(columns={"Historico": "Categoria"})
                     df["Descricao"] = ""
                     df = df[["Data", "Valor", "Categoria", "Descricao"]]
 
                 elif section == "RENDIMENTOS":
                     df["Data"] = _parse_day_month_with_year(df["Data"], year_data)
-                    df["Rendimento_Bruto"] = _to_float_br(df["Rendimento_Bruto"])
+                    df["Rendimento_Bruto"] = _to_money_br(df["Rendimento_Bruto"])
 
                 elif section == "SALDOS":
                     df["Data"] = _parse_date(df["Data"], "%d/%m/%Y")
@@ -1279,19 +2874,30 @@ class BBCDB(DataSet):
                         "IR_Projetado",
                         "Capital_Projetado",
                     ]:
-                        df[col] = _to_float_br(df[col])
+                        df[col] = _to_money_br(df[col])
 
                 elif section == "DEPOSITOS":
                     df["Data_Aplicacao"] = _parse_date(df["Data_Aplicacao"], "%d/%m/%Y")
                     df["Data_Vencimento"] = _parse_date(
                         df["Data_Vencimento"], "%d/%m/%Y"
                     )
-                    for col in ["Capital", "Saldo", "Taxa"]:
-                        df[col] = _to_float_br(df[col])
+                    for col in ["Capital", "Saldo"]:
+                        df[col] = _to_money_br(df[col])
+                    df["Taxa"] = _to_float_br(df["Taxa"])
 
-                dc_account_data[section] = df
+                dc_account_frames.setdefault(section, []).append(df)
 
-            dc_data[account] = dc_account_data
+        # stack blocks of the same account and section
+        dc_data = {}
+        for account, dc_account_frames in dc_frames.items():
+            dc_data[account] = {
+                section: (
+                    ls_frames[0]
+                    if len(ls_frames) == 1
+                    else pd.concat(ls_frames, ignore_index=True)
+                )
+                for section, ls_frames in dc_account_frames.items()
+            }
 
         self.data = dc_data.copy()
         return None
@@ -1307,6 +2913,50 @@ class BBCDB(DataSet):
 
         return ls
 
+    @staticmethod
+    def iter_lines(file_txt, encoding="cp1252", blocksize=2**20):
+        """
+        Iterate over the cleaned lines of a text statement.
+
+        The file is memory-mapped and each block of lines is decoded and
+        split once, straight from the mapping, so no full copy of the text
+        is held. Equivalent to ``read_txt`` followed by ``drop_lines``
+        (``--`` and ``==``), ``drop_blank_lines`` and ``replace_lines``
+        (``\\xa0`` and line breaks), without the intermediate lists.
+
+        :param file_txt: statement text file path
+        :type file_txt: str or Path
+        :param encoding: [optional] ASCII-compatible text encoding.
+            Default value = ``cp1252``
+        :type encoding: str
+        :param blocksize: [optional] bytes decoded at a time, extended to
+            the next line break. Default value = ``2**20``
+        :type blocksize: int
+        :return: cleaned lines, without line breaks
+        :rtype: generator
+        """
+        with open(file_txt, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                start = 0
+                size = len(mm)
+                while start < size:
+                    end = mm.find(b"\n", start + blocksize)
+                    if end == -1:
+                        end = size
+                    block = str(mm[start:end], encoding)
+                    start = end + 1
+
+                    # universal newlines, as in text mode reads
+                    if "\r" in block:
+                        block = block.replace("\r\n", "\n").replace("\r", "\n")
+
+                    for line in block.split("\n"):
+                        if "--" in line or "==" in line or not line.strip():
+                            continue
+                        yield line.replace("\xa0", " ")
+
     @staticmethod
     def drop_blank_lines(lines):
         return [line for line in lines if line.strip()]
@@ -1362,9 +3012,246 @@ class BBCDB(DataSet):
         return dc_data
 
     @staticmethod
-    def split_sections(dc_data):
-        sections = {}
+    def tokenize(lines, year=None, batchsize=2**14):
+        """
+        Split statement lines into account blocks and sections in one pass.
+
+        Each line is assigned to the current (account, section) as the
+        lines go by:
+
+        - a line with a CDB product header (``BB CDB <NAME>``) opens a new
+          account block in its ``EXTRATO`` section;
+        - a line with a section title (``CDB_SECTION_TITLES``) moves the
+          block to that section;
+        - the first line of the file (the statement banner) or a
+          ``Período:`` line starts the next statement of a concatenated
+          export: it closes the block, and ``Período:`` sets the year.
+
+        Lines outside account blocks are dropped. Lines are consumed in
+        batches, so a generator (e.g. ``iter_lines``) is never held whole
+        besides the section lines kept in the blocks.
+
+        :param lines: cleaned statement lines
+        :type lines: iterable
+        :param year: [optional] statement year before any ``Período:`` line.
+            Default value = ``None`` (the year of the first ``Período:`` line)
+        :type year: int
+        :param batchsize: [optional] lines scanned at a time. Default value = ``2**14``
+        :type batchsize: int
+        :return: blocks as dicts with ``account``, ``product``, ``year`` and
+            ``sections`` (section name to raw lines)
+        :rtype: list
+        """
+        ls_blocks = []
+        ls_section = None
+        lines = iter(lines)
+        first = next(lines, None)
+        if first is None:
+            return ls_blocks
+        banner = first.strip()
+
+        # marker lines are rare -- find them in one scan of each batch
+        ls_markers = ["Período: ", "BB CDB", *CDB_SECTION_TITLES]
+        if banner:
+            ls_markers.append(banner)
+        pattern = re.compile("|".join(re.escape(marker) for marker in ls_markers))
+
+        n_blocks_yearless = 0
+        batch = [first, *itertools.islice(lines, batchsize - 1)]
+        while batch:
+            text = "\n".join(batch)
+            ls_marked = []
+            n_line = 0
+            pos = 0
+            for match in pattern.finditer(text):
+                n_line += text.count("\n", pos, match.start())
+                pos = match.start()
+                if not ls_marked or ls_marked[-1] != n_line:
+                    ls_marked.append(n_line)
+            del text
+
+            n_next = 0
+            for n_line in ls_marked:
+                # plain lines since the previous marker line
+                if ls_section is not None:
+                    ls_section.extend(batch[n_next:n_line])
+                n_next = n_line + 1
+                line = batch[n_line]
+
+                if "Período: " in line:
+                    year = BBCDB.get_year([line])
+                    # blocks before the first period get its year
+                    for block in ls_blocks[:n_blocks_yearless]:
+                        block["year"] = year
+                    n_blocks_yearless = 0
+                    ls_section = None
+                    continue
+
+                match = None
+                if "BB CDB" in line:
+                    match = CDB_PRODUCT_PATTERN.search(line)
+                if match is None and line.strip() == banner:
+                    ls_section = None
+                    continue
+
+                if match is not None:
+                    product = match.group(0)
+                    account = CDB_ACCOUNT_NAMES.get(
+                        product, "CDB" + "".join(product.split()[2:])
+                    )
+                    ls_section = [line]
+                    ls_blocks.append(
+                        {
+                            "account": account,
+                            "product": product,
+                            "year": year,
+                            "sections": {"EXTRATO": ls_section},
+                        }
+                    )
+                    if year is None:
+                        n_blocks_yearless = len(ls_blocks)
+                    continue
+
+                if ls_section is None:
+                    continue
+
+                for title, section in CDB_SECTION_TITLES.items():
+                    if title in line:
+                        ls_section = [line]
+                        ls_blocks[-1]["sections"][section] = ls_section
+                        break
+                else:
+                    ls_section.append(line)
+
+            if ls_section is not None:
+                ls_section.extend(batch[n_next:])
+            batch = list(itertools.islice(lines, batchsize))
+
+        return ls_blocks
+
+    @staticmethod
+    def reshape_section(title, lines, normalize=True):
+        """
+        Reshape the raw lines of one section into table rows.
+
+        Sets the canonical header of the section, drops the title and
+        summary lines and merges the two-line ``EXTRATO`` records.
+
+        :param title: section name (``EXTRATO``, ``SALDOS``, ``DEPOSITOS``
+            or ``RENDIMENTOS``)
+        :type title: str
+        :param lines: raw section lines, title line first
+        :type lines: list
+        :param normalize: [optional] return ``;``-separated CSV lines;
+            otherwise lines keep their whitespace-separated fields, as read
+            by ``get_frame``. Default value = ``True``
+        :type normalize: bool
+        :return: lines, header first
+        :rtype: list
+        """
+
+        def _normalize_lines(lines):
+            """Collapse whitespace and convert to semicolon-separated format."""
+            return [";".join(line.split()) for line in lines]
+
+        def _rewrite_header_and_trim(lines, header):
+            """Replace header row and drop section title line."""
+            lines[1] = header
+            return lines[1:]
+
+        ls_data = list(lines)
+
+        if title == "EXTRATO":
+            # Remove non-tabular summary lines
+            ls_data = [
+                line
+                for line in ls_data
+                if "Saldo anterior" not in line
+                and "capital" not in line
+                and "Saldo final" not in line
+            ]
+
+            ls_data[1] = "Data Historico Deposito Valor"
+
+            # Merge paired rows into single logical records
+            if len(ls_data) > 3:
+                merged = ls_data[:2]
+                body = ls_data[2:]
+
+                for i in range(0, len(body), 2):
+                    line = body[i] + body[i + 1]
+                    line = (
+                        line.replace("-", "")
+                        .replace("valor juros", "")
+                        .replace("Rendimento  mensal", "Juros")
+                    )
+                    merged.append(line)
+
+                ls_data = merged[1:]
+
+        elif title == "SALDOS":
+            ls_data = _rewrite_header_and_trim(
+                ls_data,
+                "Data Capital_Inicial Juros IR_Projetado Capital_Projetado",
+            )
+
+        elif title == "DEPOSITOS":
+            ls_data = _rewrite_header_and_trim(
+                ls_data,
+                "Deposito Data_Aplicacao Capital Saldo Taxa Data_Vencimento",
+            )
 
+        elif title == "RENDIMENTOS":
+            ls_data = _rewrite_header_and_trim(
+                ls_data,
+                "Data Deposito Rendimento_Bruto",
+            )
+
+        # Final canonical formatting
+        if normalize:
+            return _normalize_lines(ls_data)
+        return ls_data
+
+    @staticmethod
+    def get_frame(lines):
+        """
+        Build a ``str`` frame from whitespace-separated lines, header first.
+
+        Fields go straight into columns, with no CSV text round trip.
+        Follows ``pandas.read_csv`` on the same lines: blank lines are
+        skipped, short rows are padded with missing values and rows with
+        more fields than the header raise ``pandas.errors.ParserError``.
+
+        :param lines: table lines, header first
+        :type lines: list
+        :return: table with ``str`` columns
+        :rtype: :class:`pandas.DataFrame`
+        """
+        header = lines[0].split()
+        n = len(header)
+        body = lines[1:]
+
+        # one split of the whole body -- a sentinel closes every row, so
+        # rows are all full when every (n + 1)-th field is a sentinel
+        sentinel = "\x00"
+        fields = f" {sentinel}\n".join(body + [""]).split()
+        if len(fields) == (n + 1) * len(body) and fields[n :: n + 1] == [
+            sentinel
+        ] * len(body):
+            data = {name: fields[j :: n + 1] for j, name in enumerate(header)}
+            return pd.DataFrame(data, columns=header, dtype="str")
+
+        # ragged rows
+        ls_rows = [row for row in map(str.split, body) if row]
+        if max(map(len, ls_rows), default=0) > n:
+            i = next(i for i, row in enumerate(ls_rows) if len(row) > n)
+            raise pd.errors.ParserError(
+                f"Expected {n} fields in row {i + 1}, saw {len(ls_rows[i])}"
+            )
+        return pd.DataFrame(ls_rows, columns=header, dtype="str")
+
+    @staticmethod
+    def split_sections(dc_data):
         section_titles = {
             "EXTRATO": {"START": None, "END": "SALDO NOS ULTIMOS 6 MESES"},
             "SALDOS": {
@@ -1402,15 +3289,6 @@ class BBCDB(DataSet):
 
             return collected
 
-        def _normalize_lines(lines):
-            """Collapse whitespace and convert to semicolon-separated format."""
-            return [re.sub(r"\s+", ";", line.strip()) for line in lines]
-
-        def _rewrite_header_and_trim(lines, header):
-            """Replace header row and drop section title line."""
-            lines[1] = header
-            return lines[1:]
-
         # ------------------------------------------------------------------
         # Main logic
         # ------------------------------------------------------------------
@@ -1426,60 +3304,7 @@ class BBCDB(DataSet):
                     start=markers["START"],
                     end=markers["END"],
                 )
-
-                # -----------------------------
-                # Section-specific reshaping
-                # -----------------------------
-
-                if title == "EXTRATO":
-                    # Remove non-tabular summary lines
-                    ls_data = [
-                        line
-                        for line in ls_data
-                        if not any(
-                            s in line
-                            for s in ("Saldo anterior", "capital", "Saldo final")
-                        )
-                    ]
-
-                    ls_data[1] = "Data;Historico;Deposito;Valor"
-
-                    # Merge paired rows into single logical records
-                    if len(ls_data) > 3:
-                        merged = ls_data[:2]
-                        body = ls_data[2:]
-
-                        for i in range(0, len(body), 2):
-                            line = body[i] + body[i + 1]
-                            line = (
-                                line.replace("-", "")
-                                .replace("valor juros", "")
-                                .replace("Rendimento  mensal", "Juros")
-                            )
-                            merged.append(line)
-
-                        ls_data = merged[1:]
-
-                elif title == "SALDOS":
-                    ls_data = _rewrite_header_and_trim(
-                        ls_data,
-                        "Data;Capital_Inicial;Juros;IR_Projetado;Capital_Projetado",
-                    )
-
-                elif title == "DEPOSITOS":
-                    ls_data = _rewrite_header_and_trim(
-                        ls_data,
-                        "Deposito;Data_Aplicacao;Capital;Saldo;Taxa;Data_Vencimento",
-                    )
-
-                elif title == "RENDIMENTOS":
-                    ls_data = _rewrite_header_and_trim(
-                        ls_data,
-                        "Data;Deposito;Rendimento_Bruto",
-                    )
-
-                # Final canonical formatting
-                dc_account_data[title] = _normalize_lines(ls_data)
+                dc_account_data[title] = BBCDB.reshape_section(title, ls_data)
 
             dc_data_out[account] = dc_account_data.copy()
 
@@ -1501,12 +3326,15 @@ class NFSe(DataSet):
 
     """
 
-    def __init__(self, name="NFSeDataSet", alias="NFSe"):
+    def __init__(self, name="NFSeDataSet", alias="NFSe", cents=False):
         """
         Initialize the NFSe object.
         """
         super().__init__(name=name, alias=alias)
 
+        # hold monetary values as int cents
+        self.cents = cents
+
         self.date = None
         self.emitter = None
         self.taker = None
@@ -1593,6 +3421,10 @@ class NFSe(DataSet):
 
         # ... continues in downstream objects ... #
 
+    def _get_money(self, text):
+        value = float(text)
+        return to_cents(value) if self.cents else value
+
     def get_metadata(self):
         # ------------ call super ----------- #
         dict_meta = super().get_metadata()
@@ -1612,25 +3444,182 @@ class NFSe(DataSet):
         dict_meta.update(dict_meta_local)
         return dict_meta
 
-    def load_data(self, file_data):
+    def load_data(self, file_data, engine="paths"):
         """
         Load and parse XML data from the provided file.
 
         :param file_data: file path to the NFSe XML data.
         :type file_data: str
+        :param engine: [optional] extraction engine, see ``extract_data``.
+            Default value = ``paths``
+        :type engine: str
         :return: None
         """
         # Ensure the file path is absolute
         file_data = os.path.abspath(file_data)
-        # print(file_data)
         tree = ET.parse(file_data)
         root = tree.getroot()
 
-        # Namespaces used in the XML
-        ns = {
-            "default": "http://www.sped.fazenda.gov.br/nfse",
-            "ds": "http://www.w3.org/2000/09/xmldsig#",
+        nfse_data = self.extract_data(root, engine=engine)
+        self.set_data(nfse_data, file_data=file_data)
+        return None
+
+    def iter_data(self, file_data):
+        """
+        Iterate over the notes of an NFSe XML file, one at a time.
+
+        The file is read with ``iterparse`` and each ``infNFSe`` element is
+        extracted when it closes; processed elements are then cleared, so
+        memory stays constant on batch (lote) files holding thousands of
+        notes under any wrapper element. Single-note files give one record.
+        Fields are extracted with the ``paths`` engine of ``extract_data``.
+
+        :param file_data: file path to the NFSe XML data.
+        :type file_data: str
+        :return: extracted NFSe data of each note
+        :rtype: generator
+        """
+        tag = f"{{{NFSE_NAMESPACES['default']}}}infNFSe"
+        context = ET.iterparse(os.path.abspath(file_data), events=("start", "end"))
+        root = None
+        for event, element in context:
+            if root is None:
+                root = element
+            if event == "end" and element.tag == tag:
+                nfse_data = self.extract_data(element)
+                # drop the processed notes before handing the record over
+                root.clear()
+                yield nfse_data
+
+    def extract_data(self, element, engine="paths"):
+        """
+        Extract the NFSe fields of an XML element.
+
+        :param element: NFSe document root or its ``infNFSe`` element
+        :type element: :class:`xml.etree.ElementTree.Element`
+        :param engine: [optional] ``paths`` to walk the tree once and read
+            fields from the ``NFSE_PATHS`` positions of the national layout,
+            or ``finds`` for the legacy descendant searches, one per field.
+            Default value = ``paths``
+        :type engine: str
+        :return: extracted NFSe data
+        :rtype: dict
+        """
+        if engine == "paths":
+            return self._extract_paths(element)
+        elif engine == "finds":
+            return self._extract_finds(element)
+        raise ValueError(f"Unknown engine: {engine}")
+
+    @staticmethod
+    def get_element_map(element):
+        """
+        Map the ``NFSE_PATHS`` of an NFSe to their elements in one walk.
+
+        Only branches leading to a listed path are visited, and the first
+        element of each path in document order is kept, as in
+        ``Element.find``.
+
+        :param element: NFSe document root or its ``infNFSe`` element
+        :type element: :class:`xml.etree.ElementTree.Element`
+        :return: tag path (e.g. ``emit/CNPJ``) to element, plus ``infNFSe``
+        :rtype: dict
+        """
+        tag = f"{{{NFSE_NAMESPACES['default']}}}infNFSe"
+        if element.tag != tag:
+            element = next(element.iter(tag), None)
+            if element is None:
+                raise ValueError("infNFSe element not found")
+
+        dc_elements = {"infNFSe": element}
+        # first in, first out -- parents are visited in document order
+        queue = deque([(element, "")])
+        while queue:
+            parent, path = queue.popleft()
+            for child in parent:
+                child_path = f"{path}/{child.tag}" if path else child.tag
+                if child_path not in _NFSE_PREFIXES:
+                    continue
+                name = _NFSE_ELEMENTS.get(child_path)
+                if name is not None and name not in dc_elements:
+                    dc_elements[name] = child
+                queue.append((child, child_path))
+        return dc_elements
+
+    def _extract_paths(self, element):
+        dc_elements = NFSe.get_element_map(element)
+
+        def _text(path):
+            """Text of an optional element."""
+            child = dc_elements.get(path)
+            return None if child is None else child.text
+
+        def _text_required(path):
+            """Text of a required element."""
+            if path not in dc_elements:
+                raise ValueError(f"NFSe element not found: {path}")
+            return dc_elements[path].text
+
+        nfse_data = {
+            "nfse_id": dc_elements["infNFSe"].attrib.get("Id"),
+            "local_emissao": _text_required("xLocEmi"),
+            "local_prestacao": _text_required("xLocPrestacao"),
+            "numero_nfse": _text_required("nNFSe"),
+            "codigo_local_incidencia": _text_required("cLocIncid"),
+            "descricao_servico": _text_required("xTribNac"),
+            "valor_liquido": self._get_money(_text_required("valores/vLiq")),
+            "data_processo": _text_required("dhProc"),
+            self.date_field: _text_required("DPS/infDPS/dCompet"),
+        }
+
+        nfse_data[self.emitter_field] = {
+            "cnpj": _text_required("emit/CNPJ"),
+            "nome": _text_required("emit/xNome"),
+            "endereco": {
+                "logradouro": _text_required("emit/enderNac/xLgr"),
+                "numero": _text_required("emit/enderNac/nro"),
+                "bairro": _text_required("emit/enderNac/xBairro"),
+                "cidade": _text_required("emit/enderNac/cMun"),
+                "uf": _text_required("emit/enderNac/UF"),
+                "cep": _text_required("emit/enderNac/CEP"),
+            },
+            "telefone": _text_required("emit/fone"),
+            "email": _text_required("emit/email"),
+        }
+
+        nfse_data[self.taker_field] = {
+            "cnpj": _text("DPS/infDPS/toma/CNPJ"),
+            "nif": _text("DPS/infDPS/toma/NIF"),
+            "nome": _text_required("DPS/infDPS/toma/xNome"),
+            "endereco": {
+                "logradouro": _text("DPS/infDPS/toma/end/xLgr"),
+                "numero": _text("DPS/infDPS/toma/end/nro"),
+                "complemento": _text("DPS/infDPS/toma/end/xCpl"),
+                "bairro": _text("DPS/infDPS/toma/end/xBairro"),
+                "cidade": _text("DPS/infDPS/toma/end/endNac/cMun"),
+                "cep": _text("DPS/infDPS/toma/end/endNac/CEP"),
+            },
+        }
+
+        valor_servico = self._get_money(
+            _text_required("DPS/infDPS/valores/vServPrest/vServ")
+        )
+        nfse_data["servico"] = {
+            "codigo_servico": _text_required("DPS/infDPS/serv/cServ/cTribNac"),
+            "descricao_servico": _text_required("DPS/infDPS/serv/cServ/xDescServ"),
         }
+        nfse_data[self.service_value_field] = valor_servico
+        nfse_data["servico"]["valor_servico"] = valor_servico
+
+        tributo = dc_elements.get("DPS/infDPS/valores/trib/totTrib/pTotTribSN")
+        nfse_data["servico"]["p_tributo_SN"] = (
+            6.0 if tributo is None else float(str(tributo.text))
+        )
+        return nfse_data
+
+    def _extract_finds(self, root):
+        # Namespaces used in the XML
+        ns = NFSE_NAMESPACES
 
         # Dictionary to hold extracted XML data
         nfse_data = {}
@@ -1644,7 +3633,9 @@ class NFSe(DataSet):
             ".//default:cLocIncid", ns
         ).text
         nfse_data["descricao_servico"] = root.find(".//default:xTribNac", ns).text
-        nfse_data["valor_liquido"] = float(root.find(".//default:vLiq", ns).text)
+        nfse_data["valor_liquido"] = self._get_money(
+            root.find(".//default:vLiq", ns).text
+        )
         nfse_data["data_processo"] = root.find(".//default:dhProc", ns).text
         nfse_data[self.date_field] = root.find(".//default:dCompet", ns).text
 
@@ -1735,7 +3726,9 @@ class NFSe(DataSet):
         valor_servico_element = root.find(
             ".//default:valores/default:vServPrest/default:vServ", ns
         )
-        nfse_data[self.service_value_field] = float(valor_servico_element.text)
+        nfse_data[self.service_value_field] = self._get_money(
+            valor_servico_element.text
+        )
         nfse_data["servico"]["valor_servico"] = nfse_data[self.service_value_field]
         tribut_element = root.find(
             ".//default:valores/default:trib/default:totTrib/default:pTotTribSN", ns
@@ -1747,7 +3740,18 @@ class NFSe(DataSet):
             v_tb = float(str(tribut_element.text))
         nfse_data["servico"]["p_tributo_SN"] = v_tb
 
-        # Set parsed data to the class attribute
+        return nfse_data
+
+    def set_data(self, nfse_data, file_data=None):
+        """
+        Set extracted NFSe data and the attributes derived from it.
+
+        :param nfse_data: extracted NFSe data, as given by ``extract_data``
+        :type nfse_data: dict
+        :param file_data: [optional] source file path. Default value = ``None``
+        :type file_data: str
+        :return: None
+        """
         self.data = nfse_data
         self.date = nfse_data[self.date_field]
         self.file_data = file_data
@@ -1774,11 +3778,166 @@ class NFSe(DataSet):
         self.service_value = self.data[self.service_value_field]
         self.service_value_trib = nfse_data["servico"]["p_tributo_SN"]
         self.service_id = self.data["servico"]["codigo_servico"]
+        return None
+
+
+class NFSeCache:
+    """
+    Persistent cache of NFSe extractions, in a SQLite file.
+
+    The extracted ``nfse_data`` of each XML file is stored with the file
+    identity (absolute path, size and modification time), its content hash,
+    the ``NFSE_EXTRACTOR_VERSION`` and the ``cents`` flag. A record is
+    served while the file is unchanged: same size and modification time,
+    or, when only the time differs, the same content hash. Records of an
+    older extractor are ignored and replaced.
+
+    .. dropdown:: Cache Example
+        :icon: code-square
+        :open:
+
+        .. code-block:: python
+
+            from babilonia.accounting import NFSeColl, NFSeCache
+
+            cache = NFSeCache(file_cache="./nfse_cache.sqlite")
+
+            # first run parses every file, next runs only new or changed ones
+            coll = NFSeColl()
+            coll.load_folder("./nfse", cache=cache)
+
+            print(cache.get_stats())
+            cache.close()
+
+    """
+
+    def __init__(self, file_cache):
+        """
+        Initialize the cache.
+
+        :param file_cache: path to the SQLite file, created if missing
+        :type file_cache: str or Path
+        """
+        self.file_cache = file_cache
+        self.hits = 0
+        self.misses = 0
+        self.connection = sqlite3.connect(file_cache)
+        self.connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS nfse (
+                path TEXT NOT NULL,
+                cents INTEGER NOT NULL,
+                size INTEGER NOT NULL,
+                mtime_ns INTEGER NOT NULL,
+                hash TEXT NOT NULL,
+                version TEXT NOT NULL,
+                data TEXT NOT NULL,
+                PRIMARY KEY (path, cents)
+            )
+            """
+        )
+        self.connection.commit()
+
+    def get(self, file_data, cents=False):
+        """
+        Get the cached extraction of an unchanged file.
+
+        :param file_data: file path to the NFSe XML data
+        :type file_data: str
+        :param cents: [optional] monetary values as int cents. Default value = ``False``
+        :type cents: bool
+        :return: extracted NFSe data, or ``None`` when missing or stale
+        :rtype: dict
+        """
+        path = os.path.abspath(file_data)
+        row = self.connection.execute(
+            "SELECT size, mtime_ns, hash, version, data FROM nfse "
+            "WHERE path = ? AND cents = ?",
+            (path, int(cents)),
+        ).fetchone()
+        if row is None or row[3] != NFSE_EXTRACTOR_VERSION:
+            self.misses += 1
+            return None
+
+        stat = os.stat(path)
+        if (stat.st_size, stat.st_mtime_ns) != (row[0], row[1]):
+            # touched or rewritten -- trust the content only
+            if stat.st_size != row[0] or FileSys.get_file_hash(path) != row[2]:
+                self.misses += 1
+                return None
+            self.connection.execute(
+                "UPDATE nfse SET mtime_ns = ? WHERE path = ? AND cents = ?",
+                (stat.st_mtime_ns, path, int(cents)),
+            )
+        self.hits += 1
+        return json.loads(row[4])
+
+    def put(self, file_data, nfse_data, cents=False):
+        """
+        Store the extraction of a file. Call ``commit`` to persist it.
+
+        :param file_data: file path to the NFSe XML data
+        :type file_data: str
+        :param nfse_data: extracted NFSe data, as given by ``NFSe.extract_data``
+        :type nfse_data: dict
+        :param cents: [optional] monetary values as int cents. Default value = ``False``
+        :type cents: bool
+        :return: None
+        :rtype: None
+        """
+        path = os.path.abspath(file_data)
+        stat = os.stat(path)
+        self.connection.execute(
+            "INSERT OR REPLACE INTO nfse VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (
+                path,
+                int(cents),
+                stat.st_size,
+                stat.st_mtime_ns,
+                FileSys.get_file_hash(path),
+                NFSE_EXTRACTOR_VERSION,
+                json.dumps(nfse_data),
+            ),
+        )
+        return None
+
+    def commit(self):
+        """
+        Persist pending records.
+
+        :return: None
+        :rtype: None
+        """
+        self.connection.commit()
+        return None
+
+    def close(self):
+        """
+        Persist pending records and close the SQLite file.
+
+        :return: None
+        :rtype: None
+        """
+        self.connection.commit()
+        self.connection.close()
+        return None
+
+    def get_stats(self):
+        """
+        Get cache statistics.
+
+        :return: hits, misses and number of stored records
+        :rtype: dict
+        """
+        size = self.connection.execute("SELECT COUNT(*) FROM nfse").fetchone()[0]
+        return {"hits": self.hits, "misses": self.misses, "size": size}
 
 
 class NFSeColl(Collection):
 
-    def __init__(self, base_object=NFSe, name="MyNFeCollection", alias="NFeCol0"):
+    def __init__(
+        self, base_object=NFSe, name="MyNFeCollection", alias="NFeCol0", cents=False
+    ):
         """
         Initialize the ``NFSeColl`` object.
 
@@ -1788,9 +3947,12 @@ class NFSeColl(Collection):
         :type name: str
         :param alias: unique object alias. If None, it takes the first and last characters from name
         :type alias: str
+        :param cents: hold monetary values of loaded NFSe as int cents
+        :type cents: bool
         """
         # ------------ set pseudo-static ----------- #
         self.object_alias = "NFE_COL"
+        self.cents = cents
         # Set the name and baseobject attributes
         self.baseobject = base_object
         self.baseobject_name = base_object.__name__
@@ -1805,38 +3967,180 @@ class NFSeColl(Collection):
 
         # ------------ set mutables ----------- #
         self.size = 0
+        # load errors by file path (parallel loading)
+        self.errors = {}
 
         self._set_fields()
         # ... continues in downstream objects ... #
 
-    def load_folder(self, folder):
+    def load_folder(self, folder, workers=1, chunksize=64, cache=None):
         """
         Load NFSe files from a folder
 
         :param folder: path to folder
         :type folder: str
+        :param workers: [optional] number of worker processes, see
+            ``load_files``. Default value = ``1``
+        :type workers: int
+        :param chunksize: [optional] files sent to a worker at a time.
+            Default value = ``64``
+        :type chunksize: int
+        :param cache: [optional] parse cache, see ``load_files``.
+            Default value = ``None``
+        :type cache: :class:`NFSeCache`
         :return: None
         :rtype: None
         """
         from glob import glob
 
         lst_files = glob("{}/*.xml".format(folder))
-        self.load_files(lst_files=lst_files)
+        self.load_files(
+            lst_files=lst_files, workers=workers, chunksize=chunksize, cache=cache
+        )
+
+    def load_batch(self, file_data):
+        """
+        Load all NFSe of a batch (lote) XML file, streaming one at a time.
+
+        :param file_data: path to file
+        :type file_data: str
+        :return: None
+        :rtype: None
+        """
+        file_data = os.path.abspath(file_data)
+        records = NFSe(cents=self.cents).iter_data(file_data)
+        self.load_records(records=records, file_data=file_data)
+
+    def load_records(self, records, file_data=None):
+        """
+        Load NFSe from extracted records, e.g. the ``NFSe.iter_data`` stream.
+
+        Notes are named after their ``nfse_id`` and added with ``extend``.
 
-    def load_files(self, lst_files):
+        :param records: extracted NFSe data, as given by ``NFSe.extract_data``
+        :type records: iterable
+        :param file_data: [optional] source file path. Default value = ``None``
+        :type file_data: str
+        :return: None
+        :rtype: None
+        """
+        ls_nfse = []
+        for nfse_data in records:
+            nfe_id = "NFSe_" + nfse_data["nfse_id"]
+            nfe = NFSe(name=nfe_id, alias=nfe_id, cents=self.cents)
+            nfe.set_data(nfse_data, file_data=file_data)
+            ls_nfse.append(nfe)
+        self.extend(ls_nfse)
+
+    def load_files(self, lst_files, workers=1, chunksize=64, cache=None):
         """
         Load NFSe files from a list of files
 
+        With more than one worker, files are parsed in a process pool that
+        sends back the extracted records only; the collection and its
+        catalog are then assembled once. Files that fail to load are
+        skipped and their errors are collected in ``errors``, by path.
+
+        With a cache, unchanged files are hydrated from their cached
+        records and only new or changed files are parsed, then cached.
+
         :param lst_files: list of paths to files
         :type lst_files: list
+        :param workers: [optional] number of worker processes. Default value = ``1``
+            (serial loading, errors are raised)
+        :type workers: int
+        :param chunksize: [optional] files sent to a worker at a time.
+            Default value = ``64``
+        :type chunksize: int
+        :param cache: [optional] parse cache. Default value = ``None``
+        :type cache: :class:`NFSeCache`
         :return: None
         :rtype: None
         """
-        for f in lst_files:
-            nfe_id = "NFSe_" + os.path.basename(f).split(".")[0]
-            nfe = NFSe(name=nfe_id, alias=nfe_id)
-            nfe.load_data(file_data=f)
-            self.append(new_object=nfe)
+        dc_nfse = {}
+        lst_parse = lst_files
+        if cache is not None:
+            lst_parse = []
+            for f in lst_files:
+                nfse_data = cache.get(f, cents=self.cents)
+                if nfse_data is None:
+                    lst_parse.append(f)
+                else:
+                    dc_nfse[f] = self._get_nfse(f, nfse_data)
+
+        if workers > 1:
+            dc_parsed = self._load_files_pool(
+                lst_parse, workers=workers, chunksize=chunksize
+            )
+        else:
+            dc_parsed = {}
+            for f in lst_parse:
+                nfe_id = "NFSe_" + os.path.basename(f).split(".")[0]
+                nfe = NFSe(name=nfe_id, alias=nfe_id, cents=self.cents)
+                nfe.load_data(file_data=f)
+                dc_parsed[f] = nfe
+
+        if cache is not None:
+            for f, nfe in dc_parsed.items():
+                cache.put(f, nfe.data, cents=self.cents)
+            cache.commit()
+
+        dc_nfse.update(dc_parsed)
+        self.extend(dc_nfse[f] for f in lst_files if f in dc_nfse)
+
+    def _get_nfse(self, file_data, nfse_data):
+        nfe_id = "NFSe_" + os.path.basename(file_data).split(".")[0]
+        nfe = NFSe(name=nfe_id, alias=nfe_id, cents=self.cents)
+        nfe.set_data(nfse_data, file_data=os.path.abspath(file_data))
+        return nfe
+
+    def extend(self, objects):
+        """
+        Add many objects to the collection at once.
+
+        Bulk counterpart of ``append``: the metadata rows are gathered in a
+        list and the catalog is built and updated once for the whole batch.
+        Objects are stored as given, not copied, so the collection shares
+        them with the caller.
+
+        :param objects: ``NFSe`` objects to add
+        :type objects: iterable
+        :return: None
+        :rtype: None
+        """
+        ls_rows = []
+        for new_object in objects:
+            self.collection[new_object.name] = new_object
+            ls_rows.append(new_object.get_metadata())
+        if not ls_rows:
+            return None
+
+        df_new = pd.DataFrame(ls_rows, columns=self.catalog.columns)
+        if self.catalog.empty:
+            self.catalog = df_new
+        else:
+            self.catalog = pd.concat([self.catalog, df_new], ignore_index=True)
+        self.update()
+        return None
+
+    def _load_files_pool(self, lst_files, workers, chunksize):
+        if not lst_files:
+            return {}
+        func = functools.partial(_read_nfse_file, cents=self.cents)
+        executor = ProcessPoolExecutor(max_workers=workers)
+        try:
+            # results come back in file order
+            ls_results = list(executor.map(func, lst_files, chunksize=chunksize))
+        finally:
+            executor.shutdown(cancel_futures=True)
+
+        dc_nfse = {}
+        for f, (nfse_data, error) in zip(lst_files, ls_results):
+            if error is not None:
+                self.errors[f] = error
+                continue
+            dc_nfse[f] = self._get_nfse(f, nfse_data)
+        return dc_nfse
 
 
 # CLASSES -- Module-level
@@ -15,7 +15,7 @@ A set of primitive classes used in other modules.
 # Native imports
 # =======================================================================
 import glob, re
-import os, copy, shutil, datetime, pprint
+import os, copy, shutil, datetime, pprint, hashlib
 from pathlib import Path
 
 # ... {develop}
@@ -1252,6 +1252,26 @@ class FileSys(DataSet):
         file_size_mb = file_size_bytes / (1024 * 1024)
         return file_size_mb
 
+    @staticmethod
+    def get_file_hash(file_path, algorithm="sha256", chunksize=1024 * 1024):
+        """
+        Util for getting the content hash of a file
+
+        :param file_path: path to file
+        :type file_path: str
+        :param algorithm: [optional] ``hashlib`` algorithm name. Default value = ``sha256``
+        :type algorithm: str
+        :param chunksize: [optional] bytes read at a time. Default value = ``1048576``
+        :type chunksize: int
+        :return: hex digest of the file content
+        :rtype: str
+        """
+        file_hash = hashlib.new(algorithm)
+        with open(file_path, "rb") as f:
+            for chunk in iter(lambda: f.read(chunksize), b""):
+                file_hash.update(chunk)
+        return file_hash.hexdigest()
+
 
 # todo [refactor] -- consider remove from plans lib
 class Note(MbaE):
@@ -14,7 +14,8 @@ and produces daily, monthly, and annual cash flow reports using the
 For each year found, the script:
 
 - Loads all matching T1 statement files.
-- Concatenates and reorders columns into a canonical layout.
+- Concatenates the files, dropping transactions repeated by statements
+  of overlapping periods, and reorders columns into a canonical layout.
 - Writes a consolidated daily cash flow CSV.
 - Computes monthly and annual cash flow summaries.
 - Writes monthly and annual CSV reports.
@@ -136,7 +137,8 @@ Data Levels
 - **Annual**: Aggregated per year with cumulative fields.
 
 The script does not modify input files; all outputs are written as new
-CSV files.
+files. Use ``--format parquet`` or ``--format feather`` to read T1 files
+and write outputs in a typed columnar format (requires ``pyarrow``).
 """
 
 
@@ -178,6 +180,8 @@ def main():
     data_folder = Path(args.folder)
     data_type = args.type.lower()
     year_arg = args.year
+    fmt = args.format
+    ext = FILE_FORMATS[fmt]
 
     bank = get_bank(data_type)
     account = get_account(data_type)
@@ -205,11 +209,13 @@ def main():
     print(f" Bank    : {BANK_NAMES[data_type]}")
     print(f" Account : {ACCOUNT_NAMES[data_type]}")
     print(f" Year    : {year_arg if year_arg is not None else 'ALL'}")
+    print(f" Format  : {fmt}")
     print("=" * char_w)
 
     # Resolve file pattern (year wildcard handled inside helper)
-    pattern_files = get_file_pattern_statement_t0(data_type, data_folder, year_arg)
-    pattern_files = pattern_files.replace("T0.csv", "T1.csv")
+    pattern_files = get_file_pattern_statement_t1(
+        data_type, data_folder, year_arg, fmt=fmt
+    )
     ls_files = glob.glob(pattern_files)
 
     if not ls_files:
@@ -240,12 +246,12 @@ def main():
 
         yearly_processed = 0
         ls_dfs = []
-        for i, fpath in enumerate(files_by_year[year], start=1):
+        for i, fpath in enumerate(sorted(files_by_year[year]), start=1):
             name = fpath.stem
 
             print(f"[{i:02d}] {fpath.name}", end=" -> ")
 
-            df = pd.read_csv(fpath, sep=";", dtype=str)
+            df = read_table(fpath)
             ls_dfs.append(df.copy())
 
             print(f"LOADED")
@@ -254,7 +260,10 @@ def main():
 
         # Concat data
         # --------------------------------------------------------------------
-        df_full = pd.concat(ls_dfs).reset_index(drop=True)
+        df_full, df_dropped = concat_statements(ls_dfs)
+        print(f" Overlapping rows dropped: {len(df_dropped)}")
+        if len(df_dropped) > 0:
+            preview_df(df_dropped)
         ls_cols = list(df_full.columns)
 
         ls_ordered = ls_priority + [c for c in ls_cols if c not in ls_priority]
@@ -273,8 +282,8 @@ def main():
         preview_df(df_pretty)
         print("\n")
         # export
-        file_out = Path(args.folder) / f"{year}/{name}_DIARIO.csv"
-        df_full.to_csv(file_out, sep=";", index=False)
+        file_out = Path(args.folder) / f"{year}/{name}_DIARIO{ext}"
+        write_table(df_full, file_out)
         total_processed += 1
         print(f"  Output : {file_out}")
 
@@ -296,8 +305,8 @@ def main():
         print("\n")
 
         # exports
-        file_out = Path(args.folder) / f"{year}/{name}_MENSAL.csv"
-        dc_cfa["monthly"].to_csv(file_out, sep=";", index=False)
+        file_out = Path(args.folder) / f"{year}/{name}_MENSAL{ext}"
+        write_table(dc_cfa["monthly"], file_out)
         total_processed += 1
         print(f"  Output : {file_out}")
 
@@ -312,8 +321,8 @@ def main():
         print(df_pretty)
         print("\n")
 
-        file_out = Path(args.folder) / f"{year}/{name}_ANUAL.csv"
-        dc_cfa["yearly"].to_csv(file_out, sep=";", index=False)
+        file_out = Path(args.folder) / f"{year}/{name}_ANUAL{ext}"
+        write_table(dc_cfa["yearly"], file_out)
         total_processed += 1
         print(f"  Output : {file_out}")
 
@@ -324,12 +333,12 @@ def main():
     dc_scales = {"DIARIO": "Data", "MENSAL": "Mes", "ANUAL": "Ano"}
 
     for scale in list(dc_scales.keys()):
-        pattern = Path(args.folder) / f"*/CAIXA*{scale}.csv"
+        pattern = Path(args.folder) / f"*/CAIXA*{scale}{ext}"
         ls_files = glob.glob(str(pattern))
         df = concat_dfs(ls_files)
         df.sort_values(by=dc_scales[scale], ascending=True, inplace=True)
-        file_out = Path(args.folder) / f"{name}_O_{scale}.csv"
-        df.to_csv(file_out, sep=";", index=False)
+        file_out = Path(args.folder) / f"{name}_O_{scale}{ext}"
+        write_table(df, file_out)
         total_processed += 1
 
         # Yearly
@@ -14,15 +14,21 @@ Core constants and functions for the ``babilonia.tools`` package.
 
 # Native imports
 # =======================================================================
+import os
+import stat
 import glob
+import json
 import argparse
 import pprint
+import tempfile
+import functools
 from pathlib import Path
 
 # ... {develop}
 
 # External imports
 # =======================================================================
+import numpy as np
 import pandas as pd
 
 # ... {develop}
@@ -30,6 +36,7 @@ import pandas as pd
 # Project-level imports
 # =======================================================================
 # import {module}
+from babilonia.root import FileSys
 from babilonia.accounting import CashFlowBBCC, CashFlowBBCCPJ, CashFlowBBPP, BBCDB
 
 # ... {develop}
@@ -44,6 +51,14 @@ PARSERS = {
     "bb-cdb": BBCDB,
 }
 
+# parser logic versions -- bump to re-parse T1 files written by older logic
+PARSER_VERSIONS = {
+    "bb-cc": "1",
+    "bb-pp": "1",
+    "bb-ccpj": "1",
+    "bb-cdb": "1",
+}
+
 BANK_NAMES = {
     "bb-cc": "Banco do Brasil",
     "bb-pp": "Banco do Brasil",
@@ -58,6 +73,25 @@ ACCOUNT_NAMES = {
     "bb-cdb": "Aplicação CDB",
 }
 
+# T1 columns identifying one transaction across overlapping statements
+# (``Categoria`` holds the statement history where there is no document)
+DEDUP_COLUMNS = [
+    "Data",
+    "Valor",
+    "Categoria",
+    "Descricao",
+    "Lancamento",
+    "Documento",
+    "Detalhes",
+]
+
+# storage formats for T1 and CAIXA outputs (columnar formats need ``pyarrow``)
+FILE_FORMATS = {
+    "csv": ".csv",
+    "parquet": ".parquet",
+    "feather": ".feather",
+}
+
 # FUNCTIONS
 # ***********************************************************************
 
@@ -78,9 +112,365 @@ def preview_df(df, row_max=20):
     return None
 
 
+def blank_to_na(df):
+    """
+    Replaces empty strings with missing values in the text columns of a table.
+
+    CSV files read empty fields as missing values, while columnar files
+    keep them as ``""``. Normalizing columnar tables makes both formats
+    give the same categories downstream.
+
+    :param df: The dataset
+    :type df: :class:`pandas.DataFrame`
+    :return: The dataset with no empty strings
+    :rtype: :class:`pandas.DataFrame`
+    """
+    dc_cols = {
+        col: df[col].replace("", np.nan)
+        for col in df.columns
+        if pd.api.types.is_object_dtype(df[col])
+        or pd.api.types.is_string_dtype(df[col])
+    }
+    if not dc_cols:
+        return df
+    return df.assign(**dc_cols)
+
+
+def read_table(file_data, columns=None):
+    """
+    Reads a table file in any of the supported storage formats.
+
+    :param file_data: Path to a ``.csv``, ``.parquet`` or ``.feather`` file
+    :type file_data: str or Path
+    :param columns: [optional] Columns to read. Default value = ``None`` (all columns)
+    :type columns: list
+    :return: The loaded table
+    :rtype: :class:`pandas.DataFrame`
+
+    .. note::
+
+        CSV files are read using ``;`` as a separator and all columns as ``str``.
+        Columnar files keep the types they were written with, so dates and
+        floats need no conversion. Their empty strings are read as missing
+        values, as in CSV files (see ``blank_to_na``).
+
+    """
+    fmt = get_file_format(file_data)
+    if fmt == "parquet":
+        return blank_to_na(pd.read_parquet(file_data, columns=columns))
+    if fmt == "feather":
+        return blank_to_na(pd.read_feather(file_data, columns=columns))
+    return pd.read_csv(file_data, sep=";", dtype=str, usecols=columns)
+
+
+def set_file_mode(file_tmp, file_out):
+    """
+    Sets the permissions of a temporary file about to replace a target file.
+
+    ``tempfile.mkstemp`` creates files readable only by the owner, and
+    ``os.replace`` keeps them. The temporary file gets the mode of the
+    existing target or, for a new target, the default mode of new files
+    (``0o666`` under the process umask).
+
+    :param file_tmp: Path to the temporary file
+    :type file_tmp: str or Path
+    :param file_out: Path to the target file
+    :type file_out: str or Path
+    :return: None
+    :rtype: None
+    """
+    try:
+        mode = stat.S_IMODE(os.stat(file_out).st_mode)
+    except FileNotFoundError:
+        umask = os.umask(0)
+        os.umask(umask)
+        mode = 0o666 & ~umask
+    os.chmod(file_tmp, mode)
+    return None
+
+
+def write_table(df, file_out):
+    """
+    Writes a table file in the storage format given by the file extension.
+
+    The table is written to a temporary file in the same folder and then
+    moved into place, so an interrupted run never leaves a partial output.
+    Empty strings are written as missing values (see ``blank_to_na``).
+
+    :param df: The dataset to be written
+    :type df: :class:`pandas.DataFrame`
+    :param file_out: Path to a ``.csv``, ``.parquet`` or ``.feather`` file
+    :type file_out: str or Path
+    :return: None
+    :rtype: None
+    """
+    file_out = Path(file_out)
+    fmt = get_file_format(file_out)
+    fd, file_tmp = tempfile.mkstemp(
+        dir=file_out.parent, prefix=f".{file_out.stem}.", suffix=file_out.suffix
+    )
+    os.close(fd)
+    try:
+        if fmt == "parquet":
+            blank_to_na(df).to_parquet(file_tmp, index=False)
+        elif fmt == "feather":
+            blank_to_na(df).reset_index(drop=True).to_feather(file_tmp)
+        else:
+            df.to_csv(file_tmp, sep=";", index=False)
+        set_file_mode(file_tmp, file_out)
+        os.replace(file_tmp, file_out)
+    except BaseException:
+        os.remove(file_tmp)
+        raise
+    return None
+
+
+def write_table_chunks(chunks, file_out):
+    """
+    Writes a sequence of frames as one table file, one frame at a time.
+
+    Only one frame is held in memory. CSV chunks are appended; Parquet and
+    Feather chunks are written as record batches with the schema of the
+    first frame, where all-missing columns are typed as strings. As in ``write_table``, the file is moved into place only
+    when complete.
+
+    :param chunks: Frames with the same columns
+    :type chunks: iterable
+    :param file_out: Path to a ``.csv``, ``.parquet`` or ``.feather`` file
+    :type file_out: str or Path
+    :return: Number of rows written
+    :rtype: int
+    """
+    file_out = Path(file_out)
+    fmt = get_file_format(file_out)
+    fd, file_tmp = tempfile.mkstemp(
+        dir=file_out.parent, prefix=f".{file_out.stem}.", suffix=file_out.suffix
+    )
+    os.close(fd)
+    writer = None
+    n_rows = 0
+    try:
+        for i, df in enumerate(chunks):
+            if fmt == "csv":
+                df.to_csv(file_tmp, sep=";", index=False, mode="a", header=i == 0)
+            else:
+                import pyarrow as pa
+                import pyarrow.parquet as pq
+
+                df = blank_to_na(df)
+                if writer is None:
+                    table = pa.Table.from_pandas(df, preserve_index=False)
+                    # all-missing text columns are inferred as ``null``
+                    schema = pa.schema(
+                        [
+                            (
+                                field.with_type(pa.string())
+                                if pa.types.is_null(field.type)
+                                else field
+                            )
+                            for field in table.schema
+                        ],
+                        metadata=table.schema.metadata,
+                    )
+                    table = table.cast(schema)
+                    if fmt == "parquet":
+                        writer = pq.ParquetWriter(file_tmp, schema)
+                    else:
+                        writer = pa.ipc.new_file(file_tmp, schema)
+                else:
+                    table = pa.Table.from_pandas(
+                        df, schema=schema, preserve_index=False
+                    )
+                writer.write_table(table)
+            n_rows += len(df)
+        if writer is not None:
+            writer.close()
+        elif n_rows == 0 and fmt != "csv":
+            raise ValueError("No frames to write")
+        set_file_mode(file_tmp, file_out)
+        os.replace(file_tmp, file_out)
+    except BaseException:
+        if writer is not None:
+            writer.close()
+        os.remove(file_tmp)
+        raise
+    return n_rows
+
+
+def parse_statement(data_type, file_data, file_out, chunksize=None):
+    """
+    Parses one T0 statement file and writes its T1 output.
+
+    The parser instance is reused across calls in the same process, so
+    process pool workers keep per-account state (e.g., the sniffed file
+    encoding) between files.
+
+    :param data_type: The account type (key of ``PARSERS``)
+    :type data_type: str
+    :param file_data: Path to the T0 statement file
+    :type file_data: str or Path
+    :param file_out: Path to the T1 output file
+    :type file_out: str or Path
+    :param chunksize: [optional] Raw rows per chunk to stream the file with
+        bounded memory, for parsers with ``iter_data``. Default value = ``None`` (whole file)
+    :type chunksize: int
+    :return: Path to the T1 output file
+    :rtype: str or Path
+    """
+    cf = get_parser(data_type)
+    if chunksize is not None and hasattr(cf, "iter_data"):
+        chunks = cf.iter_data(file_data=str(file_data), chunksize=chunksize)
+        write_table_chunks(chunks, file_out)
+        return file_out
+    cf.load_data(file_data=str(file_data))
+    cf.standardize()
+    write_table(cf.data, file_out)
+    return file_out
+
+
+def get_file_manifest(data_type, folder):
+    """
+    Gets the path of the parse manifest of an account folder.
+
+    :param data_type: The string containing bank and account info separated by a hyphen
+    :type data_type: str
+    :param folder: The account directory path
+    :type folder: str or Path
+    :return: Path to the ``MANIFEST_{BANK}_{ACCOUNT}.json`` file
+    :rtype: Path
+    """
+    name = f"MANIFEST_{get_bank(data_type).upper()}_{get_account(data_type).upper()}"
+    return Path(folder) / f"{name}.json"
+
+
+def load_manifest(file_manifest):
+    """
+    Loads a parse manifest, or an empty one if the file does not exist.
+
+    :param file_manifest: Path to the manifest file
+    :type file_manifest: str or Path
+    :return: The manifest, with T0 file records under ``"files"``
+    :rtype: dict
+    """
+    if not os.path.isfile(file_manifest):
+        return {"files": {}}
+    with open(file_manifest, "r", encoding="utf-8") as f:
+        manifest = json.load(f)
+    manifest.setdefault("files", {})
+    return manifest
+
+
+def save_manifest(manifest, file_manifest):
+    """
+    Saves a parse manifest, replacing the file atomically.
+
+    :param manifest: The manifest
+    :type manifest: dict
+    :param file_manifest: Path to the manifest file
+    :type file_manifest: str or Path
+    :return: None
+    :rtype: None
+    """
+    file_manifest = Path(file_manifest)
+    fd, file_tmp = tempfile.mkstemp(
+        dir=file_manifest.parent, prefix=f".{file_manifest.stem}.", suffix=".json"
+    )
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=2, sort_keys=True)
+        set_file_mode(file_tmp, file_manifest)
+        os.replace(file_tmp, file_manifest)
+    except BaseException:
+        os.remove(file_tmp)
+        raise
+    return None
+
+
+def get_file_record(file_data, record=None):
+    """
+    Gets the manifest record of a T0 file (size, mtime and content hash).
+
+    The content hash is reused from ``record`` when size and mtime did not
+    change, so unchanged files are not read again.
+
+    :param file_data: Path to the T0 file
+    :type file_data: str or Path
+    :param record: [optional] Previous record of the file. Default value = ``None``
+    :type record: dict
+    :return: The file record
+    :rtype: dict
+    """
+    stat = os.stat(file_data)
+    dc_record = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+    if (
+        record is not None
+        and record.get("size") == dc_record["size"]
+        and record.get("mtime_ns") == dc_record["mtime_ns"]
+        and "sha256" in record
+    ):
+        dc_record["sha256"] = record["sha256"]
+    else:
+        dc_record["sha256"] = FileSys.get_file_hash(file_data)
+    return dc_record
+
+
+def get_parse_status(record, record_old, file_out):
+    """
+    Gets the parse status of a T0 file from its old and new records.
+
+    :param record: Current record of the T0 file (with ``version`` and ``output``)
+    :type record: dict
+    :param record_old: Manifest record of the T0 file, ``None`` if untracked
+    :type record_old: dict
+    :param file_out: Path to the T1 output file
+    :type file_out: str or Path
+    :return: ``"PARSED"`` (new output), ``"UPDATED"`` (changed file or
+        parser version) or ``"SKIPPED"``
+    :rtype: str
+    """
+    if not os.path.exists(file_out):
+        return "PARSED"
+    if record_old is None:
+        # output written before the manifest -- unknown source
+        return "UPDATED"
+    for key in ["sha256", "version", "output"]:
+        if record_old.get(key) != record[key]:
+            return "UPDATED"
+    return "SKIPPED"
+
+
+@functools.lru_cache(maxsize=None)
+def get_parser(data_type):
+    """
+    Gets the parser instance of an account type, one per process.
+
+    :param data_type: The account type (key of ``PARSERS``)
+    :type data_type: str
+    :return: The parser instance
+    :rtype: object
+    """
+    return PARSERS[data_type]()
+
+
+def get_file_format(file_data):
+    """
+    Gets the storage format of a file from its extension.
+
+    :param file_data: The file path
+    :type file_data: str or Path
+    :return: The format key in ``FILE_FORMATS``
+    :rtype: str
+    """
+    suffix = Path(file_data).suffix.lower()
+    for fmt, ext in FILE_FORMATS.items():
+        if suffix == ext:
+            return fmt
+    raise ValueError(f"Unsupported file format: {file_data}")
+
+
 def concat_dfs(ls_files):
     """
-    Reads multiple CSV files and concatenates them into a single DataFrame.
+    Reads multiple table files and concatenates them into a single DataFrame.
 
     :param ls_files: A list of file paths to be read
     :type ls_files: list
@@ -89,20 +479,56 @@ def concat_dfs(ls_files):
 
     .. note::
 
-        This function reads each file using ``;`` as a separator and forces all columns to ``str``
-        type to avoid type inference issues during concatenation.
+        Each file is read with :func:`read_table`, so CSV files are read using ``;``
+        as a separator and forcing all columns to ``str`` type to avoid type inference
+        issues during concatenation, while columnar files keep their types.
         The resulting index is reset and the old index is dropped.
 
     """
 
     ls_dfs = []
     for f in ls_files:
-        df = pd.read_csv(f, sep=";", dtype=str)
+        df = read_table(f)
         ls_dfs.append(df)
     df_full = pd.concat(ls_dfs).reset_index(drop=True)
     return df_full
 
 
+def concat_statements(ls_dfs, columns=None):
+    """
+    Concatenates statement tables, dropping rows repeated across tables.
+
+    Bank exports of overlapping periods (e.g. a month downloaded twice)
+    repeat the same transactions. Rows are keyed by a hash of
+    ``columns`` plus an occurrence counter within their own table, so a
+    transaction is kept as many times as the table holding it most often
+    lists it: identical transactions on the same day are not merged.
+
+    :param ls_dfs: statement tables, one per file, in priority order
+    :type ls_dfs: list
+    :param columns: [optional] key columns. Default value = ``None`` (the
+        ``DEDUP_COLUMNS`` found in the tables)
+    :type columns: list
+    :return: concatenated table without repeated rows, and the dropped rows
+    :rtype: tuple
+    """
+    df_full = pd.concat(ls_dfs).reset_index(drop=True)
+    if columns is None:
+        columns = [c for c in DEDUP_COLUMNS if c in df_full.columns]
+
+    hashes = pd.util.hash_pandas_object(df_full[columns], index=False).to_numpy()
+    sources = np.repeat(np.arange(len(ls_dfs)), [len(df) for df in ls_dfs])
+
+    # n-th copy of a row within its own table
+    df_keys = pd.DataFrame({"Source": sources, "Hash": hashes})
+    df_keys["Occurrence"] = df_keys.groupby(["Source", "Hash"], sort=False).cumcount()
+
+    is_dup = df_keys.duplicated(subset=["Hash", "Occurrence"]).to_numpy()
+    df_dropped = df_full[is_dup].reset_index(drop=True)
+    df_full = df_full[~is_dup].reset_index(drop=True)
+    return df_full, df_dropped
+
+
 def get_bank(data_type):
     """
     Extracts the bank name from a formatted data type string.
@@ -147,26 +573,52 @@ def get_file_pattern_statement_t0(data_type, folder, year=None):
     """
     if year is None:
         year = "*"
-    return rf"{folder}\{year}\EXTRATO_{get_bank(data_type).upper()}_{get_account(data_type).upper()}_*_T0.csv"
+    name = f"EXTRATO_{get_bank(data_type).upper()}_{get_account(data_type).upper()}"
+    return str(Path(folder) / str(year) / f"{name}_*_T0.csv")
+
+
+def get_file_pattern_statement_t1(data_type, folder, year=None, fmt="csv"):
+    """
+    Constructs a glob-style file path pattern for standardized statement files.
+
+    :param data_type: The string containing bank and account info separated by a hyphen
+    :type data_type: str
+    :param folder: The base directory path where files are located
+    :type folder: str
+    :param year: [optional] The specific year to filter files. Default value = ``None``
+    :type year: int
+    :param fmt: [optional] The storage format key in ``FILE_FORMATS``. Default value = ``"csv"``
+    :type fmt: str
+    :return: A formatted string representing the file search pattern
+    :rtype: str
+    """
+    if year is None:
+        year = "*"
+    name = f"EXTRATO_{get_bank(data_type).upper()}_{get_account(data_type).upper()}"
+    return str(Path(folder) / str(year) / f"{name}_*_T1{FILE_FORMATS[fmt]}")
 
 
-def get_file_pattern_cashflow_daily(data_type, folder, year=None):
+def get_file_pattern_cashflow_daily(data_type, folder, year=None, fmt="csv"):
     if year is None:
         year = "*"
-    return rf"{folder}\{year}\CAIXA_{get_bank(data_type).upper()}_{get_account(data_type).upper()}_*_DIARIO.csv"
+    name = f"CAIXA_{get_bank(data_type).upper()}_{get_account(data_type).upper()}"
+    return str(Path(folder) / str(year) / f"{name}_*_DIARIO{FILE_FORMATS[fmt]}")
 
 
 def get_arguments():
     """
     Parses command-line arguments for the Babilonia utilities.
 
-    :return: An object containing the parsed arguments: ``folder``, ``type``, and ``year``
+    :return: An object containing the parsed arguments: ``folder``, ``type``, ``year``, ``format``, ``workers`` and ``chunksize``
     :rtype: :class:`argparse.Namespace`
 
     The function handles the following arguments:
     * ``-f`` / ``--folder``: Path to the target processing directory.
     * ``-t`` / ``--type``: The specific account type string.
     * ``-y`` / ``--year``: The integer year to filter processing (defaults to ``None``).
+    * ``--format``: Storage format of T1 and CAIXA files (defaults to ``csv``).
+    * ``-w`` / ``--workers``: Number of worker processes (defaults to ``1``).
+    * ``-c`` / ``--chunksize``: Raw rows per chunk when streaming statements (defaults to ``None``).
     """
     # 1. Initialize the Parser
     parser = argparse.ArgumentParser(
@@ -184,6 +636,32 @@ def get_arguments():
     # Optional argument (Integer)
     parser.add_argument("-y", "--year", type=int, default=None, help="Year to process")
 
+    # Optional argument (storage format)
+    parser.add_argument(
+        "--format",
+        choices=list(FILE_FORMATS.keys()),
+        default="csv",
+        help="Storage format of T1 and CAIXA files.",
+    )
+
+    # Optional argument (Integer)
+    parser.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of worker processes (parse only).",
+    )
+
+    # Optional argument (Integer)
+    parser.add_argument(
+        "-c",
+        "--chunksize",
+        type=int,
+        default=None,
+        help="Raw rows per chunk to stream statements with bounded memory (parse only).",
+    )
+
     # 3. Parse the Arguments
     args = parser.parse_args()
 
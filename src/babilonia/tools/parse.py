@@ -107,11 +107,27 @@ Data Levels
 
 - **Tier 0 (T0)**: Raw statement files as exported by the bank.
   Column names, formats, and ordering may vary.
-- **Tier 1 (T1)**: Canonical, standardized CSV files produced by this
+- **Tier 1 (T1)**: Canonical, standardized files produced by this
   script, suitable for downstream analysis and aggregation.
 
-The original Tier 0 files are never modified; Tier 1 files are written
-only when they do not already exist.
+Tier 1 files are written as CSV by default. Use ``--format parquet`` or
+``--format feather`` to write typed columnar files instead (requires
+``pyarrow``), which downstream scripts load without re-parsing dates and
+amounts.
+
+The original Tier 0 files are never modified. Each account folder keeps
+a ``MANIFEST_{BANK}_{ACCOUNT}.json`` file with the size, modification
+time and ``sha256`` content hash of every parsed T0 file, plus the
+parser version. Tier 1 files are written when they do not exist yet
+(``PARSED``) or when the T0 file content or the parser version changed
+since the last run (``UPDATED``); otherwise the file is ``SKIPPED``.
+Outputs are written to a temporary file and moved into place, so an
+interrupted run leaves no partial files.
+
+Use ``--workers N`` to parse files in ``N`` processes. The report is
+printed in the same year and file order as a serial run. Use
+``--chunksize N`` to stream oversized statements ``N`` rows at a time,
+straight into the T1 file, with bounded memory.
 
 """
 
@@ -125,6 +141,7 @@ import glob
 import argparse
 import pprint
 from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
 
 # ... {develop}
 
@@ -156,6 +173,9 @@ def main():
     data_folder = Path(args.folder)
     data_type = args.type.lower()
     year_arg = args.year
+    fmt = args.format
+    workers = max(args.workers, 1)
+    chunksize = args.chunksize
 
     print("\n\n")
     print("=" * 80)
@@ -164,6 +184,9 @@ def main():
     print(f" Bank    : {BANK_NAMES[data_type]}")
     print(f" Account : {ACCOUNT_NAMES[data_type]}")
     print(f" Year    : {year_arg if year_arg is not None else 'ALL'}")
+    print(f" Format  : {fmt}")
+    print(f" Workers : {workers}")
+    print(f" Chunks  : {chunksize if chunksize is not None else 'OFF'}")
     print("=" * 80)
 
     # Resolve file pattern (year wildcard handled inside helper)
@@ -187,35 +210,71 @@ def main():
             continue
         files_by_year.setdefault(year, []).append(fpath)
 
-    cf = PARSERS[data_type]()
-
-    total_processed = 0
+    # ------------------------------------------------------------------
+    # Plan tasks in year and file order (unchanged files are skipped)
+    # ------------------------------------------------------------------
+    file_manifest = get_file_manifest(data_type, data_folder)
+    manifest = load_manifest(file_manifest)
+    manifest["type"] = data_type
+    dc_records = manifest["files"]
+    version = PARSER_VERSIONS[data_type]
 
+    dc_tasks = {}
     for year in sorted(files_by_year):
-        print()
-        # print("-" * 80)
-        print(f" Year {year}")
-        print("-" * 80)
-
-        yearly_processed = 0
-        for i, fpath in enumerate(files_by_year[year], start=1):
+        ls_tasks = []
+        for fpath in sorted(files_by_year[year]):
             name = fpath.stem
             new_name = name.replace("T0", "T1")
-            file_out = fpath.parent / f"{new_name}.csv"
-
-            print(f"[{i:02d}] {fpath.name}", end=" -> ")
+            file_out = fpath.parent / f"{new_name}{FILE_FORMATS[fmt]}"
+            key = fpath.relative_to(data_folder).as_posix()
+            record_old = dc_records.get(key)
+            record = get_file_record(fpath, record_old)
+            record.update({"version": version, "output": file_out.name})
+            status = get_parse_status(record, record_old, file_out)
+            if status == "SKIPPED":
+                # refresh size and mtime of unchanged content
+                dc_records[key] = record
+            ls_tasks.append((fpath, file_out, status, key, record))
+        dc_tasks[year] = ls_tasks
+
+    # results come back in submission order, whichever worker ends first
+    ls_parse = [
+        (data_type, fpath, file_out, chunksize)
+        for year in dc_tasks
+        for fpath, file_out, status, key, record in dc_tasks[year]
+        if status != "SKIPPED"
+    ]
+    if workers > 1 and len(ls_parse) > 1:
+        executor = ProcessPoolExecutor(max_workers=workers)
+        results = executor.map(parse_statement, *zip(*ls_parse))
+    else:
+        executor = None
+        results = (parse_statement(*task) for task in ls_parse)
 
-            if file_out.exists():
-                print(f"{file_out.name} SKIPPED")
-                continue
+    total_processed = 0
 
-            cf.load_data(file_data=str(fpath))
-            cf.standardize()
-            cf.data.to_csv(file_out, sep=";", index=False)
-            print(f"{file_out.name} PARSED")
-            total_processed += 1
-            yearly_processed += 1
-        print(f"\n Year completed. Output files written: {yearly_processed}")
+    try:
+        for year in dc_tasks:
+            print()
+            # print("-" * 80)
+            print(f" Year {year}")
+            print("-" * 80)
+
+            yearly_processed = 0
+            for i, task in enumerate(dc_tasks[year], start=1):
+                fpath, file_out, status, key, record = task
+                if status != "SKIPPED":
+                    next(results)
+                    dc_records[key] = record
+                    total_processed += 1
+                    yearly_processed += 1
+                print(f"[{i:02d}] {fpath.name} -> {file_out.name} {status}")
+            print(f"\n Year completed. Output files written: {yearly_processed}")
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+        # keep the records of every file parsed so far
+        save_manifest(manifest, file_manifest)
 
     print()
     print("=" * 80)
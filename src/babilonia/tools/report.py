@@ -6,7 +6,7 @@
 """
 Generate cash flow reports from daily canonical cashflow files.
 
-This script scans a target directory for daily cash flow CSV files
+This script scans a target directory for daily cash flow files
 (previously generated from standardized bank statements), groups them
 by year, and produces yearly cash flow reports using the ``CashFlow``
 analysis engine.
@@ -92,8 +92,11 @@ The input data is expected to follow a simple hierarchical layout:
         └── 2024/
             └── CAIXA_BB_CC_2024_DIARIO.csv
 
-Each ``CAIXA_*_DIARIO.csv`` file represents a daily canonical cashflow
-dataset for a given year.
+Each ``CAIXA_*_DIARIO`` file represents a daily canonical cashflow
+dataset for a given year. Daily files are ``.csv`` by default; use
+``--format parquet`` or ``--format feather`` to read daily files written
+in a typed columnar format (requires ``pyarrow``). The balances file is
+always CSV.
 
 The balances file (``SALDOS_*.csv``) must contain, at minimum, the
 columns:
@@ -108,7 +111,7 @@ Data Levels
 - **Daily**: Transaction-level canonical cashflow.
 - **Report**: Derived yearly report with summary and panel tables.
 
-The script does not modify input files and does not write new CSV files;
+The script does not modify input files and does not write new files;
 it only produces terminal reports.
 """
 
@@ -151,6 +154,7 @@ def main():
     data_folder = Path(args.folder)
     data_type = args.type.lower()
     year_arg = args.year
+    fmt = args.format
 
     bank = get_bank(data_type)
     account = get_account(data_type)
@@ -168,7 +172,9 @@ def main():
     print("=" * char_w)
 
     # Resolve file pattern (year wildcard handled inside helper)
-    pattern_files = get_file_pattern_cashflow_daily(data_type, data_folder, year_arg)
+    pattern_files = get_file_pattern_cashflow_daily(
+        data_type, data_folder, year_arg, fmt=fmt
+    )
     ls_files = glob.glob(pattern_files)
 
     if not ls_files:
@@ -0,0 +1,304 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# Copyright (C) 2025 The Project Authors
+# See pyproject.toml for authors/maintainers.
+# See LICENSE for license details.
+"""
+Benchmarks for the ``CashFlow`` analysis pipeline.
+
+Benchmarks run on synthetic ledgers built with
+:func:`tests.conftest.make_ledger` and are disabled by default.
+
+From the terminal, run:
+
+.. code-block:: bash
+
+    RUN_BENCHMARKS=1 python -m unittest tests.bcmk.test_bcmk_cashflow
+
+Set ``RUN_BENCHMARKS_XXL=1`` as well to include 10M-row ledgers. Stage
+timings (rows per second and peak traced memory) are written to
+``tests/outputs/bcmk_cashflow/stages.csv``.
+
+
+"""
+
+# ***********************************************************************
+# IMPORTS
+# ***********************************************************************
+# import modules from other libs
+
+# Native imports
+# =======================================================================
+import os
+import time
+import unittest
+import tracemalloc
+
+# ... {develop}
+
+# External imports
+# =======================================================================
+import pandas as pd
+
+# ... {develop}
+
+# Project-level imports
+# =======================================================================
+from babilonia.accounting import CashFlow
+from tests.conftest import RUN_BENCHMARKS, RUN_BENCHMARKS_XXL, testprint
+from tests.conftest import OUTPUT_DIR, make_ledger
+
+# ... {develop}
+
+
+# ***********************************************************************
+# CONSTANTS
+# ***********************************************************************
+# define constants in uppercase
+
+# CONSTANTS -- Module-level
+# =======================================================================
+LEDGER_YEARS = 15
+# ... {develop}
+
+
+# ***********************************************************************
+# FUNCTIONS
+# ***********************************************************************
+
+# FUNCTIONS -- Module-level
+# =======================================================================
+
+
+def prepare_ledger(size):
+    """
+    Make a synthetic ledger already enriched and classified.
+    """
+    df = make_ledger(size=size, years=LEDGER_YEARS)
+    df = CashFlow.enrich_time_index(df)
+    df = CashFlow.classify_flows(df)
+    return df
+
+
+def time_call(func, repeat=3, **kwargs):
+    """
+    Return the best wall time of ``repeat`` calls, in seconds.
+    """
+    ls_times = []
+    for i in range(repeat):
+        start = time.perf_counter()
+        func(**kwargs)
+        ls_times.append(time.perf_counter() - start)
+    return min(ls_times)
+
+
+def peak_memory_call(func, **kwargs):
+    """
+    Return the peak memory traced during one call, in bytes.
+
+    Runs apart from ``time_call`` because tracing slows the call down.
+    """
+    tracemalloc.start()
+    try:
+        func(**kwargs)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+# ... {develop}
+
+
+# ***********************************************************************
+# CLASSES
+# ***********************************************************************
+
+# CLASSES -- Module-level
+# =======================================================================
+
+
+@unittest.skipUnless(RUN_BENCHMARKS, reason="skipping benchmarks")
+class BenchmarkMonthlySummary(unittest.TestCase):
+
+    # Setup methods
+    # -------------------------------------------------------------------
+    @classmethod
+    def setUpClass(cls):
+        """
+        Prepare synthetic ledgers
+        """
+        cls.sizes = [10_000, 100_000, 1_000_000]
+        if RUN_BENCHMARKS_XXL:
+            cls.sizes.append(10_000_000)
+
+    # Testing methods
+    # -------------------------------------------------------------------
+
+    def test_engines(self):
+        """
+        Compare the vectorized engine against the year-by-year loop.
+        """
+        for size in self.sizes:
+            df = prepare_ledger(size)
+            dc_times = {}
+            for engine in ["loop", "vectorized"]:
+                dc_times[engine] = time_call(
+                    CashFlow.get_monthly_summary,
+                    df=df,
+                    category="Geral",
+                    engine=engine,
+                )
+            speedup = dc_times["loop"] / dc_times["vectorized"]
+            testprint(
+                f"monthly summary -- rows {size:>10,d} -- "
+                f"loop {dc_times['loop']:.4f} s -- "
+                f"vectorized {dc_times['vectorized']:.4f} s -- "
+                f"speedup {speedup:.1f}x"
+            )
+            pd.testing.assert_frame_equal(
+                CashFlow.get_monthly_summary(df, "Geral", engine="loop"),
+                CashFlow.get_monthly_summary(df, "Geral", engine="vectorized"),
+            )
+
+
+@unittest.skipUnless(RUN_BENCHMARKS, reason="skipping benchmarks")
+class BenchmarkPipelineStages(unittest.TestCase):
+
+    # Setup methods
+    # -------------------------------------------------------------------
+    @classmethod
+    def setUpClass(cls):
+        """
+        Set ledger sizes and the output folder
+        """
+        cls.sizes = [10_000, 100_000, 1_000_000]
+        if RUN_BENCHMARKS_XXL:
+            cls.sizes.append(10_000_000)
+        cls.output_path = OUTPUT_DIR / "bcmk_cashflow"
+        os.makedirs(cls.output_path, exist_ok=True)
+
+    # Testing methods
+    # -------------------------------------------------------------------
+
+    def test_stages(self):
+        """
+        Time each stage of the analysis pipeline on its own input.
+        """
+        ls_rows = []
+        for size in self.sizes:
+            df_raw = make_ledger(size=size, years=LEDGER_YEARS)
+            df_time = CashFlow.enrich_time_index(df_raw)
+            df_flow = CashFlow.classify_flows(df_time)
+            df_monthly = CashFlow.get_monthly_summary(df_flow, "Geral")
+            year = int(df_raw["Data"].dt.year.median())
+
+            ls_stages = [
+                ("enrich_time_index", CashFlow.enrich_time_index, {"df": df_raw}),
+                (
+                    "enrich_time_index[codes]",
+                    CashFlow.enrich_time_index,
+                    {"df": df_raw, "codes": True},
+                ),
+                ("classify_flows", CashFlow.classify_flows, {"df": df_time}),
+                (
+                    "classify_flows[codes]",
+                    CashFlow.classify_flows,
+                    {"df": df_time, "codes": True},
+                ),
+                (
+                    "get_monthly_summary",
+                    CashFlow.get_monthly_summary,
+                    {"df": df_flow, "category": "Geral"},
+                ),
+                (
+                    "get_yearly_summary",
+                    CashFlow.get_yearly_summary,
+                    {"df_monthly": df_monthly, "category": "Geral"},
+                ),
+                (
+                    "get_cashflow_report",
+                    CashFlow.get_cashflow_report,
+                    {"df": df_raw, "year": year},
+                ),
+                (
+                    "get_cashflow_analysis",
+                    CashFlow.get_cashflow_analysis,
+                    {"df": df_raw},
+                ),
+            ]
+            for stage, func, kwargs in ls_stages:
+                seconds = time_call(func, **kwargs)
+                peak = peak_memory_call(func, **kwargs)
+                ls_rows.append(
+                    {
+                        "Stage": stage,
+                        "Rows": size,
+                        "Seconds": seconds,
+                        "Rows_per_second": size / seconds,
+                        "Peak_MB": peak / 1e6,
+                    }
+                )
+                testprint(
+                    f"{stage:<26} -- rows {size:>10,d} -- "
+                    f"{seconds:.4f} s -- {size / seconds:>14,.0f} rows/s -- "
+                    f"peak {peak / 1e6:.1f} MB"
+                )
+
+        df = pd.DataFrame(ls_rows)
+        df.to_csv(self.output_path / "stages.csv", sep=";", index=False)
+
+
+@unittest.skipUnless(RUN_BENCHMARKS, reason="skipping benchmarks")
+class BenchmarkCashFlowReport(unittest.TestCase):
+
+    # Setup methods
+    # -------------------------------------------------------------------
+    @classmethod
+    def setUpClass(cls):
+        """
+        Prepare a synthetic ledger with one flow direction per category
+        """
+        df = make_ledger(size=100_000, years=LEDGER_YEARS, categories=60)
+        is_out = df["Categoria"].str[-1].astype(int) % 2 == 1
+        df["Valor"] = df["Valor"].abs().where(~is_out, -df["Valor"].abs())
+        cls.df = df
+
+    # Testing methods
+    # -------------------------------------------------------------------
+
+    def test_engines(self):
+        """
+        Compare the one-pass pivot against per-category analyses.
+        """
+        dc_times = {}
+        for engine in ["loop", "pivot"]:
+            dc_times[engine] = time_call(
+                CashFlow.get_cashflow_report,
+                repeat=1,
+                df=self.df,
+                year=2020,
+                engine=engine,
+            )
+        speedup = dc_times["loop"] / dc_times["pivot"]
+        testprint(
+            f"cash flow report -- 60 categories -- "
+            f"loop {dc_times['loop']:.4f} s -- "
+            f"pivot {dc_times['pivot']:.4f} s -- "
+            f"speedup {speedup:.1f}x"
+        )
+
+
+# ... {develop}
+
+
+# ***********************************************************************
+# SCRIPT
+# ***********************************************************************
+# standalone behaviour as a script
+if __name__ == "__main__":
+
+    # Script section
+    # ===================================================================
+    unittest.main()
+    # ... {develop}
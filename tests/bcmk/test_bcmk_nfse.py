@@ -0,0 +1,373 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# Copyright (C) 2025 The Project Authors
+# See pyproject.toml for authors/maintainers.
+# See LICENSE for license details.
+"""
+Benchmarks for NFSe XML ingestion.
+
+Benchmarks run on synthetic notes built with
+:func:`tests.conftest.make_nfse_notes` and are disabled by default.
+Field extraction compares the single-walk ``paths`` engine against the
+legacy descendant searches. Batch (lote) files are streamed with
+``NFSe.iter_data`` and compared against parsing the whole tree. Folders
+of note files are loaded serially and with a process pool, and
+collections are filled item by item or in bulk. Folders are reloaded
+through the ``NFSeCache`` parse cache, cold and warm.
+
+From the terminal, run:
+
+.. code-block:: bash
+
+    RUN_BENCHMARKS=1 python -m unittest tests.bcmk.test_bcmk_nfse
+
+Set ``RUN_BENCHMARKS_XXL=1`` as well to include 100k-note batches.
+
+
+"""
+
+# ***********************************************************************
+# IMPORTS
+# ***********************************************************************
+# import modules from other libs
+
+# Native imports
+# =======================================================================
+import os
+import time
+import tempfile
+import unittest
+import xml.etree.ElementTree as ET
+
+# ... {develop}
+
+# External imports
+# =======================================================================
+import pandas as pd
+
+# ... {develop}
+
+# Project-level imports
+# =======================================================================
+from babilonia.accounting import NFSe, NFSeColl, NFSeCache, NFSE_NAMESPACES
+from tests.conftest import RUN_BENCHMARKS, RUN_BENCHMARKS_XXL, testprint
+from tests.conftest import make_nfse_notes, make_nfse_batch
+from tests.bcmk.test_bcmk_cashflow import time_call, peak_memory_call
+
+# ... {develop}
+
+
+# ***********************************************************************
+# FUNCTIONS
+# ***********************************************************************
+
+# FUNCTIONS -- Module-level
+# =======================================================================
+
+
+def extract_notes(roots, engine):
+    """
+    Extract the fields of parsed notes with one ``NFSe`` engine.
+    """
+    nfse = NFSe()
+    return [nfse.extract_data(root, engine=engine) for root in roots]
+
+
+def make_nfse_objects(size):
+    """
+    Make ``NFSe`` objects with unique names, cycling 1,000 extracted notes.
+    """
+    nfse = NFSe()
+    ls_records = [
+        nfse.extract_data(ET.fromstring(xml))
+        for xml in make_nfse_notes(min(size, 1_000))
+    ]
+    ls_nfse = []
+    for i in range(size):
+        nfe = NFSe(name=f"NFSe_{i:06d}", alias=f"NFSe_{i:06d}")
+        nfe.set_data(ls_records[i % len(ls_records)])
+        ls_nfse.append(nfe)
+    return ls_nfse
+
+
+def fill_append(objects):
+    """
+    Fill a collection one ``append`` at a time.
+    """
+    coll = NFSeColl()
+    for nfe in objects:
+        coll.append(nfe)
+    return coll
+
+
+def fill_extend(objects):
+    """
+    Fill a collection with one bulk ``extend``.
+    """
+    coll = NFSeColl()
+    coll.extend(objects)
+    return coll
+
+
+def read_batch_tree(file_data):
+    """
+    Parse a whole batch file, then extract each note.
+    """
+    nfse = NFSe()
+    root = ET.parse(file_data).getroot()
+    tag = f"{{{NFSE_NAMESPACES['default']}}}infNFSe"
+    return [nfse.extract_data(element) for element in root.iter(tag)]
+
+
+def read_batch_stream(file_data):
+    """
+    Stream a batch file, keeping only the count of notes.
+    """
+    return sum(1 for _ in NFSe().iter_data(file_data))
+
+
+# ... {develop}
+
+
+# ***********************************************************************
+# CLASSES
+# ***********************************************************************
+
+# CLASSES -- Module-level
+# =======================================================================
+
+
+@unittest.skipUnless(RUN_BENCHMARKS, reason="skipping benchmarks")
+class BenchmarkExtractNFSe(unittest.TestCase):
+
+    # Setup methods
+    # -------------------------------------------------------------------
+    @classmethod
+    def setUpClass(cls):
+        """
+        Set batch sizes
+        """
+        cls.sizes = [1_000, 10_000]
+        if RUN_BENCHMARKS_XXL:
+            cls.sizes.append(100_000)
+
+    # Testing methods
+    # -------------------------------------------------------------------
+
+    def test_engines(self):
+        """
+        Compare the single-walk extractor against the descendant searches.
+        """
+        for size in self.sizes:
+            roots = [ET.fromstring(xml) for xml in make_nfse_notes(size)]
+            dc_times = {}
+            for engine in ["finds", "paths"]:
+                dc_times[engine] = time_call(
+                    extract_notes, repeat=1, roots=roots, engine=engine
+                )
+            testprint(
+                f"extract nfse -- notes {size:>8,d} -- "
+                f"finds {dc_times['finds']:.4f} s -- "
+                f"paths {dc_times['paths']:.4f} s -- "
+                f"{size / dc_times['paths']:>10,.0f} notes/s -- "
+                f"speedup {dc_times['finds'] / dc_times['paths']:.1f}x"
+            )
+            self.assertEqual(
+                extract_notes(roots, "finds"), extract_notes(roots, "paths")
+            )
+
+
+@unittest.skipUnless(RUN_BENCHMARKS, reason="skipping benchmarks")
+class BenchmarkStreamNFSe(unittest.TestCase):
+
+    # Setup methods
+    # -------------------------------------------------------------------
+    @classmethod
+    def setUpClass(cls):
+        """
+        Set batch sizes and a scratch folder
+        """
+        cls.sizes = [1_000, 10_000]
+        if RUN_BENCHMARKS_XXL:
+            cls.sizes.append(100_000)
+        cls.tmp = tempfile.TemporaryDirectory()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tmp.cleanup()
+
+    # Testing methods
+    # -------------------------------------------------------------------
+
+    def test_engines(self):
+        """
+        Compare streaming a batch file against parsing the whole tree.
+        """
+        file_data = os.path.join(self.tmp.name, "LOTE.xml")
+        for size in self.sizes:
+            with open(file_data, "wb") as f:
+                f.write(make_nfse_batch(size))
+            ls_rows = []
+            for func in [read_batch_tree, read_batch_stream]:
+                seconds = time_call(func, repeat=1, file_data=file_data)
+                peak = peak_memory_call(func, file_data=file_data)
+                ls_rows.append((seconds, peak))
+            testprint(
+                f"batch nfse -- notes {size:>8,d} -- "
+                f"tree {ls_rows[0][0]:.4f} s, peak {ls_rows[0][1] / 1e6:.1f} MB -- "
+                f"stream {ls_rows[1][0]:.4f} s, peak {ls_rows[1][1] / 1e6:.1f} MB"
+            )
+            self.assertEqual(read_batch_stream(file_data), size)
+
+
+@unittest.skipUnless(RUN_BENCHMARKS, reason="skipping benchmarks")
+class BenchmarkLoadFilesNFSe(unittest.TestCase):
+
+    # Setup methods
+    # -------------------------------------------------------------------
+    @classmethod
+    def setUpClass(cls):
+        """
+        Write a folder of synthetic note files
+        """
+        cls.size = 10_000 if RUN_BENCHMARKS_XXL else 1_000
+        cls.workers = max(2, os.cpu_count() or 1)
+        cls.tmp = tempfile.TemporaryDirectory()
+        for i, xml in enumerate(make_nfse_notes(cls.size)):
+            with open(os.path.join(cls.tmp.name, f"NFSe_{i:06d}.xml"), "wb") as f:
+                f.write(xml)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tmp.cleanup()
+
+    # Testing methods
+    # -------------------------------------------------------------------
+
+    def test_workers(self):
+        """
+        Compare serial loading against the process pool.
+        """
+        dc_colls = {}
+        dc_times = {}
+        for workers in [1, self.workers]:
+            start = time.perf_counter()
+            dc_colls[workers] = NFSeColl()
+            dc_colls[workers].load_folder(self.tmp.name, workers=workers)
+            dc_times[workers] = time.perf_counter() - start
+        testprint(
+            f"load nfse files -- notes {self.size:>8,d} -- "
+            f"serial {dc_times[1]:.4f} s -- "
+            f"{self.workers} workers {dc_times[self.workers]:.4f} s -- "
+            f"{self.size / dc_times[self.workers]:>10,.0f} notes/s"
+        )
+        self.assertEqual(dc_colls[self.workers].errors, {})
+        self.assertEqual(dc_colls[self.workers].size, self.size)
+
+
+@unittest.skipUnless(RUN_BENCHMARKS, reason="skipping benchmarks")
+class BenchmarkExtendNFSe(unittest.TestCase):
+
+    # Setup methods
+    # -------------------------------------------------------------------
+    @classmethod
+    def setUpClass(cls):
+        """
+        Set collection sizes
+        """
+        cls.sizes = [1_000, 10_000, 100_000]
+        # item-by-item appends grow quadratically
+        cls.append_max = 10_000 if RUN_BENCHMARKS_XXL else 1_000
+
+    # Testing methods
+    # -------------------------------------------------------------------
+
+    def test_engines(self):
+        """
+        Compare bulk ``extend`` against item-by-item ``append``.
+        """
+        for size in self.sizes:
+            ls_nfse = make_nfse_objects(size)
+            extend = time_call(fill_extend, repeat=1, objects=ls_nfse)
+            peak = peak_memory_call(fill_extend, objects=ls_nfse)
+            msg = (
+                f"fill nfse coll -- notes {size:>8,d} -- "
+                f"extend {extend:.4f} s, peak {peak / 1e6:.1f} MB"
+            )
+            if size <= self.append_max:
+                append = time_call(fill_append, repeat=1, objects=ls_nfse)
+                msg += f" -- append {append:.4f} s -- speedup {append / extend:.1f}x"
+                pd.testing.assert_frame_equal(
+                    fill_extend(ls_nfse).catalog, fill_append(ls_nfse).catalog
+                )
+            testprint(msg)
+            self.assertEqual(fill_extend(ls_nfse).size, size)
+
+
+@unittest.skipUnless(RUN_BENCHMARKS, reason="skipping benchmarks")
+class BenchmarkCacheNFSe(unittest.TestCase):
+
+    # Setup methods
+    # -------------------------------------------------------------------
+    @classmethod
+    def setUpClass(cls):
+        """
+        Write a folder of synthetic note files
+        """
+        cls.size = 10_000 if RUN_BENCHMARKS_XXL else 1_000
+        cls.tmp = tempfile.TemporaryDirectory()
+        cls.folder = os.path.join(cls.tmp.name, "nfse")
+        os.makedirs(cls.folder)
+        for i, xml in enumerate(make_nfse_notes(cls.size)):
+            with open(os.path.join(cls.folder, f"NFSe_{i:06d}.xml"), "wb") as f:
+                f.write(xml)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tmp.cleanup()
+
+    # Testing methods
+    # -------------------------------------------------------------------
+
+    def test_cache(self):
+        """
+        Compare loading without a cache against cold and warm cache runs.
+        """
+        cache = NFSeCache(file_cache=os.path.join(self.tmp.name, "cache.db"))
+        dc_times = {}
+        dc_colls = {}
+        ls_runs = [
+            ("parse", {}),
+            ("cold", {"cache": cache}),
+            ("warm", {"cache": cache}),
+        ]
+        for run, kwargs in ls_runs:
+            start = time.perf_counter()
+            dc_colls[run] = NFSeColl()
+            dc_colls[run].load_folder(self.folder, **kwargs)
+            dc_times[run] = time.perf_counter() - start
+        cache.close()
+        testprint(
+            f"nfse cache -- notes {self.size:>8,d} -- "
+            f"parse {dc_times['parse']:.4f} s -- cold {dc_times['cold']:.4f} s -- "
+            f"warm {dc_times['warm']:.4f} s -- "
+            f"speedup {dc_times['parse'] / dc_times['warm']:.1f}x"
+        )
+        pd.testing.assert_frame_equal(
+            dc_colls["warm"].catalog, dc_colls["parse"].catalog
+        )
+
+
+# ... {develop}
+
+
+# ***********************************************************************
+# SCRIPT
+# ***********************************************************************
+# standalone behaviour as a script
+if __name__ == "__main__":
+
+    # Script section
+    # ===================================================================
+    unittest.main()
+    # ... {develop}
@@ -0,0 +1,444 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# Copyright (C) 2025 The Project Authors
+# See pyproject.toml for authors/maintainers.
+# See LICENSE for license details.
+"""
+Benchmarks for statement amount parsing.
+
+Benchmarks compare the shared :func:`babilonia.accounting.parse_amount_br`
+kernel against the string-method chains it replaced, and the unique-value
+:func:`babilonia.accounting.parse_dates` against a full ``to_datetime``
+call, on synthetic statement columns. BB CDB text statements are split
+with the single-pass tokenizer and the legacy per-account/per-section
+scans. They are disabled by default.
+
+From the terminal, run:
+
+.. code-block:: bash
+
+    RUN_BENCHMARKS=1 python -m unittest tests.bcmk.test_bcmk_parse
+
+Set ``RUN_BENCHMARKS_XXL=1`` as well to include 10M-row statements.
+
+
+"""
+
+# ***********************************************************************
+# IMPORTS
+# ***********************************************************************
+# import modules from other libs
+
+# Native imports
+# =======================================================================
+import os
+import tempfile
+import unittest
+from io import StringIO
+
+# ... {develop}
+
+# External imports
+# =======================================================================
+import numpy as np
+import pandas as pd
+
+# ... {develop}
+
+# Project-level imports
+# =======================================================================
+from babilonia.accounting import BBCDB, parse_amount_br, parse_dates
+from tests.conftest import RUN_BENCHMARKS, RUN_BENCHMARKS_XXL, testprint
+from tests.conftest import make_cdb_statement
+from tests.bcmk.test_bcmk_cashflow import time_call, peak_memory_call
+
+# ... {develop}
+
+
+# ***********************************************************************
+# FUNCTIONS
+# ***********************************************************************
+
+# FUNCTIONS -- Module-level
+# =======================================================================
+
+
+def make_amounts(size, markers=False, seed=0):
+    """
+    Make a synthetic statement column of Brazilian amount strings.
+
+    :param size: number of amounts
+    :type size: int
+    :param markers: use ``C``/``D`` markers instead of a minus sign
+    :type markers: bool
+    :param seed: random seed
+    :type seed: int
+    :return: amount strings
+    :rtype: :class:`pandas.Series`
+    """
+    rng = np.random.default_rng(seed)
+    values = np.round(rng.normal(loc=0, scale=50_000, size=size), 2)
+    # build the strings from a small pool to keep setup time low
+    pool = np.unique(np.abs(values[:100_000]))
+    texts = np.array(
+        [
+            f"{x:,.2f}".replace(",", "_").replace(".", ",").replace("_", ".")
+            for x in pool
+        ]
+    )
+    texts = texts[rng.integers(0, len(texts), size=size)]
+    is_negative = values < 0
+    if markers:
+        texts = np.char.add(texts, np.where(is_negative, " D", " C"))
+    else:
+        texts = np.char.add(np.where(is_negative, "-", ""), texts)
+    return pd.Series(texts, dtype="str")
+
+
+def parse_legacy_cc(series):
+    """
+    Previous ``CashFlowBBCC.parse_valor`` chain.
+    """
+    s = series.astype(str).str.strip()
+    is_br_format = s.str.contains(",")
+    s.loc[is_br_format] = (
+        s.loc[is_br_format]
+        .str.replace(".", "", regex=False)
+        .str.replace(",", ".", regex=False)
+    )
+    return s.astype(float)
+
+
+def parse_legacy_pj(series):
+    """
+    Previous ``CashFlowBBCCPJ.parse_valor`` chain.
+    """
+    s = series.str.strip()
+    is_debit = s.str.endswith("D")
+    s = s.str.replace(r"[CD]", "", regex=True).str.strip()
+    s = s.str.replace(".", "", regex=False)
+    s = s.str.replace(",", ".", regex=False)
+    values = s.astype(float).abs()
+    values[is_debit] *= -1
+    return values
+
+
+def prepare_cdb_lines(**kwargs):
+    """
+    Make synthetic BB CDB statement lines cleaned as in ``BBCDB.load_data``.
+    """
+    ls_data = make_cdb_statement(**kwargs)
+    ls_data = BBCDB.drop_lines(ls_data, contains="--")
+    ls_data = BBCDB.drop_lines(ls_data, contains="==")
+    ls_data = BBCDB.drop_blank_lines(ls_data)
+    ls_data = BBCDB.replace_lines(ls_data)
+    ls_data = BBCDB.replace_lines(ls_data, "\n", "")
+    return ls_data
+
+
+def read_cdb_lists(file_txt):
+    """
+    Legacy reading: ``readlines`` then one full list per cleaning step.
+    """
+    ls_data = BBCDB.read_txt(file_txt)
+    ls_data = BBCDB.drop_lines(ls_data, contains="--")
+    ls_data = BBCDB.drop_lines(ls_data, contains="==")
+    ls_data = BBCDB.drop_blank_lines(ls_data)
+    ls_data = BBCDB.replace_lines(ls_data)
+    ls_data = BBCDB.replace_lines(ls_data, "\n", "")
+    return ls_data
+
+
+def read_cdb_mapped(file_txt):
+    """
+    Memory-mapped reading with the lazy cleaning pipeline.
+    """
+    return list(BBCDB.iter_lines(file_txt))
+
+
+def split_cdb_loop(lines):
+    """
+    Legacy splitting: one scan per account and per account section.
+    """
+    return BBCDB.split_sections(BBCDB.split_accounts(lines))
+
+
+def split_cdb_tokens(lines):
+    """
+    Single-pass tokenizer followed by the shared section reshaping.
+    """
+    return [
+        {
+            title: BBCDB.reshape_section(title, ls_section)
+            for title, ls_section in block["sections"].items()
+        }
+        for block in BBCDB.tokenize(lines)
+    ]
+
+
+def prepare_cdb_sections(**kwargs):
+    """
+    Make reshaped BB CDB section lines, as read by ``BBCDB.get_frame``.
+    """
+    ls_sections = []
+    for block in BBCDB.tokenize(prepare_cdb_lines(**kwargs)):
+        for title, lines in block["sections"].items():
+            ls_sections.append(BBCDB.reshape_section(title, lines, normalize=False))
+    return ls_sections
+
+
+def frames_cdb_csv(sections):
+    """
+    Legacy frames: ``;``-separated text parsed back with ``pandas.read_csv``.
+    """
+    return [
+        pd.read_csv(
+            StringIO("\n".join(";".join(line.split()) for line in lines)),
+            sep=";",
+            dtype="str",
+        )
+        for lines in sections
+    ]
+
+
+def frames_cdb_direct(sections):
+    """
+    Frames built straight from the section fields.
+    """
+    return [BBCDB.get_frame(lines) for lines in sections]
+
+
+# ... {develop}
+
+
+# ***********************************************************************
+# CLASSES
+# ***********************************************************************
+
+# CLASSES -- Module-level
+# =======================================================================
+
+
+@unittest.skipUnless(RUN_BENCHMARKS, reason="skipping benchmarks")
+class BenchmarkParseAmount(unittest.TestCase):
+
+    # Setup methods
+    # -------------------------------------------------------------------
+    @classmethod
+    def setUpClass(cls):
+        """
+        Set statement sizes
+        """
+        cls.sizes = [10_000, 100_000, 1_000_000]
+        if RUN_BENCHMARKS_XXL:
+            cls.sizes.append(10_000_000)
+
+    # Testing methods
+    # -------------------------------------------------------------------
+
+    def test_formats(self):
+        """
+        Compare the fused kernel against the legacy chains.
+        """
+        ls_formats = [
+            ("cc", False, parse_legacy_cc),
+            ("pj", True, parse_legacy_pj),
+        ]
+        for size in self.sizes:
+            for label, markers, func_legacy in ls_formats:
+                series = make_amounts(size, markers=markers)
+                legacy = time_call(func_legacy, series=series)
+                kernel = time_call(parse_amount_br, series=series)
+                testprint(
+                    f"parse amount [{label}] -- rows {size:>10,d} -- "
+                    f"legacy {legacy:.4f} s -- kernel {kernel:.4f} s -- "
+                    f"speedup {legacy / kernel:.1f}x"
+                )
+                pd.testing.assert_series_equal(
+                    func_legacy(series), parse_amount_br(series), check_exact=True
+                )
+
+
+@unittest.skipUnless(RUN_BENCHMARKS, reason="skipping benchmarks")
+class BenchmarkParseDates(unittest.TestCase):
+
+    # Setup methods
+    # -------------------------------------------------------------------
+    @classmethod
+    def setUpClass(cls):
+        """
+        Set statement sizes
+        """
+        cls.sizes = [10_000, 100_000, 1_000_000]
+        if RUN_BENCHMARKS_XXL:
+            cls.sizes.append(10_000_000)
+
+    # Testing methods
+    # -------------------------------------------------------------------
+
+    def test_unique_dates(self):
+        """
+        Compare unique-value parsing against a full ``to_datetime`` call.
+        """
+        rng = np.random.default_rng(0)
+        days = pd.date_range("2025-01-01", periods=365).strftime("%d/%m/%Y")
+        for size in self.sizes:
+            series = pd.Series(days.to_numpy()[rng.integers(0, 365, size=size)])
+            full = time_call(pd.to_datetime, arg=series, format="%d/%m/%Y")
+            unique = time_call(parse_dates, series=series, fmt="%d/%m/%Y")
+            testprint(
+                f"parse dates -- rows {size:>10,d} -- "
+                f"to_datetime {full:.4f} s -- unique {unique:.4f} s -- "
+                f"speedup {full / unique:.1f}x"
+            )
+            pd.testing.assert_series_equal(
+                pd.to_datetime(series, format="%d/%m/%Y"),
+                parse_dates(series, fmt="%d/%m/%Y"),
+            )
+
+
+@unittest.skipUnless(RUN_BENCHMARKS, reason="skipping benchmarks")
+class BenchmarkSplitCDB(unittest.TestCase):
+
+    # Setup methods
+    # -------------------------------------------------------------------
+    @classmethod
+    def setUpClass(cls):
+        """
+        Set deposits per product and statement years
+        """
+        cls.deposits = [100, 1_000, 10_000]
+        cls.years = [1, 10, 40]
+        if RUN_BENCHMARKS_XXL:
+            cls.deposits.append(100_000)
+            cls.years.append(400)
+
+    # Testing methods
+    # -------------------------------------------------------------------
+
+    def test_single_statement(self):
+        """
+        Compare the tokenizer against the legacy scans on one statement.
+        """
+        for deposits in self.deposits:
+            lines = prepare_cdb_lines(deposits=deposits)
+            loop = time_call(split_cdb_loop, lines=lines)
+            tokens = time_call(split_cdb_tokens, lines=lines)
+            testprint(
+                f"split cdb -- lines {len(lines):>10,d} -- "
+                f"loop {loop:.4f} s -- tokens {tokens:.4f} s -- "
+                f"speedup {loop / tokens:.1f}x"
+            )
+            self.assertEqual(
+                list(split_cdb_loop(lines).values()), split_cdb_tokens(lines)
+            )
+
+    def test_concatenated_statements(self):
+        """
+        Tokenizer throughput on multi-year concatenated statements.
+        """
+        ls_products = ("DI", "PROGRESSIVO", "PRE FIXADO", "POS FIXADO")
+        for years in self.years:
+            lines = prepare_cdb_lines(years=years, products=ls_products, deposits=50)
+            tokens = time_call(split_cdb_tokens, lines=lines)
+            testprint(
+                f"split cdb -- years {years:>4d} -- lines {len(lines):>10,d} -- "
+                f"tokens {tokens:.4f} s -- {len(lines) / tokens:>12,.0f} lines/s"
+            )
+            self.assertEqual(len(split_cdb_tokens(lines)), years * len(ls_products))
+
+
+@unittest.skipUnless(RUN_BENCHMARKS, reason="skipping benchmarks")
+class BenchmarkFramesCDB(unittest.TestCase):
+
+    # Setup methods
+    # -------------------------------------------------------------------
+    @classmethod
+    def setUpClass(cls):
+        """
+        Set deposits per product
+        """
+        cls.deposits = [100, 1_000, 10_000, 100_000]
+        if RUN_BENCHMARKS_XXL:
+            cls.deposits.append(1_000_000)
+
+    # Testing methods
+    # -------------------------------------------------------------------
+
+    def test_engines(self):
+        """
+        Compare direct frame building against the ``read_csv`` round trip.
+        """
+        for deposits in self.deposits:
+            sections = prepare_cdb_sections(deposits=deposits)
+            rows = sum(len(lines) - 1 for lines in sections)
+            csv = time_call(frames_cdb_csv, sections=sections)
+            direct = time_call(frames_cdb_direct, sections=sections)
+            testprint(
+                f"frames cdb -- rows {rows:>10,d} -- "
+                f"read_csv {csv:.4f} s -- direct {direct:.4f} s -- "
+                f"speedup {csv / direct:.1f}x"
+            )
+            for df_csv, df_direct in zip(
+                frames_cdb_csv(sections), frames_cdb_direct(sections)
+            ):
+                pd.testing.assert_frame_equal(df_csv, df_direct)
+
+
+@unittest.skipUnless(RUN_BENCHMARKS, reason="skipping benchmarks")
+class BenchmarkReadCDB(unittest.TestCase):
+
+    # Setup methods
+    # -------------------------------------------------------------------
+    @classmethod
+    def setUpClass(cls):
+        """
+        Set deposits per product and a scratch folder
+        """
+        cls.deposits = [1_000, 10_000, 100_000]
+        if RUN_BENCHMARKS_XXL:
+            cls.deposits.append(1_000_000)
+        cls.tmp = tempfile.TemporaryDirectory()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tmp.cleanup()
+
+    # Testing methods
+    # -------------------------------------------------------------------
+
+    def test_engines(self):
+        """
+        Compare the mapped reader against the list-based cleaning steps.
+        """
+        file_txt = os.path.join(self.tmp.name, "EXTRATO_BB_CDB.txt")
+        for deposits in self.deposits:
+            with open(file_txt, "w", encoding="cp1252") as f:
+                f.writelines(make_cdb_statement(deposits=deposits))
+            size = os.path.getsize(file_txt)
+            ls_rows = []
+            for func in [read_cdb_lists, read_cdb_mapped]:
+                seconds = time_call(func, file_txt=file_txt)
+                peak = peak_memory_call(func, file_txt=file_txt)
+                ls_rows.append((seconds, peak))
+            testprint(
+                f"read cdb -- file {size / 1e6:>8.1f} MB -- "
+                f"lists {ls_rows[0][0]:.4f} s, peak {ls_rows[0][1] / 1e6:.1f} MB -- "
+                f"mapped {ls_rows[1][0]:.4f} s, peak {ls_rows[1][1] / 1e6:.1f} MB"
+            )
+            self.assertEqual(read_cdb_lists(file_txt), read_cdb_mapped(file_txt))
+
+
+# ... {develop}
+
+
+# ***********************************************************************
+# SCRIPT
+# ***********************************************************************
+# standalone behaviour as a script
+if __name__ == "__main__":
+
+    # Script section
+    # ===================================================================
+    unittest.main()
+    # ... {develop}
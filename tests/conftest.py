@@ -40,6 +40,7 @@ Print a message
 # Native imports
 # =======================================================================
 import os
+import re
 from pathlib import Path
 
 # ... {develop}
@@ -155,6 +156,172 @@ def load_data():
     return df
 
 
+def make_ledger(size=1000, start_year=2010, years=15, categories=20, seed=0):
+    """
+    Make a synthetic cash flow ledger in the canonical ``CashFlow`` layout.
+
+    :param size: number of transactions
+    :type size: int
+    :param start_year: first calendar year in the ledger
+    :type start_year: int
+    :param years: number of calendar years spanned by the ledger
+    :type years: int
+    :param categories: number of distinct ``Categoria`` values
+    :type categories: int
+    :param seed: random seed
+    :type seed: int
+    :return: ledger with ``Data``, ``Categoria``, ``Valor`` and ``Descricao``
+    :rtype: :class:`pandas.DataFrame`
+    """
+    rng = np.random.default_rng(seed)
+    start = pd.Timestamp(f"{start_year}-01-01")
+    n_days = (pd.Timestamp(f"{start_year + years}-01-01") - start).days
+    days = np.sort(rng.integers(0, n_days, size=size))
+    ls_categories = np.array([f"Categoria {i:02d}" for i in range(categories)])
+    df = pd.DataFrame(
+        {
+            "Data": start + pd.to_timedelta(days, unit="D"),
+            "Categoria": ls_categories[rng.integers(0, categories, size=size)],
+            "Valor": np.round(rng.normal(loc=0, scale=1500, size=size), 2),
+            "Descricao": "",
+        }
+    )
+    return df
+
+
+def make_cdb_statement(
+    years=1, start_year=2024, products=("DI", "PROGRESSIVO"), deposits=5, seed=0
+):
+    """
+    Make a synthetic BB CDB text statement in the ``BBCDB`` layout.
+
+    One statement is made per year and the statements are concatenated,
+    as in a multi-year export.
+
+    :param years: number of yearly statements
+    :type years: int
+    :param start_year: year of the first statement
+    :type start_year: int
+    :param products: CDB product names, one account block each
+    :type products: tuple
+    :param deposits: number of deposits per product
+    :type deposits: int
+    :param seed: random seed
+    :type seed: int
+    :return: statement lines, with line breaks
+    :rtype: list
+    """
+
+    def _money(x):
+        return f"{x:,.2f}".replace(",", "_").replace(".", ",").replace("_", ".")
+
+    rng = np.random.default_rng(seed)
+    ls_lines = []
+    for year in range(start_year, start_year + years):
+        ls_lines += [
+            "BANCO DO BRASIL\n",
+            "=" * 60 + "\n",
+            f"Período: 01/01/{year} a 31/12/{year}\n",
+            "\n",
+        ]
+        for product in products:
+            capital = rng.uniform(1_000, 50_000, size=deposits).round(2)
+            juros = (capital * rng.uniform(0.001, 0.01, size=deposits)).round(2)
+            ids = rng.integers(100_000, 999_999, size=deposits)
+            ls_lines += [
+                f"BB CDB {product}\n",
+                "Data   Historico          Documento      Valor\n",
+                "-" * 60 + "\n",
+                f"       Saldo anterior                  {_money(capital.sum())}\n",
+            ]
+            for i in range(deposits):
+                day = f"{1 + i % 28:02d}/{1 + i % 12:02d}"
+                ls_lines += [
+                    f"{day}  Rendimento  mensal\n",
+                    f"       valor juros   {ids[i]}   {_money(juros[i])}\n",
+                    f"{day}  Aplicacao\n",
+                    f"       -   {ids[i]}   {_money(capital[i])}\n",
+                ]
+            ls_lines += [
+                f"       Saldo final do capital          {_money(capital.sum())}\n",
+                "\n",
+                "SALDO NOS ULTIMOS 6 MESES\n",
+                "Data  Capital  Juros  IR  Projetado\n",
+            ]
+            for month in range(7, 13):
+                ls_lines.append(
+                    f"28/{month:02d}/{year}  {_money(capital.sum())}  "
+                    f"{_money(juros.sum())}  {_money(juros.sum() * 0.2)}  "
+                    f"{_money(capital.sum() + juros.sum() * 0.8)}\n"
+                )
+            ls_lines += [
+                "RESUMO DOS DEPOSITOS EM SER\n",
+                "Deposito  Aplicacao  Capital  Saldo  Taxa  Vencimento\n",
+            ]
+            for i in range(deposits):
+                ls_lines.append(
+                    f"{ids[i]}  02/01/{year}  {_money(capital[i])}  "
+                    f"{_money(capital[i] + juros[i])}  100,00  02/01/{year + 2}\n"
+                )
+            ls_lines += [
+                "RENDIMENTO BRUTO NO PERIODO POR DEPOSITO\n",
+                "Data  Deposito  Rendimento\n",
+            ]
+            for i in range(deposits):
+                ls_lines.append(f"31/12  {ids[i]}  {_money(juros[i])}\n")
+            ls_lines.append("\n")
+    return ls_lines
+
+
+def make_nfse_notes(size=100, seed=0):
+    """
+    Make synthetic NFSe XML documents from the test data notes.
+
+    The test notes are cycled, each copy with a unique ``Id`` and note
+    number and a random service value.
+
+    :param size: number of notes
+    :type size: int
+    :param seed: random seed
+    :type seed: int
+    :return: XML documents
+    :rtype: list
+    """
+    rng = np.random.default_rng(seed)
+    ls_templates = [f.read_bytes() for f in sorted(DATA_DIR.glob("NFSe_*.xml"))]
+    values = rng.uniform(100, 50_000, size=size)
+    ls_notes = []
+    for i in range(size):
+        xml = ls_templates[i % len(ls_templates)]
+        xml = re.sub(rb'Id="NFS\d+"', b'Id="NFS%050d"' % i, xml, count=1)
+        xml = re.sub(rb"<nNFSe>\d+<", b"<nNFSe>%d<" % (i + 1), xml, count=1)
+        xml = re.sub(rb"<vServ>[\d.]+<", b"<vServ>%.2f<" % values[i], xml, count=1)
+        ls_notes.append(xml)
+    return ls_notes
+
+
+def make_nfse_batch(size=100, seed=0):
+    """
+    Make a synthetic NFSe batch (lote) XML document.
+
+    :param size: number of notes, see :func:`make_nfse_notes`
+    :type size: int
+    :param seed: random seed
+    :type seed: int
+    :return: XML document with the notes under a ``LoteNFSe`` element
+    :rtype: bytes
+    """
+    ls_notes = [
+        re.sub(rb"^<\?xml[^>]*\?>", b"", xml)
+        for xml in make_nfse_notes(size=size, seed=seed)
+    ]
+    return (
+        b'<?xml version="1.0" encoding="utf-8"?><LoteNFSe>'
+        + b"".join(ls_notes)
+        + b"</LoteNFSe>"
+    )
+
+
 # ... {develop}
 
 # Module-level
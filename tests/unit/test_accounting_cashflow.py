@@ -43,20 +43,31 @@ From the terminal, run:
 # Native imports
 # =======================================================================
 # import {module}
+import os
+import stat
+import tempfile
 import unittest
+import importlib.util
 
 # ... {develop}
 
 # External imports
 # =======================================================================
+import numpy as np
 import pandas as pd
 
 # ... {develop}
 
 # Project-level imports
 # =======================================================================
-from babilonia.accounting import CashFlowBBCC, CashFlowBBCCPJ, CashFlowBBPP
-from tests.conftest import DATA_DIR
+from babilonia.accounting import CashFlow, CashFlowIncremental, to_cents
+from babilonia.accounting import CashFlowCache, parse_amount_br, parse_dates
+from babilonia.accounting import sniff_encoding, SNIFF_SIZE
+from babilonia.accounting import CashFlowBBCC, CashFlowBBCCPJ, CashFlowBBPP, BBCDB
+from babilonia.tools.core import read_table, write_table, write_table_chunks
+from babilonia.tools.core import blank_to_na, concat_statements
+from babilonia.tools.core import load_manifest, save_manifest
+from tests.conftest import DATA_DIR, make_ledger, make_cdb_statement
 from tests.conftest import testprint
 
 # ... {develop}
@@ -73,6 +84,7 @@ from tests.conftest import testprint
 
 # CONSTANTS -- Module-level
 # =======================================================================
+HAS_PYARROW = importlib.util.find_spec("pyarrow") is not None
 # ... {develop}
 
 
@@ -97,8 +109,476 @@ from tests.conftest import testprint
 # =======================================================================
 
 
+class TestCashFlow(unittest.TestCase):
+
+    # Setup methods
+    # -------------------------------------------------------------------
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        Runs once before all tests in this class.
+        """
+        cls.ledger = make_ledger(size=5000, start_year=2020, years=3, categories=6)
+        # ... {develop}
+        return None
+
+    def setUp(self):
+        """
+        Runs before each test method.
+        """
+        df = CashFlow.enrich_time_index(self.ledger)
+        self.df = CashFlow.classify_flows(df)
+        # ... {develop}
+        return None
+
+    # Testing methods
+    # -------------------------------------------------------------------
+
+    def test_monthly_summary_engines(self):
+        """
+        Vectorized and loop monthly summaries must be identical.
+        """
+        for category in [None, "Categoria 03"]:
+            df, category = CashFlow.filter_category(self.df, category)
+            df_loop = CashFlow.get_monthly_summary(df, category, engine="loop")
+            df_vect = CashFlow.get_monthly_summary(df, category)
+            pd.testing.assert_frame_equal(df_loop, df_vect, check_exact=True)
+
+    def test_working_frame(self):
+        """
+        Coded working frames must give the same monthly summary as strings.
+        """
+        df = CashFlow.get_working_frame(self.ledger)
+        self.assertEqual(df["Categoria"].dtype, "category")
+        self.assertEqual(df["Mes"].dtype, "int64")
+        self.assertEqual(df["Flow"].dtype, "bool")
+        for engine in ["loop", "vectorized"]:
+            pd.testing.assert_frame_equal(
+                CashFlow.get_monthly_summary(self.df, "Geral", engine=engine),
+                CashFlow.get_monthly_summary(df, "Geral", engine=engine),
+                check_exact=True,
+            )
+
+    def test_cashflow_report_engines(self):
+        """
+        Pivot and loop cash flow reports must be identical.
+        """
+        # each category flows in one direction
+        df = self.ledger.copy()
+        is_out = df["Categoria"].str[-1].astype(int) % 2 == 1
+        df["Valor"] = df["Valor"].abs().where(~is_out, -df["Valor"].abs())
+
+        dc_loop = CashFlow.get_cashflow_report(df, 2021, 100.0, engine="loop")
+        dc_pivot = CashFlow.get_cashflow_report(df, 2021, 100.0)
+        for key in ["Pannel", "Summary"]:
+            pd.testing.assert_frame_equal(dc_loop[key], dc_pivot[key])
+
+    def test_ledger_without_category(self):
+        """
+        Ledgers without ``Categoria`` must analyse and report as one category.
+        """
+        df = self.ledger.drop(columns=["Categoria"])
+        dc_full = CashFlow.get_cashflow_analysis(self.ledger)
+        dc_flat = CashFlow.get_cashflow_analysis(df)
+        for key in ["monthly", "yearly"]:
+            pd.testing.assert_frame_equal(dc_full[key], dc_flat[key])
+
+        for engine in ["loop", "pivot"]:
+            dc_report = CashFlow.get_cashflow_report(df, 2021, 100.0, engine=engine)
+            self.assertEqual(
+                list(dc_report["Pannel"].columns),
+                ["Ano", "Mes", "Fluxo", "Entradas", "Saidas", "Saldo"],
+            )
+            self.assertEqual(
+                list(dc_report["Summary"]["Categoria"]), ["ENTRADAS", "SAIDAS"]
+            )
+
+    def test_cashflow_report_mixed_category(self):
+        """
+        Categories with both flows must get unique panel columns.
+        """
+        df = self.ledger.copy()
+        is_out = df["Categoria"].str[-1].astype(int) % 2 == 1
+        df["Valor"] = df["Valor"].abs().where(~is_out, -df["Valor"].abs())
+        # one category flowing in both directions
+        is_mixed = df["Categoria"] == "Categoria 00"
+        df.loc[is_mixed, "Valor"] = self.ledger.loc[is_mixed, "Valor"]
+
+        dc_loop = CashFlow.get_cashflow_report(df, 2021, 100.0, engine="loop")
+        dc_pivot = CashFlow.get_cashflow_report(df, 2021, 100.0)
+        for key in ["Pannel", "Summary"]:
+            pd.testing.assert_frame_equal(dc_loop[key], dc_pivot[key])
+
+        df_pannel = dc_pivot["Pannel"]
+        self.assertTrue(df_pannel.columns.is_unique)
+        self.assertIn("Categoria 00 (Entradas)", df_pannel.columns)
+        self.assertIn("Categoria 00 (Saidas)", df_pannel.columns)
+        self.assertIn("Categoria 02", df_pannel.columns)
+        self.assertTrue((df_pannel["Categoria 00 (Saidas)"] <= 0).all())
+        CashFlow.format_currency_columns(df_pannel, df_pannel.columns[2:])
+
+    def test_incremental_analysis(self):
+        """
+        Incremental aggregates must equal a full recompute after each batch.
+        """
+        df = self.ledger.sample(frac=1, random_state=0)
+        ls_batches = [
+            df.iloc[:4000],
+            df.iloc[4000:],
+            make_ledger(size=100, start_year=2024, years=1, seed=1),
+            make_ledger(size=100, start_year=2017, years=1, seed=2),
+        ]
+        for category in [None, "Categoria 01"]:
+            cf = CashFlowIncremental(category=category)
+            for i, df_batch in enumerate(ls_batches):
+                cf.append_data(df_batch)
+                df_full = pd.concat(ls_batches[: i + 1], ignore_index=True)
+                dc_full = CashFlow.get_cashflow_analysis(df_full, category)
+                dc_incr = cf.get_analysis()
+                for key in ["monthly", "yearly"]:
+                    pd.testing.assert_frame_equal(
+                        dc_full[key], dc_incr[key], check_exact=True
+                    )
+
+    def test_cents_analysis(self):
+        """
+        Cents ledgers must give exact integer aggregates on every engine.
+        """
+        df = self.ledger.copy()
+        df["Valor"] = to_cents(df["Valor"])
+
+        dc_cents = CashFlow.get_cashflow_analysis(df)
+        dc_float = CashFlow.get_cashflow_analysis(self.ledger)
+        for key in ["monthly", "yearly"]:
+            self.assertEqual(dc_cents[key]["Fluxo_Acum"].dtype, "int64")
+            pd.testing.assert_series_equal(
+                dc_cents[key]["Fluxo"] / 100, dc_float[key]["Fluxo"]
+            )
+        total = sum(int(v) for v in df["Valor"])
+        self.assertEqual(dc_cents["yearly"]["Fluxo_Acum"].iloc[-1], total)
+
+        df = CashFlow.classify_flows(CashFlow.enrich_time_index(df))
+        pd.testing.assert_frame_equal(
+            CashFlow.get_monthly_summary(df, "Geral", engine="loop"),
+            CashFlow.get_monthly_summary(df, "Geral"),
+            check_exact=True,
+        )
+
+        cf = CashFlowIncremental()
+        cf.append_data(df.iloc[:3000])
+        cf.append_data(df.iloc[3000:])
+        pd.testing.assert_frame_equal(
+            dc_cents["yearly"], cf.get_analysis()["yearly"], check_exact=True
+        )
+
+        # float batches are converted to cents in cents mode
+        cf = CashFlowIncremental(cents=True)
+        cf.append_data(self.ledger.iloc[:3000])
+        cf.append_data(self.ledger.iloc[3000:])
+        self.assertEqual(cf.data["Valor"].dtype, "int64")
+        pd.testing.assert_frame_equal(
+            dc_cents["yearly"], cf.get_analysis()["yearly"], check_exact=True
+        )
+
+    def test_format_currency_array(self):
+        """
+        Vectorized and scalar currency formatting must be identical.
+        """
+        values = np.concatenate(
+            [
+                self.ledger["Valor"].to_numpy() * 1000,
+                [0.0, -0.0, -0.004, 0.125, 2.675, 999.995, 1e6, 1e20],
+                [np.nan, np.inf, -np.inf],
+            ]
+        )
+        for decimal, thousands in [(".", ","), (",", ".")]:
+            ls_scalar = [
+                CashFlow.format_currency(x, decimal=decimal, thousands=thousands)
+                for x in values
+            ]
+            ls_array = CashFlow.format_currency_array(
+                values, decimal=decimal, thousands=thousands
+            )
+            self.assertEqual(ls_scalar, list(ls_array))
+            self.assertEqual(ls_array.dtype, object)
+        # the same dtype on the cents and all-fast paths
+        for cents in [False, True]:
+            ls_array = CashFlow.format_currency_array(
+                to_cents(self.ledger["Valor"]) if cents else self.ledger["Valor"],
+                cents=cents,
+            )
+            self.assertEqual(ls_array.dtype, object)
+            self.assertEqual(
+                list(ls_array),
+                [CashFlow.format_currency(x) for x in self.ledger["Valor"]],
+            )
+        self.assertEqual(
+            CashFlow.format_currency(
+                -123456789, cents=True, decimal=",", thousands="."
+            ),
+            "1.234.567,89 -",
+        )
+
+    def test_chunked_analysis(self):
+        """
+        Chunked analysis of a ledger file must equal the in-memory analysis.
+        """
+        with tempfile.TemporaryDirectory() as tmp:
+            file_data = os.path.join(tmp, "ledger.csv")
+            self.ledger.to_csv(file_data, sep=";", index=False)
+            for cents in [False, True]:
+                cf = CashFlow(cents=cents)
+                cf.load_data(file_data)
+                for category in [None, "Categoria 02"]:
+                    dc_full = CashFlow.get_cashflow_analysis(cf.data, category)
+                    dc_chunked = cf.get_cashflow_analysis_chunked(
+                        file_data, category, chunksize=333
+                    )
+                    for key in ["monthly", "yearly"]:
+                        pd.testing.assert_frame_equal(
+                            dc_full[key], dc_chunked[key], check_exact=True
+                        )
+
+    def test_concat_statements_history(self):
+        """
+        Same-day, same-amount rows with different histories are all kept.
+        """
+        # T1 layout with no document columns (e.g., bb-pp and bb-cdb)
+        df_a = pd.DataFrame(
+            {
+                "Data": pd.to_datetime(["2021-03-01", "2021-03-02"]),
+                "Valor": [-50.0, 100.0],
+                "Categoria": ["Pix - Enviado", "Rendimento"],
+                "Descricao": "",
+            }
+        )
+        df_b = pd.DataFrame(
+            {
+                "Data": pd.to_datetime(["2021-03-02", "2021-03-02"]),
+                "Valor": [100.0, 100.0],
+                "Categoria": ["Rendimento", "Pix - Recebido"],
+                "Descricao": "",
+            }
+        )
+        df_full, df_dropped = concat_statements([df_a, df_b])
+        self.assertEqual(len(df_full), 3)
+        self.assertEqual(list(df_dropped["Categoria"]), ["Rendimento"])
+        self.assertIn("Pix - Recebido", list(df_full["Categoria"]))
+
+    @unittest.skipIf(os.name == "nt", reason="POSIX file modes")
+    def test_write_table_mode(self):
+        """
+        Written tables get the default mode, or keep the mode they replace.
+        """
+        umask = os.umask(0o022)
+        try:
+            with tempfile.TemporaryDirectory() as tmp:
+                file_out = os.path.join(tmp, "table.csv")
+                write_table(self.ledger, file_out)
+                self.assertEqual(stat.S_IMODE(os.stat(file_out).st_mode), 0o644)
+                os.chmod(file_out, 0o640)
+                write_table_chunks([self.ledger], file_out)
+                self.assertEqual(stat.S_IMODE(os.stat(file_out).st_mode), 0o640)
+        finally:
+            os.umask(umask)
+
+    @unittest.skipIf(os.name == "nt", reason="POSIX file modes")
+    def test_save_manifest_mode(self):
+        """
+        Saved manifests get the default mode, or keep the mode they replace.
+        """
+        umask = os.umask(0o022)
+        try:
+            with tempfile.TemporaryDirectory() as tmp:
+                file_manifest = os.path.join(tmp, "MANIFEST.json")
+                save_manifest({"files": {}}, file_manifest)
+                mode = stat.S_IMODE(os.stat(file_manifest).st_mode)
+                self.assertEqual(mode, 0o644)
+                os.chmod(file_manifest, 0o600)
+                save_manifest(load_manifest(file_manifest), file_manifest)
+                mode = stat.S_IMODE(os.stat(file_manifest).st_mode)
+                self.assertEqual(mode, 0o600)
+        finally:
+            os.umask(umask)
+
+    @unittest.skipUnless(HAS_PYARROW, reason="pyarrow not installed")
+    def test_write_table_chunks_null_column(self):
+        """
+        Text columns missing in the first chunk must not fix a null type.
+        """
+        ls_chunks = [
+            pd.DataFrame(
+                {"Valor": [1.0, 2.0], "Detalhes": pd.Series([None] * 2, dtype=object)}
+            ),
+            pd.DataFrame(
+                {"Valor": [3.0], "Detalhes": pd.Series(["Pix"], dtype=object)}
+            ),
+        ]
+        with tempfile.TemporaryDirectory() as tmp:
+            for ext in [".parquet", ".feather"]:
+                file_out = os.path.join(tmp, f"chunks{ext}")
+                self.assertEqual(write_table_chunks(ls_chunks, file_out), 3)
+                df = read_table(file_out)
+                self.assertEqual(df["Detalhes"].isna().tolist(), [True, True, False])
+                self.assertEqual(df["Detalhes"].iloc[2], "Pix")
+
+    @unittest.skipUnless(HAS_PYARROW, reason="pyarrow not installed")
+    def test_load_data_columnar(self):
+        """
+        Columnar files must load the same ledger as CSV files.
+        """
+        with tempfile.TemporaryDirectory() as tmp:
+            dc_data = {}
+            for ext in [".csv", ".parquet", ".feather"]:
+                file_data = os.path.join(tmp, f"ledger{ext}")
+                write_table(self.ledger, file_data)
+                cf = CashFlow()
+                cf.load_data(file_data)
+                dc_data[ext] = cf.data
+        for ext in [".parquet", ".feather"]:
+            # columnar files round-trip the ledger, with blanks as missing
+            pd.testing.assert_frame_equal(blank_to_na(self.ledger), dc_data[ext])
+            pd.testing.assert_frame_equal(
+                dc_data[".csv"], dc_data[ext], check_dtype=False
+            )
+
+    @unittest.skipUnless(HAS_PYARROW, reason="pyarrow not installed")
+    def test_load_data_columnar_blanks(self):
+        """
+        Blank categories in columnar files must report as in CSV files.
+        """
+        df = self.ledger.copy()
+        is_out = df["Categoria"].str[-1].astype(int) % 2 == 1
+        df["Valor"] = df["Valor"].abs().where(~is_out, -df["Valor"].abs())
+        # blank categories on both flows
+        df.loc[df.index[::7], "Categoria"] = ""
+        with tempfile.TemporaryDirectory() as tmp:
+            dc_report = {}
+            for ext in [".csv", ".parquet"]:
+                file_data = os.path.join(tmp, f"ledger{ext}")
+                if ext == ".csv":
+                    df.to_csv(file_data, sep=";", index=False)
+                else:
+                    # files written before blanks were normalized
+                    df.to_parquet(file_data, index=False)
+                cf = CashFlow()
+                cf.load_data(file_data)
+                dc_report[ext] = cf.get_cashflow_report(cf.data, 2021, 100.0)
+        df_pannel = dc_report[".parquet"]["Pannel"]
+        self.assertNotIn("", df_pannel.columns)
+        CashFlow.format_currency_columns(df_pannel, df_pannel.columns[2:])
+        for key in ["Pannel", "Summary"]:
+            pd.testing.assert_frame_equal(
+                dc_report[".csv"][key], dc_report[".parquet"][key]
+            )
+
+    # Tear down methods
+    # -------------------------------------------------------------------
+    def tearDown(self):
+        """
+        Runs after each test method.
+        """
+        # ... {develop}
+        return None
+
+    @classmethod
+    def tearDownClass(cls):
+        """
+        Runs once after all tests in this class.
+        """
+        # ... {develop}
+        return None
+
+
+class TestCashFlowCache(unittest.TestCase):
+
+    # Setup methods
+    # -------------------------------------------------------------------
+
+    def setUp(self):
+        """
+        Runs before each test method.
+        """
+        self.ledger = make_ledger(size=2000, start_year=2020, years=3, categories=6)
+        self.cache = CashFlowCache(maxsize=2)
+        # ... {develop}
+        return None
+
+    # Testing methods
+    # -------------------------------------------------------------------
+
+    def test_hits_and_misses(self):
+        """
+        Repeated calls must be served from the cache with equal results.
+        """
+        dc_ref = CashFlow.get_cashflow_report(self.ledger, 2021, 10.0)
+        for i in range(3):
+            dc = self.cache.get_cashflow_report(self.ledger, 2021, 10.0)
+            pd.testing.assert_frame_equal(dc_ref["Pannel"], dc["Pannel"])
+        self.assertEqual(self.cache.get_stats()["hits"], 2)
+        self.assertEqual(self.cache.get_stats()["misses"], 1)
+
+        # equal content in another frame object shares the entry
+        self.cache.get_cashflow_report(self.ledger.copy(), 2021, 10.0)
+        self.assertEqual(self.cache.get_stats()["hits"], 3)
+
+    def test_lru_and_invalidate(self):
+        """
+        The cache must evict the least recently used entry and honor
+        invalidation of in-place changes.
+        """
+        for category in [None, "Categoria 01", None, "Categoria 02"]:
+            self.cache.get_cashflow_analysis(self.ledger, category)
+        self.assertEqual(self.cache.get_stats()["size"], 2)
+        self.cache.get_cashflow_analysis(self.ledger, "Categoria 01")
+        self.assertEqual(self.cache.get_stats()["misses"], 4)
+
+        self.ledger.loc[0, "Valor"] = 1e6
+        self.cache.invalidate(self.ledger)
+        self.assertEqual(self.cache.get_stats()["size"], 0)
+        dc = self.cache.get_cashflow_analysis(self.ledger)
+        dc_ref = CashFlow.get_cashflow_analysis(self.ledger)
+        pd.testing.assert_frame_equal(dc_ref["yearly"], dc["yearly"])
+
+    def test_in_place_changes(self):
+        """
+        In-place changes must be seen without invalidation.
+        """
+        self.cache.get_cashflow_analysis(self.ledger)
+        self.ledger.loc[100, "Valor"] = 1e6
+        dc = self.cache.get_cashflow_analysis(self.ledger)
+        dc_ref = CashFlow.get_cashflow_analysis(self.ledger)
+        pd.testing.assert_frame_equal(dc_ref["yearly"], dc["yearly"])
+        self.assertEqual(self.cache.get_stats()["misses"], 2)
+
+    def test_maxsize_zero(self):
+        """
+        A zero-size cache must compute every call and keep nothing.
+        """
+        cache = CashFlowCache(maxsize=0)
+        for i in range(2):
+            dc = cache.get_cashflow_analysis(self.ledger)
+        dc_ref = CashFlow.get_cashflow_analysis(self.ledger)
+        pd.testing.assert_frame_equal(dc_ref["yearly"], dc["yearly"])
+        self.assertEqual(cache.get_stats()["size"], 0)
+        self.assertEqual(cache.get_stats()["misses"], 2)
+
+    def test_copies(self):
+        """
+        Mutating a returned frame must not change the cached result.
+        """
+        dc = self.cache.get_cashflow_analysis(self.ledger)
+        dc["monthly"]["Fluxo"] = 0.0
+        dc = self.cache.get_cashflow_analysis(self.ledger)
+        self.assertNotEqual(dc["monthly"]["Fluxo"].abs().sum(), 0.0)
+
+
 class TestCashFlowBBCC(unittest.TestCase):
 
+    # statement amounts keep their minus signs
+    unsigned = False
+
     # Setup methods
     # -------------------------------------------------------------------
 
@@ -154,6 +634,228 @@ class TestCashFlowBBCC(unittest.TestCase):
         print(self.cashflow.data)
         print(self.cashflow.data.info())
 
+    def test_parse_data_cents(self):
+        """
+        Cents mode must parse the same amounts as int64 cents.
+        """
+        self.cashflow.load_data(self.file_bbcc)
+        df = self.cashflow.parse_data()
+        cf_cents = type(self.cashflow)(cents=True)
+        cf_cents.load_data(self.file_bbcc)
+        df_cents = cf_cents.parse_data()
+        self.assertEqual(df_cents["Valor"].dtype, "int64")
+        pd.testing.assert_series_equal(df_cents["Valor"], to_cents(df["Valor"]))
+
+    def test_parse_valor(self):
+        """
+        Amount formats must parse the same from arrow and object strings.
+        """
+        ls_texts = [
+            "5.000,00",
+            "-403,00",
+            "5.000,00 C",
+            "403,00 D",
+            " 0,00 D ",
+            "1234.56",
+            "+7,10",
+            "1.234.567.890.123,45",
+            "1e5",
+            None,
+        ]
+        ls_expected = [
+            5000.0,
+            -403.0,
+            5000.0,
+            -403.0,
+            -0.0,
+            1234.56,
+            7.1,
+            1234567890123.45,
+            100000.0,
+            np.nan,
+        ]
+        if self.unsigned:
+            ls_expected[1] = 403.0
+        expected = pd.Series(ls_expected)
+        for dtype in ["str", object]:
+            series = pd.Series(ls_texts, dtype=dtype)
+            values = self.cashflow.parse_valor(series)
+            pd.testing.assert_series_equal(values, expected, check_exact=True)
+            self.assertTrue(np.signbit(values.iloc[4]))
+            cents = parse_amount_br(series.iloc[:-1], cents=True)
+            self.assertEqual(cents.dtype, "int64")
+            self.assertEqual(cents.iloc[3], -40300)
+        for text in ["- 5,00", "5,00 C C", "1,2,3", "abc"]:
+            with self.assertRaises(ValueError):
+                parse_amount_br(pd.Series([text]))
+
+        # dots as thousands separators only, as in CDB statements
+        series = pd.Series(["1.234", "7.5", "-1.234,5", "1e5"])
+        pd.testing.assert_series_equal(
+            parse_amount_br(series, decimal=","),
+            pd.Series([1234.0, 75.0, -1234.5, 100000.0]),
+        )
+        # sign from the ``D`` marker only
+        series = pd.Series(["-403,00", "-403,00 C", "403,00 D", "-1e2"])
+        pd.testing.assert_series_equal(
+            parse_amount_br(series, unsigned=True),
+            pd.Series([403.0, 403.0, -403.0, 100.0]),
+        )
+
+    def test_sniff_encoding(self):
+        """
+        Sniffed encodings must decode the statement and be kept for reuse.
+        """
+        with open(self.file_bbcc, encoding=sniff_encoding(self.file_bbcc)) as f:
+            text_t0 = f.read()
+        # one extra row with non-ASCII text and the header field count
+        n_sep = text_t0.splitlines()[0].count(",")
+        text = text_t0 + '"Transferência"' + ',""' * n_sep + "\n"
+        with tempfile.TemporaryDirectory() as tmp:
+            dc_files = {
+                "cp1252": text.encode("cp1252"),
+                "utf-8": text.encode("utf-8"),
+                "utf-8-sig": text.encode("utf-8-sig"),
+            }
+            for encoding, data in dc_files.items():
+                file_data = os.path.join(tmp, f"{encoding}.csv")
+                with open(file_data, "wb") as f:
+                    f.write(data)
+                self.assertEqual(sniff_encoding(file_data), encoding)
+                cashflow = type(self.cashflow)()
+                cashflow.load_data(file_data)
+                self.assertEqual(cashflow.file_data_encoding, encoding)
+                self.assertTrue(
+                    cashflow.data_raw.apply(
+                        lambda s: s.str.contains("Transferência")
+                    ).any(axis=None)
+                )
+            # the recorded encoding is reused for the next file
+            cashflow.load_data(os.path.join(tmp, "utf-8.csv"))
+            self.assertEqual(cashflow.file_data_encoding, "utf-8-sig")
+
+            # the fallback for undecodable bytes is kept to its own file
+            row = text_t0.splitlines()[2].replace('","', '","Pagamento € ', 1)
+            row = row + "\n"
+            n_pad = SNIFF_SIZE // len(row) + 1
+            data_bad = row.encode("cp1252").replace("€".encode("cp1252"), b"\x81")
+            dc_files = {
+                "bad.csv": (text_t0 + row * n_pad).encode("cp1252") + data_bad,
+                "good.csv": (text_t0 + row).encode("cp1252"),
+            }
+            for name, data in dc_files.items():
+                with open(os.path.join(tmp, name), "wb") as f:
+                    f.write(data)
+            cashflow = type(self.cashflow)()
+            for name in dc_files:
+                cashflow.load_data(os.path.join(tmp, name))
+                self.assertEqual(cashflow.file_data_encoding, "cp1252")
+                ls_chunks = list(cashflow.iter_data(os.path.join(tmp, name)))
+                self.assertEqual(cashflow.file_data_encoding, "cp1252")
+            self.assertTrue(
+                cashflow.data_raw.apply(lambda s: s.str.contains("€")).any(axis=None)
+            )
+            self.assertTrue(
+                pd.concat(ls_chunks)
+                .apply(lambda s: s.astype(str).str.contains("€"))
+                .any(axis=None)
+            )
+
+    def test_iter_data(self):
+        """
+        Streamed chunks must add up to the full parse and its T1 file.
+        """
+        self.cashflow.load_data(self.file_bbcc)
+        self.cashflow.standardize()
+        for chunksize in [1, 4, 1000]:
+            ls_chunks = list(
+                type(self.cashflow)().iter_data(self.file_bbcc, chunksize=chunksize)
+            )
+            pd.testing.assert_frame_equal(pd.concat(ls_chunks), self.cashflow.data)
+        with tempfile.TemporaryDirectory() as tmp:
+            file_full = os.path.join(tmp, "full.csv")
+            file_chunks = os.path.join(tmp, "chunks.csv")
+            write_table(self.cashflow.data, file_full)
+            n_rows = write_table_chunks(
+                self.cashflow.iter_data(self.file_bbcc, chunksize=4), file_chunks
+            )
+            self.assertEqual(n_rows, len(self.cashflow.data))
+            pd.testing.assert_frame_equal(
+                read_table(file_chunks), read_table(file_full)
+            )
+
+    def test_iter_data_fallback(self):
+        """
+        Streams resumed in the fallback encoding must not lose or repeat
+        rows, with quoted fields spanning several lines.
+        """
+        with open(self.file_bbcc, encoding=sniff_encoding(self.file_bbcc)) as f:
+            text_t0 = f.read()
+        row = text_t0.splitlines()[2]
+        row_multiline = row.replace('","', '","Linha 1\nLinha 2 ', 1) + "\n"
+        row_bad = row.replace('","', '","Pagamento € ', 1) + "\n"
+        # past the parser buffer, so chunks are yielded before the error
+        n_pad = 2**20 // len(row) + 1
+        text = text_t0 + row_multiline * 50 + (row + "\n") * n_pad
+        data = text.encode("cp1252") + row_bad.encode("cp1252").replace(
+            "€".encode("cp1252"), b"\x81"
+        )
+        with tempfile.TemporaryDirectory() as tmp:
+            file_data = os.path.join(tmp, "statement.csv")
+            with open(file_data, "wb") as f:
+                f.write(data)
+            cashflow = type(self.cashflow)()
+            cashflow.load_data(file_data)
+            cashflow.standardize()
+            ls_chunks = list(type(self.cashflow)().iter_data(file_data, chunksize=5000))
+        self.assertTrue(cashflow.data["Valor"].notna().all())
+        pd.testing.assert_frame_equal(pd.concat(ls_chunks), cashflow.data)
+
+    def test_concat_statements(self):
+        """
+        Overlapping statements are merged without losing repeated rows.
+        """
+        self.cashflow.load_data(self.file_bbcc)
+        self.cashflow.standardize()
+        df = self.cashflow.data
+        # a legitimately repeated transaction on the last day
+        df = pd.concat([df, df.iloc[[-1]]], ignore_index=True)
+        n = len(df)
+
+        # the same export downloaded twice, and two overlapping exports
+        for ls_dfs, n_dropped in [
+            ([df, df], n),
+            ([df.iloc[: n - 2], df.iloc[n // 2 :]], n - 2 - n // 2),
+        ]:
+            df_full, df_dropped = concat_statements(ls_dfs)
+            pd.testing.assert_frame_equal(df_full, df)
+            self.assertEqual(len(df_dropped), n_dropped)
+
+        # the repeated row found once in the first file is kept twice
+        df_full, df_dropped = concat_statements([df.iloc[:-1], df.iloc[-2:]])
+        pd.testing.assert_frame_equal(df_full, df)
+        self.assertEqual(len(df_dropped), 1)
+
+    def test_parse_date(self):
+        """
+        Unique-value date parsing must match a full ``to_datetime`` call.
+        """
+        series = pd.Series(
+            ["01/11/2025", "03/11/2025", None, "01/11/2025"] * 50,
+            dtype="str",
+            name="Data",
+        )
+        expected = pd.to_datetime(series, format="%d/%m/%Y")
+        # second call is served by the converter cache
+        for i in range(2):
+            pd.testing.assert_series_equal(self.cashflow.parse_date(series), expected)
+        days = series.str[:5]
+        pd.testing.assert_series_equal(
+            parse_dates(days, fmt="%d/%m/%Y", suffix="/2025"), expected
+        )
+        with self.assertRaises(ValueError):
+            parse_dates(pd.Series(["32/11/2025"]), fmt="%d/%m/%Y")
+
     # Tear down methods
     # -------------------------------------------------------------------
     def tearDown(self):
@@ -174,6 +876,9 @@ class TestCashFlowBBCC(unittest.TestCase):
 
 class TestCashFlowBBCCPJ(TestCashFlowBBCC):
 
+    # only the ``D`` marker makes an amount negative
+    unsigned = True
+
     # Setup methods
     # -------------------------------------------------------------------
 
@@ -200,6 +905,9 @@ class TestCashFlowBBCCPJ(TestCashFlowBBCC):
 
 class TestCashFlowBBPP(TestCashFlowBBCC):
 
+    # only the ``D`` marker makes an amount negative
+    unsigned = True
+
     # Setup methods
     # -------------------------------------------------------------------
 
@@ -224,6 +932,122 @@ class TestCashFlowBBPP(TestCashFlowBBCC):
         return None
 
 
+class TestBBCDB(unittest.TestCase):
+
+    # Setup methods
+    # -------------------------------------------------------------------
+
+    def setUp(self):
+        """
+        Runs before each test method.
+        """
+        self.tmp = tempfile.TemporaryDirectory()
+        self.file_cdb = os.path.join(self.tmp.name, "EXTRATO_BB_CDB_2024_T0.txt")
+        return None
+
+    def write_statement(self, **kwargs):
+        with open(self.file_cdb, "w", encoding="cp1252") as f:
+            f.writelines(make_cdb_statement(**kwargs))
+        return None
+
+    # Testing methods
+    # -------------------------------------------------------------------
+
+    def test_engines(self):
+        """
+        The single-pass tokenizer must match the legacy splitting.
+        """
+        self.write_statement(deposits=6)
+        cdb_loop = BBCDB()
+        cdb_loop.load_data(self.file_cdb, engine="loop")
+        cdb = BBCDB()
+        cdb.load_data(self.file_cdb)
+        self.assertEqual(list(cdb.data), ["CDBDI", "CDBPG"])
+        for account, dc_sections in cdb_loop.data.items():
+            self.assertEqual(list(cdb.data[account]), list(dc_sections))
+            for section, df in dc_sections.items():
+                pd.testing.assert_frame_equal(cdb.data[account][section], df)
+
+    def test_tokenize_batches(self):
+        """
+        Streamed lines must tokenize the same in any batch size.
+        """
+        self.write_statement(years=2, deposits=5)
+        ls_lines = list(BBCDB.iter_lines(self.file_cdb))
+        ls_blocks = BBCDB.tokenize(ls_lines)
+        self.assertTrue(all(block["year"] is not None for block in ls_blocks))
+        for batchsize in [1, 2, 7]:
+            self.assertEqual(
+                BBCDB.tokenize(BBCDB.iter_lines(self.file_cdb), batchsize=batchsize),
+                ls_blocks,
+            )
+
+    def test_concatenated_statements(self):
+        """
+        Multi-year exports stack per account, with open product names.
+        """
+        self.write_statement(years=3, products=("DI", "PRE FIXADO"), deposits=4)
+        cdb = BBCDB()
+        cdb.load_data(self.file_cdb)
+        self.assertEqual(list(cdb.data), ["CDBDI", "CDBPREFIXADO"])
+        for dc_sections in cdb.data.values():
+            self.assertEqual(len(dc_sections["EXTRATO"]), 3 * 2 * 4)
+            self.assertEqual(len(dc_sections["DEPOSITOS"]), 3 * 4)
+            self.assertEqual(
+                dc_sections["RENDIMENTOS"]["Data"].dt.year.unique().tolist(),
+                [2024, 2025, 2026],
+            )
+
+    def test_iter_lines(self):
+        """
+        The mapped reader matches the list-based cleaning steps.
+        """
+        self.write_statement(years=2, deposits=3)
+        with open(self.file_cdb, "ab") as f:
+            f.write(b"x\xa0y\r\n \xa0 \r\n--\rlast \xe9")
+
+        ls_data = BBCDB.read_txt(self.file_cdb)
+        ls_data = BBCDB.drop_lines(ls_data, contains="--")
+        ls_data = BBCDB.drop_lines(ls_data, contains="==")
+        ls_data = BBCDB.drop_blank_lines(ls_data)
+        ls_data = BBCDB.replace_lines(ls_data)
+        ls_data = BBCDB.replace_lines(ls_data, "\n", "")
+        for blocksize in [1, 100, 2**20]:
+            self.assertEqual(
+                list(BBCDB.iter_lines(self.file_cdb, blocksize=blocksize)), ls_data
+            )
+        self.assertEqual(ls_data[-2:], ["x y", "last é"])
+
+        open(self.file_cdb, "w").close()
+        self.assertEqual(list(BBCDB.iter_lines(self.file_cdb)), [])
+
+    def test_get_frame(self):
+        """
+        Direct frames read rows as ``pandas.read_csv`` would.
+        """
+        df = BBCDB.get_frame(["Data Deposito Valor", "01/02 123 1,00", "02/02 456"])
+        self.assertEqual(list(df.columns), ["Data", "Deposito", "Valor"])
+        self.assertEqual(df["Deposito"].tolist(), ["123", "456"])
+        self.assertTrue(pd.isna(df.loc[1, "Valor"]))
+
+        # blank lines are skipped, header-only sections give empty frames
+        df = BBCDB.get_frame(["Data Valor", "01/02 1,00", "  ", "02/02 2,00"])
+        self.assertEqual(df["Valor"].tolist(), ["1,00", "2,00"])
+        self.assertEqual(len(BBCDB.get_frame(["Data Valor"])), 0)
+
+        with self.assertRaises(pd.errors.ParserError):
+            BBCDB.get_frame(["Data Valor", "01/02 1,00 extra"])
+
+    # Tear down methods
+    # -------------------------------------------------------------------
+    def tearDown(self):
+        """
+        Runs after each test method.
+        """
+        self.tmp.cleanup()
+        return None
+
+
 # ... {develop}
 
 # CLASSES -- Module-level
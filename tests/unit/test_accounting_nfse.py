@@ -43,19 +43,25 @@ From the terminal, run:
 # Native imports
 # =======================================================================
 # import {module}
+import os
+import copy
+import shutil
+import tempfile
 import unittest
+import xml.etree.ElementTree as ET
 
 # ... {develop}
 
 # External imports
 # =======================================================================
-# import {module}
+import pandas as pd
+
 # ... {develop}
 
 # Project-level imports
 # =======================================================================
-from babilonia.accounting import NFSe
-from tests.conftest import DATA_DIR
+from babilonia.accounting import NFSe, NFSeColl, NFSeCache, NFSE_NAMESPACES
+from tests.conftest import DATA_DIR, make_nfse_notes, make_nfse_batch
 from tests.conftest import testprint
 
 # ... {develop}
@@ -138,6 +144,64 @@ class TestNFSe(unittest.TestCase):
         print(self.nfse)
         print("-------------------")
 
+    def test_engines(self):
+        """
+        The single-walk extractor must match the descendant searches.
+        """
+        for file in sorted(DATA_DIR.glob("NFSe_*.xml")):
+            root = ET.parse(file).getroot()
+            nfse_data = self.nfse.extract_data(root, engine="finds")
+            self.assertEqual(self.nfse.extract_data(root), nfse_data)
+            # from the infNFSe element, as given by streaming readers
+            element = root.find("default:infNFSe", NFSE_NAMESPACES)
+            self.assertEqual(self.nfse.extract_data(element), nfse_data)
+
+        # optional tomador fields are None, missing required fields raise
+        toma = root.find(".//default:toma", NFSE_NAMESPACES)
+        toma.remove(toma.find("default:end", NFSE_NAMESPACES))
+        nfse_data = self.nfse.extract_data(root)
+        self.assertEqual(nfse_data, self.nfse.extract_data(root, engine="finds"))
+        self.assertEqual(set(nfse_data["Tomador"]["endereco"].values()), {None})
+        toma.remove(toma.find("default:xNome", NFSE_NAMESPACES))
+        with self.assertRaises(ValueError):
+            self.nfse.extract_data(root)
+
+    def test_engines_repeated_parent(self):
+        """
+        Repeated parents must resolve to the first one, as the finds do.
+        """
+        root = ET.parse(self.file).getroot()
+        element = root.find("default:infNFSe", NFSE_NAMESPACES)
+        emit = element.find("default:emit", NFSE_NAMESPACES)
+        emit_copy = copy.deepcopy(emit)
+        for node in emit_copy.iter():
+            if node.text is not None and node.text.strip():
+                node.text = "X" + node.text
+        element.insert(list(element).index(emit) + 1, emit_copy)
+
+        nfse_data = self.nfse.extract_data(root)
+        self.assertEqual(nfse_data, self.nfse.extract_data(root, engine="finds"))
+        cnpj = emit.find("default:CNPJ", NFSE_NAMESPACES).text
+        self.assertEqual(nfse_data[self.nfse.emitter_field]["cnpj"], cnpj)
+
+    def test_iter_data(self):
+        """
+        Streamed batch records must match notes extracted one by one.
+        """
+        ls_notes = make_nfse_notes(size=9)
+        with tempfile.TemporaryDirectory() as tmp:
+            file_batch = os.path.join(tmp, "LOTE.xml")
+            with open(file_batch, "wb") as f:
+                f.write(make_nfse_batch(size=9))
+            self.assertEqual(
+                list(self.nfse.iter_data(file_batch)),
+                [self.nfse.extract_data(ET.fromstring(xml)) for xml in ls_notes],
+            )
+
+        # single-note files give one record
+        self.nfse.load_data(self.file)
+        self.assertEqual(list(self.nfse.iter_data(self.file)), [self.nfse.data])
+
     # Tear down methods
     # -------------------------------------------------------------------
     def tearDown(self):
@@ -156,6 +220,163 @@ class TestNFSe(unittest.TestCase):
         return None
 
 
+class TestNFSeColl(unittest.TestCase):
+
+    # Setup methods
+    # -------------------------------------------------------------------
+
+    def setUp(self):
+        """
+        Runs before each test method.
+        """
+        self.tmp = tempfile.TemporaryDirectory()
+        self.file_batch = os.path.join(self.tmp.name, "LOTE.xml")
+        with open(self.file_batch, "wb") as f:
+            f.write(make_nfse_batch(size=6))
+        return None
+
+    # Testing methods
+    # -------------------------------------------------------------------
+
+    def test_load_batch(self):
+        """
+        A batch file loads one collection item per note.
+        """
+        coll = NFSeColl(cents=True)
+        coll.load_batch(self.file_batch)
+        self.assertEqual(coll.size, 6)
+        self.assertEqual(
+            list(coll.catalog["name"]),
+            sorted(f"NFSe_NFS{i:050d}" for i in range(6)),
+        )
+        for nfe in coll.collection.values():
+            self.assertEqual(nfe.file_data, self.file_batch)
+            self.assertIsInstance(nfe.service_value, int)
+
+    def test_extend(self):
+        """
+        Bulk loading gives the catalog of item-by-item appends, uncopied.
+        """
+        ls_nfse = []
+        for nfse_data in NFSe().iter_data(self.file_batch):
+            nfe_id = "NFSe_" + nfse_data["nfse_id"]
+            nfe = NFSe(name=nfe_id, alias=nfe_id)
+            nfe.set_data(nfse_data, file_data=self.file_batch)
+            ls_nfse.append(nfe)
+
+        coll = NFSeColl()
+        for nfe in ls_nfse:
+            coll.append(nfe)
+        coll_bulk = NFSeColl()
+        coll_bulk.extend(ls_nfse[:4])
+        # repeated names keep the last object, as in append
+        coll_bulk.extend(ls_nfse[2:])
+        pd.testing.assert_frame_equal(coll_bulk.catalog, coll.catalog)
+        self.assertEqual(coll_bulk.size, 6)
+        for nfe in ls_nfse:
+            self.assertIs(coll_bulk.collection[nfe.name], nfe)
+            self.assertIsNot(coll.collection[nfe.name], nfe)
+
+    def test_load_files_workers(self):
+        """
+        Pooled loading matches serial loading and collects file errors.
+        """
+        for file in sorted(DATA_DIR.glob("NFSe_*.xml")):
+            shutil.copy(file, self.tmp.name)
+        coll = NFSeColl()
+        coll.load_folder(self.tmp.name)
+
+        file_bad = os.path.join(self.tmp.name, "NFSe_bad.xml")
+        with open(file_bad, "w") as f:
+            f.write("<NFSe>")
+        coll_pool = NFSeColl()
+        coll_pool.load_folder(self.tmp.name, workers=2, chunksize=2)
+        self.assertEqual(list(coll_pool.errors), [file_bad])
+        pd.testing.assert_frame_equal(coll_pool.catalog, coll.catalog)
+        for name, nfe in coll.collection.items():
+            self.assertEqual(coll_pool.collection[name].data, nfe.data)
+
+    # Tear down methods
+    # -------------------------------------------------------------------
+    def tearDown(self):
+        """
+        Runs after each test method.
+        """
+        self.tmp.cleanup()
+        return None
+
+
+class TestNFSeCache(unittest.TestCase):
+
+    # Setup methods
+    # -------------------------------------------------------------------
+
+    def setUp(self):
+        """
+        Runs before each test method.
+        """
+        self.tmp = tempfile.TemporaryDirectory()
+        self.folder = os.path.join(self.tmp.name, "nfse")
+        os.makedirs(self.folder)
+        for file in sorted(DATA_DIR.glob("NFSe_*.xml")):
+            shutil.copy(file, self.folder)
+        self.cache = NFSeCache(file_cache=os.path.join(self.tmp.name, "cache.db"))
+        return None
+
+    def load(self, **kwargs):
+        coll = NFSeColl(**kwargs)
+        coll.load_folder(self.folder, cache=self.cache)
+        return coll
+
+    # Testing methods
+    # -------------------------------------------------------------------
+
+    def test_hits_and_misses(self):
+        """
+        Unchanged files are hydrated, new or changed ones are parsed.
+        """
+        coll = self.load()
+        self.assertEqual(self.cache.get_stats(), {"hits": 0, "misses": 4, "size": 4})
+        coll_cached = self.load()
+        self.assertEqual(self.cache.hits, 4)
+        pd.testing.assert_frame_equal(coll_cached.catalog, coll.catalog)
+        for name, nfe in coll.collection.items():
+            self.assertEqual(coll_cached.collection[name].data, nfe.data)
+            self.assertEqual(coll_cached.collection[name].file_data, nfe.file_data)
+
+        # touched files are checked by content hash
+        file_nfse = os.path.join(self.folder, "NFSe_001.xml")
+        os.utime(file_nfse, ns=(0, 0))
+        self.load()
+        self.assertEqual(self.cache.hits, 8)
+
+        # rewritten files, other cents flags and older extractors are parsed
+        with open(file_nfse, "rb") as f:
+            xml = f.read()
+        with open(file_nfse, "wb") as f:
+            f.write(xml.replace(b"<vServ>3666.00<", b"<vServ>3667.00<"))
+        coll = self.load()
+        self.assertEqual(coll.collection["NFSe_NFSe_001"].service_value, 3667.0)
+        self.assertEqual(self.cache.misses, 5)
+        coll = self.load(cents=True)
+        self.assertEqual(coll.collection["NFSe_NFSe_001"].service_value, 366700)
+        self.assertEqual(self.cache.misses, 9)
+        self.cache.connection.execute("UPDATE nfse SET version = '0'")
+        self.load()
+        self.assertEqual(self.cache.misses, 13)
+        self.assertEqual(self.cache.get_stats()["size"], 8)
+
+    # Tear down methods
+    # -------------------------------------------------------------------
+    def tearDown(self):
+        """
+        Runs after each test method.
+        """
+        self.cache.close()
+        self.tmp.cleanup()
+        return None
+
+
 # ... {develop}
 
 # CLASSES -- Module-level
@@ -0,0 +1,315 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# Copyright (C) 2025 The Project Authors
+# See pyproject.toml for authors/maintainers.
+# See LICENSE for license details.
+"""
+Unit tests for the statement parsing script and its manifest helpers.
+
+Features
+--------
+
+ - Parse status of T0 files from their manifest records
+ - Manifest round-trip of ``babilonia.tools.parse`` over a temporary folder
+
+From the terminal, run:
+
+.. code-block:: bash
+
+    python ./tests/unit/test_tools_parse.py
+
+
+"""
+
+# ***********************************************************************
+# IMPORTS
+# ***********************************************************************
+# import modules from other libs
+
+# Native imports
+# =======================================================================
+# import {module}
+import io
+import os
+import shutil
+import tempfile
+import unittest
+import contextlib
+from pathlib import Path
+from unittest import mock
+
+# ... {develop}
+
+# External imports
+# =======================================================================
+# import {module}
+# ... {develop}
+
+# Project-level imports
+# =======================================================================
+from babilonia.tools import parse
+from babilonia.tools.core import get_file_manifest, get_file_record
+from babilonia.tools.core import get_parse_status, load_manifest
+from tests.conftest import DATA_DIR
+
+# ... {develop}
+
+
+# ***********************************************************************
+# CONSTANTS
+# ***********************************************************************
+# define constants in uppercase
+
+# CONSTANTS -- Project-level
+# =======================================================================
+# ... {develop}
+
+# CONSTANTS -- Module-level
+# =======================================================================
+DATA_TYPE = "bb-cc"
+# ... {develop}
+
+
+# ***********************************************************************
+# FUNCTIONS
+# ***********************************************************************
+
+# FUNCTIONS -- Project-level
+# =======================================================================
+# ... {develop}
+
+# FUNCTIONS -- Module-level
+# =======================================================================
+
+
+def run_parse(folder, *args):
+    """
+    Run the parsing script over a folder and get the status of each file.
+
+    :param folder: account folder
+    :type folder: str or Path
+    :param args: extra command line arguments
+    :type args: str
+    :return: T0 file name to its status
+    :rtype: dict
+    """
+    argv = ["parse.py", "--folder", str(folder), "--type", DATA_TYPE, *args]
+    stdout = io.StringIO()
+    with mock.patch("sys.argv", argv), contextlib.redirect_stdout(stdout):
+        parse.main()
+    dc_status = {}
+    for line in stdout.getvalue().splitlines():
+        if " -> " in line:
+            ls_words = line.split()
+            dc_status[ls_words[1]] = ls_words[-1]
+    return dc_status
+
+
+# ***********************************************************************
+# CLASSES
+# ***********************************************************************
+
+# CLASSES -- Project-level
+# =======================================================================
+
+
+class TestParseStatus(unittest.TestCase):
+
+    # Setup methods
+    # -------------------------------------------------------------------
+
+    def setUp(self):
+        """
+        Runs before each test method.
+        """
+        self.tmp = tempfile.TemporaryDirectory()
+        self.file_out = Path(self.tmp.name) / "EXTRATO_T1.csv"
+        self.record = {"sha256": "a", "version": "1", "output": self.file_out.name}
+        # ... {develop}
+        return None
+
+    # Testing methods
+    # -------------------------------------------------------------------
+
+    def test_get_parse_status(self):
+        """
+        Status follows the output file, the content hash and the version.
+        """
+        # no output yet
+        self.assertEqual(get_parse_status(self.record, None, self.file_out), "PARSED")
+        self.assertEqual(
+            get_parse_status(self.record, dict(self.record), self.file_out), "PARSED"
+        )
+
+        self.file_out.write_text("")
+        # output with no manifest record
+        self.assertEqual(get_parse_status(self.record, None, self.file_out), "UPDATED")
+        self.assertEqual(
+            get_parse_status(self.record, dict(self.record), self.file_out), "SKIPPED"
+        )
+        for key in ["sha256", "version", "output"]:
+            record_old = dict(self.record, **{key: "other"})
+            self.assertEqual(
+                get_parse_status(self.record, record_old, self.file_out), "UPDATED"
+            )
+
+    def test_get_file_record(self):
+        """
+        Content hashes are reused only while size and mtime are unchanged.
+        """
+        file_data = Path(self.tmp.name) / "EXTRATO_T0.csv"
+        file_data.write_text("a;b\n")
+        record = get_file_record(file_data)
+        self.assertEqual(get_file_record(file_data, record), record)
+
+        # a stale hash is kept for unchanged size and mtime
+        record_old = dict(record, sha256="stale")
+        self.assertEqual(get_file_record(file_data, record_old)["sha256"], "stale")
+
+        os.utime(file_data, ns=(0, record["mtime_ns"] + 10**9))
+        record_new = get_file_record(file_data, record_old)
+        self.assertEqual(record_new["sha256"], record["sha256"])
+
+    # Tear down methods
+    # -------------------------------------------------------------------
+    def tearDown(self):
+        """
+        Runs after each test method.
+        """
+        self.tmp.cleanup()
+        return None
+
+
+class TestParseManifest(unittest.TestCase):
+
+    # Setup methods
+    # -------------------------------------------------------------------
+
+    def setUp(self):
+        """
+        Runs before each test method.
+        """
+        self.tmp = tempfile.TemporaryDirectory()
+        self.folder = Path(self.tmp.name)
+        self.ls_files = self.make_statements(self.folder)
+        # ... {develop}
+        return None
+
+    @staticmethod
+    def make_statements(folder):
+        """
+        Copy the test statement into two months of an account folder.
+        """
+        (folder / "2025").mkdir()
+        ls_files = []
+        for month in ["11", "12"]:
+            file_data = folder / "2025" / f"EXTRATO_BB_CC_2025-{month}_T0.csv"
+            shutil.copy(DATA_DIR / "EXTRATO_BB_CC_2025-11_T0.csv", file_data)
+            ls_files.append(file_data)
+        return ls_files
+
+    # Testing methods
+    # -------------------------------------------------------------------
+
+    def test_manifest_round_trip(self):
+        """
+        Tracked files are skipped, changed files and untracked outputs
+        are parsed again.
+        """
+        ls_names = [f.name for f in self.ls_files]
+        file_manifest = get_file_manifest(DATA_TYPE, self.folder)
+
+        dc_status = run_parse(self.folder)
+        self.assertEqual(dc_status, dict.fromkeys(ls_names, "PARSED"))
+        manifest = load_manifest(file_manifest)
+        self.assertEqual(manifest["type"], DATA_TYPE)
+        self.assertEqual(
+            sorted(manifest["files"]), [f"2025/{name}" for name in ls_names]
+        )
+        for record in manifest["files"].values():
+            self.assertEqual(
+                set(record), {"size", "mtime_ns", "sha256", "version", "output"}
+            )
+
+        # unchanged files
+        dc_status = run_parse(self.folder)
+        self.assertEqual(dc_status, dict.fromkeys(ls_names, "SKIPPED"))
+        self.assertEqual(load_manifest(file_manifest), manifest)
+
+        # changed content of one file
+        data = self.ls_files[1].read_bytes()
+        self.ls_files[1].write_bytes(data.replace(b"-260,00", b"-261,00"))
+        dc_status = run_parse(self.folder)
+        self.assertEqual(dc_status, {ls_names[0]: "SKIPPED", ls_names[1]: "UPDATED"})
+        file_out = self.ls_files[1].with_name(ls_names[1].replace("T0", "T1"))
+        self.assertIn("-261.0", file_out.read_text())
+
+        # outputs with no manifest record
+        os.remove(file_manifest)
+        dc_status = run_parse(self.folder)
+        self.assertEqual(dc_status, dict.fromkeys(ls_names, "UPDATED"))
+        self.assertEqual(
+            sorted(load_manifest(file_manifest)["files"]),
+            sorted(manifest["files"]),
+        )
+
+    def test_workers(self):
+        """
+        Parallel runs must write the same outputs and records as serial runs.
+        """
+        folder_serial = self.folder / "serial"
+        folder_serial.mkdir()
+        self.make_statements(folder_serial)
+        dc_serial = run_parse(folder_serial, "--workers", "1")
+
+        folder_parallel = self.folder / "parallel"
+        folder_parallel.mkdir()
+        self.make_statements(folder_parallel)
+        dc_parallel = run_parse(folder_parallel, "--workers", "2")
+        self.assertEqual(dc_parallel, dc_serial)
+
+        for file_t1 in sorted((folder_serial / "2025").glob("*_T1.csv")):
+            file_parallel = folder_parallel / "2025" / file_t1.name
+            self.assertEqual(file_parallel.read_bytes(), file_t1.read_bytes())
+
+        ls_keys = ["size", "sha256", "version", "output"]
+        ls_records = []
+        for folder in [folder_serial, folder_parallel]:
+            manifest = load_manifest(get_file_manifest(DATA_TYPE, folder))
+            ls_records.append(
+                {
+                    name: {key: record[key] for key in ls_keys}
+                    for name, record in manifest["files"].items()
+                }
+            )
+        self.assertEqual(len(ls_records[0]), 2)
+        self.assertEqual(ls_records[0], ls_records[1])
+
+    # Tear down methods
+    # -------------------------------------------------------------------
+    def tearDown(self):
+        """
+        Runs after each test method.
+        """
+        self.tmp.cleanup()
+        return None
+
+
+# ... {develop}
+
+# CLASSES -- Module-level
+# =======================================================================
+# ... {develop}
+
+
+# ***********************************************************************
+# SCRIPT
+# ***********************************************************************
+# standalone behaviour as a script
+if __name__ == "__main__":
+
+    # Call all tests in the module
+    # ===================================================================
+    unittest.main()
+
+    # ... {develop}